@@ -8,7 +8,6 @@ hardcoded dictionary for loanwords where Italian pronunciation
 differs from orthographic expectations.
 """
 
-import re
 from functools import lru_cache
 from typing import Literal
 
@@ -82,24 +81,31 @@ EXCEPTIONS: dict[str, tuple[Pattern | Literal["gli"], str]] = {
 }
 
 
-# "Lo" trigger patterns:
-# z-, s+consonant, gn-, ps-, pn-, x-, y-, i+vowel (semiconsonant)
-_LO_TRIGGERS = re.compile(
-    r"^("
-    r"[zZ]|"  # z-
-    r"[sS][bcdfgklmnpqrstvwxzBCDFGKLMNPQRSTVWXZ]|"  # s + consonant
-    r"[gG][nN]|"  # gn-
-    r"[pP][sSnN]|"  # ps-, pn-
-    r"[xX]|"  # x-
-    r"[yY]|"  # y-
-    r"[iI][aeiouàèéìòóùAEIOUÀÈÉÌÒÓÙ]"  # i + vowel (semiconsonant)
-    r")"
-)
-
-# Vowel-initial pattern (including accented vowels)
-_VOWELS = re.compile(r"^[aeiouàèéìòóùAEIOUÀÈÉÌÒÓÙ]")
+# Vowels (including accented) in both cases
+_VOWEL_CHARS = frozenset("aeiouàèéìòóùAEIOUÀÈÉÌÒÓÙ")
+
+# "Lo" triggers: z-, s+consonant, gn-, ps-, pn-, x-, y-, i+vowel (semiconsonant).
+# Initials that trigger "lo" on their own:
+_LO_INITIALS = frozenset("zZxXyY")
+
+# Initials that trigger "lo" only when followed by one of the given characters
+_S_CONSONANTS = frozenset("bcdfgklmnpqrstvwxzBCDFGKLMNPQRSTVWXZ")
+_LO_SECOND_CHARS: dict[str, frozenset[str]] = {
+    "s": _S_CONSONANTS,  # s + consonant
+    "S": _S_CONSONANTS,
+    "g": frozenset("nN"),  # gn-
+    "G": frozenset("nN"),
+    "p": frozenset("sSnN"),  # ps-, pn-
+    "P": frozenset("sSnN"),
+    "i": _VOWEL_CHARS,  # i + vowel (semiconsonant)
+    "I": _VOWEL_CHARS,
+}
+_NO_SECOND_CHARS: frozenset[str] = frozenset()
 
 
+# get_definite() is cached per (word, gender, number); caching here as well means
+# each word is classified once rather than once per gender/number combination
+@lru_cache(maxsize=20000)
 def _get_pattern(word: str) -> tuple[Pattern | Literal["gli"], str]:
     """
     Determine the orthographic pattern for article selection.
@@ -114,12 +120,13 @@ def _get_pattern(word: str) -> tuple[Pattern | Literal["gli"], str]:
     if word_lower in EXCEPTIONS:
         return EXCEPTIONS[word_lower]
 
-    # Check for "lo" triggers
-    if _LO_TRIGGERS.match(word):
+    # Check for "lo" triggers (first one or two characters, as written)
+    first = word[:1]
+    if first in _LO_INITIALS or word[1:2] in _LO_SECOND_CHARS.get(first, _NO_SECOND_CHARS):
         return ("lo", "inferred")
 
     # Check for vowel start (but i+vowel is a lo-trigger, handled above)
-    if _VOWELS.match(word):
+    if first in _VOWEL_CHARS:
         return ("vowel", "inferred")
 
     # Default: consonant
@@ -142,33 +149,7 @@ def get_definite(word: str, gender: Gender, number: Number) -> tuple[str, str]:
         - source: 'inferred' or 'exception:<reason>'
     """
     pattern, source = _get_pattern(word)
-
-    # Historical exception for "gli dèi"
-    if pattern == "gli":
-        return ("gli", source)
-
-    # Feminine plural: always "le"
-    if gender == "f" and number == "plural":
-        return ("le", source)
-
-    # Feminine singular
-    if gender == "f" and number == "singular":
-        if pattern == "vowel":
-            return ("l'", source)
-        return ("la", source)
-
-    # Masculine plural
-    if gender == "m" and number == "plural":
-        if pattern in ("vowel", "lo"):
-            return ("gli", source)
-        return ("i", source)
-
-    # Masculine singular
-    if pattern == "vowel":
-        return ("l'", source)
-    if pattern == "lo":
-        return ("lo", source)
-    return ("il", source)
+    return (_ARTICLE_TABLE[(pattern, gender, number)][0], source)
 
 
 def derive_indefinite(definite_article: str, gender: Gender) -> str | None:
@@ -222,6 +203,59 @@ def derive_partitive(definite_article: str) -> str:
     return mapping[definite_article]
 
 
+def _definite_for_pattern(pattern: Pattern | Literal["gli"], gender: Gender, number: Number) -> str:
+    """Select the definite article for an orthographic pattern."""
+    # Historical exception for "gli dèi"
+    if pattern == "gli":
+        return "gli"
+
+    # Feminine plural: always "le"
+    if gender == "f" and number == "plural":
+        return "le"
+
+    # Feminine singular
+    if gender == "f" and number == "singular":
+        if pattern == "vowel":
+            return "l'"
+        return "la"
+
+    # Masculine plural
+    if gender == "m" and number == "plural":
+        if pattern in ("vowel", "lo"):
+            return "gli"
+        return "i"
+
+    # Masculine singular
+    if pattern == "vowel":
+        return "l'"
+    if pattern == "lo":
+        return "lo"
+    return "il"
+
+
+def _build_article_table() -> dict[tuple[str, str, str], tuple[str, str | None, str]]:
+    """Precompute (definite, indefinite, partitive) for every pattern/gender/number."""
+    table: dict[tuple[str, str, str], tuple[str, str | None, str]] = {}
+    patterns: tuple[Pattern | Literal["gli"], ...] = ("vowel", "lo", "consonant", "gli")
+    genders: tuple[Gender, ...] = ("m", "f")
+    numbers: tuple[Number, ...] = ("singular", "plural")
+    for pattern in patterns:
+        for gender in genders:
+            for number in numbers:
+                definite = _definite_for_pattern(pattern, gender, number)
+                table[(pattern, gender, number)] = (
+                    definite,
+                    derive_indefinite(definite, gender),
+                    derive_partitive(definite),
+                )
+    return table
+
+
+# (pattern, gender, number) -> (definite, indefinite, partitive), so article
+# selection is one dict lookup once the word's pattern is known
+_ARTICLE_TABLE = _build_article_table()
+
+
 class ArticleSelector:
     """
     Convenience class for article selection.
@@ -237,33 +271,22 @@ class ArticleSelector:
         Args:
             extra_exceptions: Additional word -> (pattern, source) mappings
         """
-        self.extra_exceptions = extra_exceptions or {}
+        # Keys are normalized once here, the same way lookups normalize the word
+        self.extra_exceptions = {
+            word.lower().strip(): value for word, value in (extra_exceptions or {}).items()
+        }
+
+    def _get_pattern(self, word: str) -> tuple[Pattern | Literal["gli"], str]:
+        """Return (pattern, source), checking extra exceptions first."""
+        extra = self.extra_exceptions.get(word.lower().strip())
+        if extra is not None:
+            return extra
+        return _get_pattern(word)
 
     def get_definite(self, word: str, gender: Gender, number: Number) -> tuple[str, str]:
         """Get the definite article. See module-level get_definite for details."""
-        # Check extra exceptions first
-        word_lower = word.lower().strip()
-        if word_lower in self.extra_exceptions:
-            pattern, source = self.extra_exceptions[word_lower]
-            # Re-derive the article from the pattern
-            if pattern == "vowel":
-                if gender == "f" and number == "plural":
-                    return ("le", source)
-                if gender == "f" and number == "singular":
-                    return ("l'", source)
-                if gender == "m" and number == "plural":
-                    return ("gli", source)
-                return ("l'", source)
-            if pattern == "lo":
-                if gender == "f":
-                    return ("la" if number == "singular" else "le", source)
-                return ("lo" if number == "singular" else "gli", source)
-            # consonant
-            if gender == "f":
-                return ("la" if number == "singular" else "le", source)
-            return ("il" if number == "singular" else "i", source)
-
-        return get_definite(word, gender, number)
+        pattern, source = self._get_pattern(word)
+        return (_ARTICLE_TABLE[(pattern, gender, number)][0], source)
 
     def get_indefinite(self, word: str, gender: Gender) -> tuple[str | None, str]:
         """
@@ -277,9 +300,8 @@ class ArticleSelector:
             Tuple of (article, source). Article is None for words that
             only have plural forms.
         """
-        def_art, source = self.get_definite(word, gender, "singular")
-        indef = derive_indefinite(def_art, gender)
-        return (indef, source)
+        pattern, source = self._get_pattern(word)
+        return (_ARTICLE_TABLE[(pattern, gender, "singular")][1], source)
 
     def get_partitive(self, word: str, gender: Gender, number: Number) -> tuple[str, str]:
         """
@@ -293,6 +315,5 @@ class ArticleSelector:
         Returns:
             Tuple of (article, source)
         """
-        def_art, source = self.get_definite(word, gender, number)
-        part = derive_partitive(def_art)
-        return (part, source)
+        pattern, source = self._get_pattern(word)
+        return (_ARTICLE_TABLE[(pattern, gender, number)][2], source)
@@ -18,35 +18,7 @@ from italian_db.db import (
     sentences,
     verb_forms,
 )
-from italian_db.download import (
-    download_all,
-    download_itwac,
-    download_morphit,
-    download_tatoeba,
-    download_wiktextract,
-)
 from italian_db.enums import POS
-from italian_db.importers import (
-    import_itwac,
-    import_morphit,
-    import_tatoeba,
-    import_verb_irregularity,
-    import_wiktextract,
-)
-from italian_db.importers.itwac import ITWAC_CSV_FILES
-from italian_db.importers.morphit import (
-    apply_orthography_fallback,
-    apply_unstressed_fallback,
-    enrich_lemma_written,
-)
-from italian_db.importers.wiktextract import (
-    enrich_from_form_of_entries,
-    enrich_missing_feminine_plurals,
-    generate_gendered_participles,
-    import_adjective_allomorphs,
-    import_noun_allomorphs,
-)
-from italian_db.verify import verify_database
 
 DEFAULT_WIKTEXTRACT_PATH = Path("data/wiktextract/kaikki.org-dictionary-Italian.jsonl")
 DEFAULT_MORPHIT_PATH = Path("data/morphit/morph-it.txt")
@@ -74,7 +46,7 @@ def cmd_import_wiktextract(args: argparse.Namespace) -> int:
     print(f"Filtering to: {POS(args.pos).plural}")
     print()
 
-    with get_connection(db_path) as conn:
+    with get_connection(db_path, bulk_import=True) as conn:
         _run_wiktextract_import(conn, jsonl_path, args.pos)
 
     print()
@@ -101,7 +73,7 @@ def cmd_enrich_formof(args: argparse.Namespace) -> int:
     print(f"Filtering to: {POS(args.pos).plural}")
     print()
 
-    with get_connection(db_path) as conn:
+    with get_connection(db_path, bulk_import=True) as conn:
         _run_formof_combined_enrichment(conn, jsonl_path, args.pos)
 
     print()
@@ -128,7 +100,7 @@ def cmd_import_morphit(args: argparse.Namespace) -> int:
     print(f"Filtering to: {POS(args.pos).plural}")
     print()
 
-    with get_connection(db_path) as conn:
+    with get_connection(db_path, bulk_import=True) as conn:
         _run_morphit_import(conn, morphit_path, args.pos)
 
     print()
@@ -138,6 +110,8 @@ def cmd_import_morphit(args: argparse.Namespace) -> int:
 
 def cmd_import_itwac(args: argparse.Namespace) -> int:
     """Run the ItWaC frequency import command."""
+    from italian_db.importers.itwac import ITWAC_CSV_FILES
+
     db_path = Path(args.database)
 
     # Determine CSV path: use explicit --input, or derive from --pos
@@ -164,7 +138,7 @@ def cmd_import_itwac(args: argparse.Namespace) -> int:
     print(f"Filtering to: {POS(args.pos).plural}")
     print()
 
-    with get_connection(db_path) as conn:
+    with get_connection(db_path, bulk_import=True) as conn:
         _run_itwac_import(conn, csv_path, args.pos)
 
     print()
@@ -199,7 +173,7 @@ def cmd_import_tatoeba(args: argparse.Namespace) -> int:
     print(f"  Links: {links_path}")
     print()
 
-    with get_connection(db_path) as conn:
+    with get_connection(db_path, bulk_import=True) as conn:
         _run_tatoeba_import(conn, ita_path, eng_path, links_path)
 
     print()
@@ -209,6 +183,8 @@ def cmd_import_tatoeba(args: argparse.Namespace) -> int:
 
 def cmd_import_verb_irregularity(args: argparse.Namespace) -> int:
     """Run the verb irregularity pattern import command."""
+    from italian_db.importers import import_verb_irregularity
+
     db_path = Path(args.database)
 
     if not db_path.exists():
@@ -223,7 +199,7 @@ def cmd_import_verb_irregularity(args: argparse.Namespace) -> int:
     print(f"Importing verb irregularity patterns to: {db_path}")
     print()
 
-    with get_connection(db_path) as conn:
+    with get_connection(db_path, bulk_import=True) as conn:
         stats = import_verb_irregularity(conn, progress_callback=_make_progress_callback())
         print()
         print(f"  Total classifications:  {stats.total:,}")
@@ -242,7 +218,7 @@ def cmd_import_verb_irregularity(args: argparse.Namespace) -> int:
 
 def cmd_stats(args: argparse.Namespace) -> int:
     """Print database statistics."""
-    from sqlalchemy import func, select
+    from sqlalchemy import case, func, select
 
     db_path = Path(args.database)
 
@@ -250,63 +226,44 @@ def cmd_stats(args: argparse.Namespace) -> int:
         print(f"Error: Database not found: {db_path}", file=sys.stderr)
         return 1
 
+    # Each table is aggregated once; COUNT(CASE WHEN cond THEN 1 END) counts matching
+    # rows and COUNT(column) counts non-NULL values
     with get_connection(db_path) as conn:
         # Lemma counts
-        total_lemmas = conn.execute(select(func.count()).select_from(lemmas)).scalar()
-        n_verbs = conn.execute(
-            select(func.count()).select_from(lemmas).where(lemmas.c.pos == POS.VERB)
-        ).scalar()
-        n_nouns = conn.execute(
-            select(func.count()).select_from(lemmas).where(lemmas.c.pos == POS.NOUN)
-        ).scalar()
-        n_adjectives = conn.execute(
-            select(func.count()).select_from(lemmas).where(lemmas.c.pos == POS.ADJECTIVE)
-        ).scalar()
-
-        # Form counts (separate tables)
-        n_verb_forms = conn.execute(select(func.count()).select_from(verb_forms)).scalar() or 0
-        n_noun_forms = conn.execute(select(func.count()).select_from(noun_forms)).scalar() or 0
-        n_adj_forms = conn.execute(select(func.count()).select_from(adjective_forms)).scalar() or 0
+        total_lemmas, n_verbs, n_nouns, n_adjectives = conn.execute(
+            select(
+                func.count(),
+                func.count(case((lemmas.c.pos == POS.VERB, 1))),
+                func.count(case((lemmas.c.pos == POS.NOUN, 1))),
+                func.count(case((lemmas.c.pos == POS.ADJECTIVE, 1))),
+            )
+        ).one()
+
+        # Form counts and forms with real spelling (separate tables)
+        n_verb_forms, verb_with_spelling = conn.execute(
+            select(func.count(), func.count(verb_forms.c.written))
+        ).one()
+        n_noun_forms, noun_with_spelling, nouns_with_gender = conn.execute(
+            select(func.count(), func.count(noun_forms.c.written), func.count(noun_forms.c.gender))
+        ).one()
+        n_adj_forms, adj_with_spelling = conn.execute(
+            select(func.count(), func.count(adjective_forms.c.written))
+        ).one()
         total_forms = n_verb_forms + n_noun_forms + n_adj_forms
-
-        # Forms with real spelling
-        verb_with_spelling = (
-            conn.execute(
-                select(func.count()).select_from(verb_forms).where(verb_forms.c.written.isnot(None))
-            ).scalar()
-            or 0
-        )
-        noun_with_spelling = (
-            conn.execute(
-                select(func.count()).select_from(noun_forms).where(noun_forms.c.written.isnot(None))
-            ).scalar()
-            or 0
-        )
-        adj_with_spelling = (
-            conn.execute(
-                select(func.count())
-                .select_from(adjective_forms)
-                .where(adjective_forms.c.written.isnot(None))
-            ).scalar()
-            or 0
-        )
         forms_with_spelling = verb_with_spelling + noun_with_spelling + adj_with_spelling
 
         # Metadata
-        nouns_with_gender = conn.execute(
-            select(func.count()).select_from(noun_forms).where(noun_forms.c.gender.isnot(None))
-        ).scalar()
         lemmas_with_freq = conn.execute(
             select(func.count(func.distinct(frequencies.c.lemma_id)))
         ).scalar()
 
         # Sentences
-        ita_sentences = conn.execute(
-            select(func.count()).select_from(sentences).where(sentences.c.lang == "ita")
-        ).scalar()
-        eng_sentences = conn.execute(
-            select(func.count()).select_from(sentences).where(sentences.c.lang == "eng")
-        ).scalar()
+        ita_sentences, eng_sentences = conn.execute(
+            select(
+                func.count(case((sentences.c.lang == "ita", 1))),
+                func.count(case((sentences.c.lang == "eng", 1))),
+            )
+        ).one()
 
     print(f"Database: {db_path}")
     print()
@@ -333,6 +290,8 @@ def cmd_stats(args: argparse.Namespace) -> int:
 
 def cmd_verify(args: argparse.Namespace) -> int:
     """Verify database integrity and consistency."""
+    from italian_db.verify import verify_database
+
     db_path = Path(args.database)
 
     if not db_path.exists():
@@ -351,6 +310,8 @@ def cmd_verify(args: argparse.Namespace) -> int:
 
 def cmd_download_wiktextract(args: argparse.Namespace) -> int:
     """Download Wiktextract Italian dictionary."""
+    from italian_db.download import download_wiktextract
+
     stats = download_wiktextract(force=args.force)
     if stats["downloaded"] > 0:
         print("Download complete!")
@@ -359,6 +320,8 @@ def cmd_download_wiktextract(args: argparse.Namespace) -> int:
 
 def cmd_download_morphit(args: argparse.Namespace) -> int:
     """Download Morph-it! morphological lexicon."""
+    from italian_db.download import download_morphit
+
     stats = download_morphit(force=args.force)
     if stats["downloaded"] > 0:
         print("Download complete!")
@@ -367,6 +330,8 @@ def cmd_download_morphit(args: argparse.Namespace) -> int:
 
 def cmd_download_itwac(args: argparse.Namespace) -> int:
     """Download ItWaC frequency lists."""
+    from italian_db.download import download_itwac
+
     stats = download_itwac(force=args.force)
     print(f"Downloaded: {stats['downloaded']} files, Skipped: {stats['skipped']} files")
     return 0
@@ -374,6 +339,8 @@ def cmd_download_itwac(args: argparse.Namespace) -> int:
 
 def cmd_download_tatoeba(args: argparse.Namespace) -> int:
     """Download Tatoeba sentences and links."""
+    from italian_db.download import download_tatoeba
+
     stats = download_tatoeba(force=args.force)
     print(f"Downloaded: {stats['downloaded']} files, Skipped: {stats['skipped']} files")
     return 0
@@ -381,6 +348,8 @@ def cmd_download_tatoeba(args: argparse.Namespace) -> int:
 
 def cmd_download_all(args: argparse.Namespace) -> int:
     """Download all data sources."""
+    from italian_db.download import download_all
+
     download_all(force=args.force)
     return 0
 
@@ -396,9 +365,21 @@ def _print_progress(current: int, total: int, desc: str = "Processing") -> None:
 
 
 def _make_progress_callback(desc: str = "Processing"):
-    """Create a progress callback for import functions."""
+    """Create a progress callback for import functions.
+
+    Only redraws when the whole percentage changes (or on completion), so an
+    importer reporting every few rows writes at most ~100 updates to the terminal.
+    """
+    last_pct = -1
 
     def callback(current: int, total: int) -> None:
+        nonlocal last_pct
+        if total == 0:
+            return
+        pct = current * 100 // total
+        if pct == last_pct and current < total:
+            return
+        last_pct = pct
         _print_progress(current, total, desc)
 
     return callback
@@ -409,10 +390,23 @@ def _make_progress_callback(desc: str = "Processing"):
 # standalone commands and cmd_import_all.
 
 
+# Skip-reason stats printed under "Skipped" by _run_wiktextract_import: (key, label)
+_WIKTEXTRACT_SKIP_REASONS = (
+    ("blocklisted_lemmas", "Blocklisted"),
+    ("misspellings_skipped", "Misspellings"),
+    ("alt_forms_skipped", "Alt-forms"),
+    ("skipped_plural_duplicate", "Duplicate plurals"),
+    ("nouns_skipped_no_gender", "No gender"),
+    ("counterpart_wrong_gender", "Wrong gender"),
+)
+
+
 def _run_wiktextract_import(
     conn: Connection, jsonl_path: Path, pos: POS, indent: str = "  "
 ) -> dict[str, Any]:
     """Run wiktextract import and print stats."""
+    from italian_db.importers import import_wiktextract
+
     stats = import_wiktextract(
         conn, jsonl_path, pos_filter=pos, progress_callback=_make_progress_callback()
     )
@@ -426,18 +420,10 @@ def _run_wiktextract_import(
         print(f"{indent}Stress synced: {stats.get('lemma_stress_synced', 0):,}")
     print(f"{indent}Skipped:       {stats['skipped']:,}")
     # Show skip reason breakdown (only non-zero counts)
-    if stats.get("blocklisted_lemmas", 0) > 0:
-        print(f"{indent}  Blocklisted:        {stats['blocklisted_lemmas']:,}")
-    if stats.get("misspellings_skipped", 0) > 0:
-        print(f"{indent}  Misspellings:       {stats['misspellings_skipped']:,}")
-    if stats.get("alt_forms_skipped", 0) > 0:
-        print(f"{indent}  Alt-forms:          {stats['alt_forms_skipped']:,}")
-    if stats.get("skipped_plural_duplicate", 0) > 0:
-        print(f"{indent}  Duplicate plurals:  {stats['skipped_plural_duplicate']:,}")
-    if stats.get("nouns_skipped_no_gender", 0) > 0:
-        print(f"{indent}  No gender:          {stats['nouns_skipped_no_gender']:,}")
-    if stats.get("counterpart_wrong_gender", 0) > 0:
-        print(f"{indent}  Wrong gender:       {stats['counterpart_wrong_gender']:,}")
+    for key, label in _WIKTEXTRACT_SKIP_REASONS:
+        count = stats.get(key, 0)
+        if count > 0:
+            print(f"{indent}  {label + ':':<20}{count:,}")
     return stats
 
 
@@ -445,6 +431,8 @@ def _run_formof_combined_enrichment(
     conn: Connection, jsonl_path: Path, pos: POS, indent: str = "  "
 ) -> dict[str, Any]:
     """Run combined form-of enrichment (labels + spelling) and print stats."""
+    from italian_db.importers.wiktextract import enrich_from_form_of_entries
+
     stats = enrich_from_form_of_entries(
         conn, jsonl_path, pos_filter=pos, progress_callback=_make_progress_callback()
     )
@@ -465,6 +453,8 @@ def _run_morphit_import(
     conn: Connection, morphit_path: Path, pos: POS, indent: str = "  "
 ) -> dict[str, Any]:
     """Run Morph-it! enrichment and print stats."""
+    from italian_db.importers import import_morphit
+
     stats = import_morphit(
         conn, morphit_path, pos_filter=pos, progress_callback=_make_progress_callback()
     )
@@ -478,6 +468,8 @@ def _run_itwac_import(
     conn: Connection, csv_path: Path, pos: POS, indent: str = "  "
 ) -> dict[str, Any] | None:
     """Run ItWaC frequency import and print stats. Returns None if file doesn't exist."""
+    from italian_db.importers import import_itwac
+
     if not csv_path.exists():
         return None
     stats = import_itwac(
@@ -499,6 +491,8 @@ def _run_tatoeba_import(
     conn: Connection, ita_path: Path, eng_path: Path, links_path: Path, indent: str = "  "
 ) -> dict[str, Any]:
     """Run Tatoeba import and print stats."""
+    from italian_db.importers import import_tatoeba
+
     stats = import_tatoeba(
         conn, ita_path, eng_path, links_path, progress_callback=_make_progress_callback()
     )
@@ -513,6 +507,8 @@ def _run_tatoeba_import(
 
 def _run_verb_irregularity_import(conn: Connection, indent: str = "  ") -> dict[str, Any]:
     """Run verb irregularity import and print stats."""
+    from italian_db.importers import import_verb_irregularity
+
     stats = import_verb_irregularity(conn, progress_callback=_make_progress_callback())
     print()
     print(f"{indent}Total classifications:  {stats.total:,}")
@@ -523,6 +519,19 @@ def _run_verb_irregularity_import(conn: Connection, indent: str = "  ") -> dict[
 
 def cmd_import_all(args: argparse.Namespace) -> int:
     """Run the full import pipeline for all parts of speech."""
+    from italian_db.importers.itwac import ITWAC_CSV_FILES
+    from italian_db.importers.morphit import (
+        apply_orthography_fallback,
+        apply_unstressed_fallback,
+        enrich_lemma_written,
+    )
+    from italian_db.importers.wiktextract import (
+        enrich_missing_feminine_plurals,
+        generate_gendered_participles,
+        import_adjective_allomorphs,
+        import_noun_allomorphs,
+    )
+
     db_path = Path(args.database)
     jsonl_path = DEFAULT_WIKTEXTRACT_PATH
     morphit_path = DEFAULT_MORPHIT_PATH
@@ -549,34 +558,36 @@ def cmd_import_all(args: argparse.Namespace) -> int:
     init_db(engine)
     print()
 
-    pos_list = list(POS)
-    total_phases = 5  # 3 POS + post-processing + Tatoeba
-    indent = "    "
+    # One connection for the whole pipeline; each phase commits when it finishes,
+    # so completed phases persist even if a later one fails
+    with get_connection(db_path, bulk_import=True) as conn:
+        pos_list = list(POS)
+        total_phases = 5  # 3 POS + post-processing + Tatoeba
+        indent = "    "
+
+        # Import each POS
+        for pos_idx, pos in enumerate(pos_list, 1):
+            pos_plural = pos.plural
+            print("=" * 80)
+            print(f"Importing {pos_plural} (Step {pos_idx} of {total_phases})")
+            print("=" * 80)
+            print()
 
-    # Import each POS
-    for pos_idx, pos in enumerate(pos_list, 1):
-        pos_plural = pos.plural
-        print("=" * 80)
-        print(f"Importing {pos_plural} (Step {pos_idx} of {total_phases})")
-        print("=" * 80)
-        print()
+            # Determine step count:
+            # - adjectives: 8 steps (wiktextract, morphit-forms, lemma-written,
+            #                        allomorphs, form-of, unstressed, orthography, itwac)
+            # - nouns: 8 steps (wiktextract, morphit-forms, lemma-written, allomorphs,
+            #                   form-of, unstressed, orthography, itwac)
+            # - verbs: 6 steps (wiktextract, participles, lemma-written, form-of, itwac,
+            #                   verb-irregularity)
+            #          Verbs skip morphit-forms/unstressed/orthography (produce 0 updates)
+            if pos == POS.ADJECTIVE:
+                total_steps = 8
+            elif pos == POS.VERB:
+                total_steps = 6
+            else:
+                total_steps = 8
 
-        # Determine step count:
-        # - adjectives: 8 steps (wiktextract, morphit-forms, lemma-written,
-        #                        allomorphs, form-of, unstressed, orthography, itwac)
-        # - nouns: 8 steps (wiktextract, morphit-forms, lemma-written, allomorphs,
-        #                   form-of, unstressed, orthography, itwac)
-        # - verbs: 6 steps (wiktextract, participles, lemma-written, form-of, itwac,
-        #                   verb-irregularity)
-        #          Verbs skip morphit-forms/unstressed/orthography (produce 0 updates)
-        if pos == POS.ADJECTIVE:
-            total_steps = 8
-        elif pos == POS.VERB:
-            total_steps = 6
-        else:
-            total_steps = 8
-
-        with get_connection(db_path) as conn:
             # Step 1: Wiktextract import
             print(f"[1/{total_steps}] Importing from Wiktextract...")
             _run_wiktextract_import(conn, jsonl_path, pos, indent=indent)
@@ -705,13 +716,15 @@ def cmd_import_all(args: argparse.Namespace) -> int:
                 _run_verb_irregularity_import(conn, indent=indent)
                 print()
 
-    # Post-processing: Cross-POS enrichments
-    print("=" * 80)
-    print("Post-processing enrichments (Step 4 of 5)")
-    print("=" * 80)
-    print()
+            # Commit this POS before starting the next
+            conn.commit()
+
+        # Post-processing: Cross-POS enrichments
+        print("=" * 80)
+        print("Post-processing enrichments (Step 4 of 5)")
+        print("=" * 80)
+        print()
 
-    with get_connection(db_path) as conn:
         # Synthesize missing feminine plurals for CGV nouns
         print("Synthesizing missing feminine plural forms...")
         stats = enrich_missing_feminine_plurals(conn, progress_callback=_make_progress_callback())
@@ -723,16 +736,16 @@ def cmd_import_all(args: argparse.Namespace) -> int:
         print(f"  Skipped (blocklisted): {stats['skipped_blocklisted']:,}")
         print(f"  Skipped (multi-word):  {stats['skipped_multiword']:,}")
         print(f"  Skipped (typo):        {stats['skipped_typo']:,}")
-    print()
+        conn.commit()
+        print()
 
-    # Final step: Tatoeba sentences (for all POS)
-    print("=" * 80)
-    print("Importing Tatoeba sentences (Step 5 of 5)")
-    print("=" * 80)
-    print()
-    print("Importing sentences...")
+        # Final step: Tatoeba sentences (for all POS)
+        print("=" * 80)
+        print("Importing Tatoeba sentences (Step 5 of 5)")
+        print("=" * 80)
+        print()
+        print("Importing sentences...")
 
-    with get_connection(db_path) as conn:
         _run_tatoeba_import(conn, ita_path, eng_path, links_path, indent="  ")
     print()
 
@@ -13,20 +13,51 @@ DEFAULT_DB_PATH = Path("italian.db")
 _engine_cache: dict[Path, Engine] = {}
 
 
+# Applied to every SQLite connection the engine opens
+_SQLITE_PRAGMAS = ("PRAGMA foreign_keys=ON",)
+
+# Applied only while a get_connection(bulk_import=True) block is open, so read-only
+# commands and other writers keep SQLite's defaults. synchronous=NORMAL skips the
+# extra fsync per commit, and temp storage/page cache stay in memory (cache_size is
+# in KiB when negative: 64 MiB). journal_mode is left at its default so the database
+# remains a single self-contained file.
+_BULK_IMPORT_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# SQLite's defaults for the settings above, restored before the pooled
+# connection is handed back
+_DEFAULT_PRAGMAS = (
+    "PRAGMA synchronous=FULL",
+    "PRAGMA temp_store=DEFAULT",
+    "PRAGMA cache_size=-2000",
+)
+
+
 def _set_sqlite_pragma(dbapi_connection: Any, _connection_record: ConnectionPoolEntry) -> None:
     """Enable foreign keys for SQLite connections."""
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
     cursor.close()
 
 
+def _apply_pragmas(conn: Connection, pragmas: tuple[str, ...]) -> None:
+    """Run PRAGMA statements on an open connection."""
+    for pragma in pragmas:
+        conn.exec_driver_sql(pragma)
+
+
 def get_engine(db_path: Path | str = DEFAULT_DB_PATH) -> Engine:
     """Get or create a SQLAlchemy engine for the given database path.
 
-    Engines are cached by path to avoid creating multiple engines for the same database.
+    Engines are cached by resolved path to avoid creating multiple engines for the
+    same database (e.g. "italian.db" and "./italian.db" share one engine and pool).
     Enables foreign key enforcement for SQLite.
     """
-    db_path = Path(db_path)
+    db_path = Path(db_path).resolve()
 
     if db_path not in _engine_cache:
         engine = create_engine(f"sqlite:///{db_path}", echo=False)
@@ -39,11 +70,17 @@ def get_engine(db_path: Path | str = DEFAULT_DB_PATH) -> Engine:
 @contextmanager
 def get_connection(
     db_path: Path | str = DEFAULT_DB_PATH,
+    *,
+    bulk_import: bool = False,
 ) -> Generator[Connection]:
     """Context manager for database connections.
 
     Automatically commits on success, rolls back on exception.
 
+    With bulk_import=True the connection trades per-commit durability and memory
+    for write throughput for the duration of the block. Use it only for import
+    commands, which rebuild the database from source files anyway.
+
     Example:
         with get_connection() as conn:
             result = conn.execute(select(lemmas).where(lemmas.c.lemma == "parlare"))
@@ -52,9 +89,14 @@ def get_connection(
     """
     engine = get_engine(db_path)
     with engine.connect() as conn:
+        if bulk_import:
+            _apply_pragmas(conn, _BULK_IMPORT_PRAGMAS)
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
+        finally:
+            if bulk_import:
+                _apply_pragmas(conn, _DEFAULT_PRAGMAS)
@@ -329,6 +329,7 @@ verb_irregularity = Table(
 Index(
     "idx_lemmas_stressed_pos", lemmas.c.stressed, lemmas.c.pos
 )  # For lookups by stressed form+POS
+Index("idx_lemmas_pos", lemmas.c.pos)  # For per-POS scans (importers, verify checks)
 Index("idx_verb_metadata_auxiliary", verb_metadata.c.auxiliary)
 Index("idx_verb_metadata_base", verb_metadata.c.base_verb_lemma_id)
 # noun_metadata indexes
@@ -362,6 +363,9 @@ Index("idx_definitions_lemma", definitions.c.lemma_id)
 Index("idx_frequencies_lemma", frequencies.c.lemma_id)
 Index("idx_sentences_lang", sentences.c.lang)
 Index("idx_translations_ita", translations.c.ita_sentence_id)
+# eng_sentence_id is the second primary key column, so the PK index can't serve
+# lookups by it alone (orphaned-translation checks, eng -> ita joins)
+Index("idx_translations_eng", translations.c.eng_sentence_id)
 
 
 def init_db(engine: Engine) -> None:
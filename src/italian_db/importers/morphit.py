@@ -5,7 +5,7 @@ from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import Connection, Table, select, update
+from sqlalchemy import Connection, Table, Update, bindparam, select, update
 
 from italian_db.db.schema import (
     adjective_forms,
@@ -35,6 +35,20 @@ POS_FORM_TABLES: dict[POS, Table] = {
     POS.ADJECTIVE: adjective_forms,
 }
 
+
+def _written_update(table: Table) -> Update:
+    """Build an executemany-ready UPDATE of written/written_source keyed by id.
+
+    Rows are dicts with "_id", "_written" and "_written_source" keys; the
+    bindparam names differ from the column names as SQLAlchemy requires.
+    """
+    return (
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        .values(written=bindparam("_written"), written_source=bindparam("_written_source"))
+    )
+
+
 # Corrections for known Morphit errors in noun forms
 # Applied when enriching noun_forms.written from Morphit data
 NOUN_WRITTEN_CORRECTIONS: dict[str, str] = {
@@ -166,7 +180,8 @@ def import_morphit(
     all_forms = result.fetchall()
     total_forms = len(all_forms)
 
-    # Batch updates
+    # Batch updates, each batch written with a single executemany
+    written_update = _written_update(pos_form_table)
     update_batch: list[dict[str, Any]] = []
 
     def flush_batches() -> None:
@@ -174,12 +189,7 @@ def import_morphit(
 
         if update_batch:
             # Update written column in POS-specific table
-            for item in update_batch:
-                conn.execute(
-                    update(pos_form_table)
-                    .where(pos_form_table.c.id == item["id"])
-                    .values(written=item["written"], written_source=item["written_source"])
-                )
+            conn.execute(written_update, update_batch)
             stats["updated"] += len(update_batch)
             update_batch = []
 
@@ -207,7 +217,7 @@ def import_morphit(
             # Check if this is a French loanword that should preserve its accent
             # Morph-it! may have stripped the accent (e.g., "defaillance" not "défaillance")
             if stressed_form in FRENCH_LOANWORD_WHITELIST:
-                real_form = FRENCH_LOANWORD_WHITELIST[stressed_form]
+                real_form = stressed_form
                 written_source = "hardcoded:loanword"
             # Check if this is a known Morphit error for nouns
             elif pos_filter == POS.NOUN and real_form in NOUN_WRITTEN_CORRECTIONS:
@@ -216,7 +226,7 @@ def import_morphit(
             else:
                 written_source = "morphit"
             update_batch.append(
-                {"id": form_id, "written": real_form, "written_source": written_source}
+                {"_id": form_id, "_written": real_form, "_written_source": written_source}
             )
         else:
             stats["not_found"] += 1
@@ -281,16 +291,16 @@ def apply_unstressed_fallback(
         )
     )
 
-    for row in result:
-        stressed_form = row.stressed
+    update_rows = [
+        {"_id": row.id, "_written": row.stressed, "_written_source": "fallback:no_accent"}
+        for row in result
         # Skip "-" which represents missing forms for defective verbs
-        if stressed_form != "-" and not _has_accents(stressed_form):
-            conn.execute(
-                update(pos_form_table)
-                .where(pos_form_table.c.id == row.id)
-                .values(written=stressed_form, written_source="fallback:no_accent")
-            )
-            stats["updated"] += 1
+        if row.stressed != "-" and not _has_accents(row.stressed)
+    ]
+
+    if update_rows:
+        conn.execute(_written_update(pos_form_table), update_rows)
+        stats["updated"] = len(update_rows)
 
     return stats
 
@@ -340,6 +350,7 @@ def apply_orthography_fallback(
         )
     )
 
+    update_rows: list[dict[str, Any]] = []
     for row in result:
         stressed_form = row.stressed
         # Skip "-" which represents missing forms for defective verbs
@@ -360,12 +371,11 @@ def apply_orthography_fallback(
         else:
             written_source = "derived:orthography_rule"
 
-        conn.execute(
-            update(pos_form_table)
-            .where(pos_form_table.c.id == row.id)
-            .values(written=written, written_source=written_source)
-        )
-        stats["updated"] += 1
+        update_rows.append({"_id": row.id, "_written": written, "_written_source": written_source})
+
+    if update_rows:
+        conn.execute(_written_update(pos_form_table), update_rows)
+        stats["updated"] = len(update_rows)
 
     return stats
 
@@ -419,6 +429,21 @@ def enrich_lemma_written(
     all_lemmas = result.fetchall()
     total_lemmas = len(all_lemmas)
 
+    # Preload each pending lemma's citation form (is_citation_form is unified
+    # across all POS) in one scan instead of querying it once per lemma.
+    # setdefault keeps the first citation row per lemma, like the former LIMIT 1.
+    citation_result = conn.execute(
+        select(pos_form_table.c.lemma_id, pos_form_table.c.written)
+        .select_from(pos_form_table.join(lemmas, pos_form_table.c.lemma_id == lemmas.c.id))
+        .where(pos_form_table.c.is_citation_form == True)  # noqa: E712
+        .where(lemmas.c.pos == pos_filter)
+        .where(lemmas.c.written.is_(None))
+    )
+    citation_written: dict[int, str | None] = {}
+    for citation_row in citation_result:
+        citation_written.setdefault(citation_row.lemma_id, citation_row.written)
+
+    update_rows: list[dict[str, Any]] = []
     for idx, row in enumerate(all_lemmas, 1):
         if progress_callback and idx % 5000 == 0:
             progress_callback(idx, total_lemmas)
@@ -426,20 +451,14 @@ def enrich_lemma_written(
         lemma_id = row.id
         stressed_lemma = row.stressed
 
-        # Query the citation form using is_citation_form flag (unified across all POS)
-        form_result = conn.execute(
-            select(pos_form_table.c.written, pos_form_table.c.written_source)
-            .where(pos_form_table.c.lemma_id == lemma_id)
-            .where(pos_form_table.c.is_citation_form == True)  # noqa: E712
-            .limit(1)
-        ).fetchone()
+        citation_form_written = citation_written.get(lemma_id)
 
         written: str | None = None
         written_source: str | None = None
 
-        if form_result and form_result.written:
+        if citation_form_written:
             # Copy from citation form
-            written = form_result.written
+            written = citation_form_written
             written_source = f"from:{pos_filter}_forms"
             stats["from_form"] += 1
         elif stressed_lemma != "-":
@@ -455,15 +474,16 @@ def enrich_lemma_written(
                     stats["derived"] += 1
 
         if written is not None:
-            conn.execute(
-                update(lemmas)
-                .where(lemmas.c.id == lemma_id)
-                .values(written=written, written_source=written_source)
+            update_rows.append(
+                {"_id": lemma_id, "_written": written, "_written_source": written_source}
             )
-            stats["updated"] += 1
         else:
             stats["no_citation_form"] += 1
 
+    if update_rows:
+        conn.execute(_written_update(lemmas), update_rows)
+        stats["updated"] = len(update_rows)
+
     if progress_callback:
         progress_callback(total_lemmas, total_lemmas)
 
@@ -1,14 +1,16 @@
 """Import Italian verb data from Wiktextract JSONL."""
 
+import hashlib
 import json
 import logging
 import re
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import Connection, func, select, text, update
+from sqlalchemy import Connection, Index, bindparam, func, or_, select, text, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateIndex, DropIndex
 
 from italian_db.articles import get_definite
 from italian_db.db.schema import (
@@ -36,8 +38,8 @@ from italian_db.tags import (
 
 logger = logging.getLogger(__name__)
 
-# Cache for line counts - avoids re-reading large files multiple times
-_line_count_cache: dict[Path, int] = {}
+# Block size for raw binary reads of JSONL files
+_READ_BLOCK_SIZE = 1 << 20
 
 # Mapping from our POS names to Wiktextract's abbreviated names
 WIKTEXTRACT_POS: dict[POS, str] = {
@@ -53,6 +55,26 @@ POS_FORM_TABLES: dict[POS, Any] = {
     POS.ADJECTIVE: adjective_forms,
 }
 
+# Insert statements reused by every batch flush (built once, not per flush)
+_FORM_INSERT_STMTS: dict[POS, Any] = {pos: table.insert() for pos, table in POS_FORM_TABLES.items()}
+_DEFINITION_INSERT = definitions.insert()
+
+# Lookup-only form indexes, dropped during the bulk insert and rebuilt once afterwards.
+# Unique constraints stay (they guard the dedup), as do the lemma_id indexes that the
+# clear step and post-processing rely on.
+_DEFERRED_FORM_INDEXES: dict[POS, tuple[Index, ...]] = {
+    pos: tuple(
+        index for index in table.indexes if not index.unique and "lemma_id" not in index.columns
+    )
+    for pos, table in POS_FORM_TABLES.items()
+}
+
+# Maximum ids per "WHERE id IN (...)" statement in bulk updates
+_UPDATE_ID_CHUNK_SIZE = 500
+
+# Derived participle forms per executemany in generate_gendered_participles()
+_PARTICIPLE_BATCH_SIZE = 1000
+
 # Regex to strip bracket annotations from canonical forms
 # e.g., "[auxiliary essere]", "[transitive 'something'"
 # Handles malformed cases with missing closing bracket
@@ -71,6 +93,19 @@ GENDER_PATTERNS: dict[str, str] = {
     "f-s": "f-s",  # feminine singularia tantum
 }
 
+# Tag sets for inferred base forms
+_MASC_SINGULAR_TAGS = frozenset({"masculine", "singular"})
+_FEM_SINGULAR_TAGS = frozenset({"feminine", "singular"})
+
+# Noun gender classes whose forms serve both genders when untagged
+_COMMON_GENDER_CLASSES = frozenset(
+    {
+        GenderClass.COMMON_GENDER_FIXED,
+        GenderClass.COMMON_GENDER_VARIABLE,
+        GenderClass.BY_SENSE,
+    }
+)
+
 # Italian accented vowels (used to detect stressed/accented forms)
 ACCENTED_CHARS = frozenset("àèéìòóùÀÈÉÌÒÓÙ")
 
@@ -478,6 +513,33 @@ DEFINITION_FORM_LINKAGE: dict[str, dict[str, dict[str, list[str]]]] = {
 }
 
 
+# Inverted topic index over DEFINITION_FORM_LINKAGE: lemma -> topic -> forms.
+# Lets a sense's topic markers be looked up directly instead of testing every
+# form's topic list against the raw gloss.
+def _build_linkage_topic_index() -> dict[str, dict[str, set[str]]]:
+    index: dict[str, dict[str, set[str]]] = {}
+    for lemma, linkage in DEFINITION_FORM_LINKAGE.items():
+        for form_text, matchers in linkage.items():
+            for topic in matchers.get("topics", []):
+                index.setdefault(lemma, {}).setdefault(topic, set()).add(form_text)
+    return index
+
+
+_LINKAGE_TOPIC_INDEX = _build_linkage_topic_index()
+
+# Phrase matchers over DEFINITION_FORM_LINKAGE, flattened once: lemma -> ((form, phrases), ...)
+# in linkage order, so matching a sense needs no per-form dict lookups.
+_LINKAGE_PHRASES: dict[str, tuple[tuple[str, tuple[str, ...]], ...]] = {
+    lemma: tuple(
+        (form_text, tuple(matchers.get("phrases", []))) for form_text, matchers in linkage.items()
+    )
+    for lemma, linkage in DEFINITION_FORM_LINKAGE.items()
+}
+
+# Parenthesized topic markers in raw glosses, e.g. "(anatomy)"
+_TOPIC_MARKER_RE = re.compile(r"\(([^()]*)\)")
+
+
 def _has_accents(text: str) -> bool:
     """Check if text contains any accented characters."""
     return any(c in ACCENTED_CHARS for c in text)
@@ -557,15 +619,51 @@ def _extract_plural_qualifiers(
     return results
 
 
-def _sense_matches_form(sense: dict[str, Any], matchers: dict[str, list[str]]) -> bool:
-    """Check if a sense matches the matchers for a specific form.
+def _scan_noun_plurals(
+    forms: Iterable[dict[str, Any]],
+) -> tuple[set[str], set[str], set[str]]:
+    """Collect the plural forms of a noun entry in one pass over its forms array.
+
+    Args:
+        forms: The entry's Wiktextract forms array
+
+    Returns:
+        Tuple of (importable_plurals, explicit_fem_plurals, explicit_masc_plurals):
+        - importable_plurals: plural forms that survive should_filter_form()
+        - explicit_fem_plurals / explicit_masc_plurals: plurals explicitly tagged with
+          that gender, whether filtered or not
+    """
+    importable_plurals: set[str] = set()
+    explicit_fem_plurals: set[str] = set()
+    explicit_masc_plurals: set[str] = set()
+    for form_data in forms:
+        tags = form_data.get("tags", [])
+        if "plural" not in tags:
+            continue
+        form_text = form_data.get("form", "")
+        if "feminine" in tags:
+            explicit_fem_plurals.add(form_text)
+        if "masculine" in tags:
+            explicit_masc_plurals.add(form_text)
+        if not should_filter_form(tags):
+            importable_plurals.add(form_text)
+    return importable_plurals, explicit_fem_plurals, explicit_masc_plurals
+
+
+def _match_linkage_forms(sense: dict[str, Any], lemma: str) -> list[str]:
+    """Return the DEFINITION_FORM_LINKAGE forms of a lemma that a sense matches.
+
+    A form matches if any of its topics appears as a marker like "(anatomy)" in
+    the sense's raw gloss, or any of its phrases is a substring of the gloss.
+    Topics are resolved through _LINKAGE_TOPIC_INDEX; phrases need a substring scan
+    over the precompiled _LINKAGE_PHRASES.
 
     Args:
         sense: A sense dict from wiktextract with "glosses" and "raw_glosses"
-        matchers: Dict with optional "topics" and "phrases" lists
+        lemma: Lemma word with an entry in DEFINITION_FORM_LINKAGE
 
     Returns:
-        True if any topic or phrase matches the sense.
+        Matched forms, in DEFINITION_FORM_LINKAGE order.
     """
     raw_glosses = sense.get("raw_glosses", [])
     raw = raw_glosses[0] if raw_glosses else ""
@@ -573,11 +671,17 @@ def _sense_matches_form(sense: dict[str, Any], matchers: dict[str, list[str]]) -
     gloss = glosses[0] if glosses else ""
 
     # Check topics (e.g., "(anatomy)" in raw_glosses)
-    if any(f"({topic})" in raw for topic in matchers.get("topics", [])):
-        return True
+    matched: set[str] = set()
+    topic_index = _LINKAGE_TOPIC_INDEX.get(lemma, {})
+    for marker in _TOPIC_MARKER_RE.findall(raw):
+        matched.update(topic_index.get(marker, ()))
 
     # Check phrases (exact substring in gloss)
-    return any(phrase in gloss for phrase in matchers.get("phrases", []))
+    return [
+        form_text
+        for form_text, phrases in _LINKAGE_PHRASES[lemma]
+        if form_text in matched or any(phrase in gloss for phrase in phrases)
+    ]
 
 
 def _build_stressed_alternatives(jsonl_path: Path) -> dict[str, str]:
@@ -598,6 +702,11 @@ def _build_stressed_alternatives(jsonl_path: Path) -> dict[str, str]:
 
     with jsonl_path.open(encoding="utf-8") as f:
         for line in f:
+            # Cheap substring pre-check: lines without a form_of key can't be
+            # form-of entries, so skip decoding them
+            if '"form_of"' not in line:
+                continue
+
             entry = _parse_entry(line)
             if entry is None:
                 continue
@@ -1368,7 +1477,35 @@ def is_blocked_noun_form(
     return form_written in blocked_forms
 
 
-def _parse_entry(line: str) -> dict[str, Any] | None:
+def _iter_jsonl_lines(
+    path: Path,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> Iterator[bytes]:
+    """Yield the raw lines of a JSONL file as bytes, without line terminators.
+
+    Reads fixed-size binary blocks and splits them, so no line is decoded here;
+    json.loads() accepts bytes, and lines rejected by a raw prefilter are never
+    decoded at all.
+
+    If progress_callback is given, it is called with (bytes_read, file_size) after
+    each block, so progress needs no separate line-counting pass over the file.
+    """
+    total_bytes = path.stat().st_size if progress_callback else 0
+    bytes_read = 0
+    tail = b""
+    with path.open("rb") as f:
+        while block := f.read(_READ_BLOCK_SIZE):
+            bytes_read += len(block)
+            lines = (tail + block).split(b"\n")
+            tail = lines.pop()
+            yield from lines
+            if progress_callback:
+                progress_callback(bytes_read, total_bytes)
+    if tail:
+        yield tail
+
+
+def _parse_entry(line: str | bytes) -> dict[str, Any] | None:
     """Parse a JSONL line, returning None if invalid."""
     try:
         return json.loads(line)
@@ -1400,7 +1537,7 @@ def _is_pos_lemma(entry: dict[str, Any], pos: str) -> bool:
 def _extract_auxiliary(entry: dict[str, Any]) -> str | None:
     """Extract auxiliary verb (avere, essere, or both) from forms."""
     auxiliaries: set[str] = set()
-    for form in entry.get("forms", []):
+    for form in entry.get("forms") or ():
         if "auxiliary" in form.get("tags", []):
             aux = normalize(form.get("form", ""))
             if "aver" in aux:
@@ -1586,12 +1723,18 @@ def _extract_noun_classification(entry: dict[str, Any]) -> dict[str, Any]:
     - number_class: 'standard', 'pluralia_tantum', 'singularia_tantum', 'invariable'
     - number_class_source: how number_class was determined
     - genders: list of genders present in the forms
+    - fallback_gender: 'm'/'f' from _extract_gender(), computed only when the caller
+      needs it (no structured gender, or variable common gender); otherwise None
+
+    The forms array is scanned once for both the invariable and the
+    gender-variation checks.
     """
     result: dict[str, Any] = {
         "gender_class": None,
         "number_class": "standard",
         "number_class_source": "default",
         "genders": [],
+        "fallback_gender": None,
     }
 
     # Check head_templates for gender markers
@@ -1662,15 +1805,22 @@ def _extract_noun_classification(entry: dict[str, Any]) -> dict[str, Any]:
             is_invariable = True
             is_invariable_from_wiktextract = True
 
-    # Check forms to see if singular/plural have the same text (invariable)
+    # Single pass over forms: group by number (invariable check below) and by
+    # gender (common-gender variation check below)
     forms_by_number: dict[str, set[str]] = {"singular": set(), "plural": set()}
-    for form_data in entry.get("forms", []):
+    masc_forms: set[str] = set()
+    fem_forms: set[str] = set()
+    for form_data in entry.get("forms") or ():
         form_stressed = form_data.get("form", "")
         tags = form_data.get("tags", [])
         if "singular" in tags:
             forms_by_number["singular"].add(form_stressed)
         if "plural" in tags:
             forms_by_number["plural"].add(form_stressed)
+        if "masculine" in tags:
+            masc_forms.add(form_stressed)
+        if "feminine" in tags:
+            fem_forms.add(form_stressed)
 
     # If singular and plural forms are identical, mark as invariable
     if (
@@ -1706,23 +1856,15 @@ def _extract_noun_classification(entry: dict[str, Any]) -> dict[str, Any]:
             # Counterpart marker (f: "+" or m: "+") means forms differ by gender
             # (e.g., amico/amica, professore/professoressa)
             result["gender_class"] = GenderClass.COMMON_GENDER_VARIABLE
+        elif masc_forms and fem_forms and masc_forms != fem_forms:
+            # Forms differ by gender
+            result["gender_class"] = GenderClass.COMMON_GENDER_VARIABLE
         else:
-            # Check if forms differ by gender
-            masc_forms: set[str] = set()
-            fem_forms: set[str] = set()
-            for form_data in entry.get("forms", []):
-                form_stressed = form_data.get("form", "")
-                tags = form_data.get("tags", [])
-                if "masculine" in tags:
-                    masc_forms.add(form_stressed)
-                if "feminine" in tags:
-                    fem_forms.add(form_stressed)
-
-            if masc_forms and fem_forms and masc_forms != fem_forms:
-                result["gender_class"] = GenderClass.COMMON_GENDER_VARIABLE
-            else:
-                result["gender_class"] = GenderClass.COMMON_GENDER_FIXED
+            result["gender_class"] = GenderClass.COMMON_GENDER_FIXED
         result["genders"] = ["m", "f"]
+        if result["gender_class"] == GenderClass.COMMON_GENDER_VARIABLE:
+            # The lemma's own gender tells the importer which gender untagged forms belong to
+            result["fallback_gender"] = _extract_gender(entry)
     elif has_masculine:
         result["gender_class"] = GenderClass.M
         result["genders"] = ["m"]
@@ -1735,6 +1877,7 @@ def _extract_noun_classification(entry: dict[str, Any]) -> dict[str, Any]:
         if simple_gender:
             result["gender_class"] = GenderClass(simple_gender)
             result["genders"] = [simple_gender]
+            result["fallback_gender"] = simple_gender
 
     # Determine number_class and its source
     if is_pluralia_tantum:
@@ -1763,7 +1906,7 @@ def _extract_lemma_stressed(entry: dict[str, Any]) -> str:
     - Known overrides for Wiktionary errors (e.g., "sùggere" -> "suggére")
     """
     # First check forms for canonical or infinitive
-    for form in entry.get("forms", []):
+    for form in entry.get("forms") or ():
         tags = form.get("tags", [])
         if "canonical" in tags or "infinitive" in tags:
             stressed = form.get("form", entry["word"])
@@ -1790,12 +1933,12 @@ def _extract_lemma_stressed(entry: dict[str, Any]) -> str:
     return stressed
 
 
-def _iter_forms(
+def _collect_forms(
     entry: dict[str, Any],
     pos: str,
     stressed_alternatives: dict[str, str] | None = None,
-) -> Iterator[tuple[str, list[str], str]]:
-    """Yield (form_stressed, tags, form_origin) for each inflected form.
+) -> list[tuple[str, list[str], frozenset[str], str]]:
+    """Collect (form_stressed, tags, tag_set, form_origin) for each inflected form.
 
     Args:
         entry: Wiktextract entry dict
@@ -1803,14 +1946,16 @@ def _iter_forms(
         stressed_alternatives: Optional lookup for enriching unaccented forms with
             their proper accented spellings (e.g., "dei" → "dèi")
 
-    Yields:
-        Tuples of (form_stressed, tags, form_origin) where form_origin is:
+    Returns:
+        List of tuples of (form_stressed, tags, tag_set, form_origin), where tag_set is
+        a frozenset of tags for O(1) membership checks, and form_origin is:
         - 'wiktextract': Direct from forms array
         - 'inferred:singular': Added missing singular tag (for gender-only tagged forms)
         - 'inferred:two_form': Generated both genders for 2-form adjective
         - 'inferred:base_form': From lemma word field
         - 'inferred:invariable': Generated all 4 forms for invariable adjective
     """
+    forms: list[tuple[str, list[str], frozenset[str], str]] = []
     seen: set[tuple[str, tuple[str, ...]]] = set()
     has_masc_singular = False
     has_fem_singular = False
@@ -1821,7 +1966,7 @@ def _iter_forms(
     # Check if this is an invariable adjective (like "blu", "rosa")
     is_invariable = pos == "adjective" and _is_invariable_adjective(entry)
 
-    for form_data in entry.get("forms", []):
+    for form_data in entry.get("forms") or ():
         form_stressed = form_data.get("form", "")
 
         # Enrich with accented alternative if available
@@ -1836,7 +1981,7 @@ def _iter_forms(
             form_stressed = FEMININE_FORM_CORRECTIONS[form_stressed]
 
         tags = form_data.get("tags", [])
-        tag_set = set(tags)
+        tag_set = frozenset(tags)
 
         # Skip empty forms
         if not form_stressed:
@@ -1863,7 +2008,7 @@ def _iter_forms(
             has_number = "singular" in tag_set or "plural" in tag_set
             if has_gender and not has_number:
                 tags = [*tags, "singular"]  # Create new list, don't mutate original
-                tag_set = set(tags)
+                tag_set = frozenset(tags)
                 form_origin = "inferred:singular"
 
         # For adjectives: infer singular for forms with gender but no number
@@ -1873,7 +2018,7 @@ def _iter_forms(
             has_number = "singular" in tag_set or "plural" in tag_set
             if has_gender and not has_number:
                 tags = [*tags, "singular"]
-                tag_set = set(tags)
+                tag_set = frozenset(tags)
                 form_origin = "inferred:singular"
 
         # For adjectives: forms with number but no gender (2-form adjectives)
@@ -1893,7 +2038,7 @@ def _iter_forms(
                     # Track if this is the masculine singular base form
                     if "singular" in tag_set:
                         has_masc_singular = True
-                    yield form_stressed, tags_m, "inferred:two_form"
+                    forms.append((form_stressed, tags_m, frozenset(tags_m), "inferred:two_form"))
                 # Yield feminine version
                 tags_f = [*tags, "feminine"]
                 key_f = (form_stressed, tuple(sorted(tags_f)))
@@ -1902,11 +2047,11 @@ def _iter_forms(
                     # Track if this is the feminine singular form
                     if "singular" in tag_set:
                         has_fem_singular = True
-                    yield form_stressed, tags_f, "inferred:two_form"
-                continue  # Skip the default yield
+                    forms.append((form_stressed, tags_f, frozenset(tags_f), "inferred:two_form"))
+                continue  # Skip the default append
 
         # Skip auxiliary markers (they're metadata, not conjugated forms)
-        if "auxiliary" in tags:
+        if "auxiliary" in tag_set:
             continue
 
         # For verb canonical forms: strip bracket annotations and filter garbage
@@ -1918,9 +2063,9 @@ def _iter_forms(
                 continue
 
         # Track whether we've seen the base forms (for adjectives)
-        if pos == "adjective" and "masculine" in tags and "singular" in tags:
+        if pos == "adjective" and "masculine" in tag_set and "singular" in tag_set:
             has_masc_singular = True
-        if pos == "adjective" and "feminine" in tags and "singular" in tags:
+        if pos == "adjective" and "feminine" in tag_set and "singular" in tag_set:
             has_fem_singular = True
 
         # Deduplicate
@@ -1929,7 +2074,7 @@ def _iter_forms(
             continue
         seen.add(key)
 
-        yield form_stressed, tags, form_origin
+        forms.append((form_stressed, tags, tag_set, form_origin))
 
     # Add base form if missing (Wiktextract stores it in 'word', not in 'forms')
     # For adjectives: add masculine singular form if not present
@@ -1950,7 +2095,14 @@ def _iter_forms(
                     key = (lemma_stressed, tuple(sorted([gender, number])))
                     if key not in seen:
                         seen.add(key)
-                        yield lemma_stressed, [gender, number], "inferred:invariable"
+                        forms.append(
+                            (
+                                lemma_stressed,
+                                [gender, number],
+                                frozenset((gender, number)),
+                                "inferred:invariable",
+                            )
+                        )
         else:
             # Standard handling: add base form if missing
             # First check for gender-restricted adjectives
@@ -1963,13 +2115,27 @@ def _iter_forms(
                     key = (lemma_stressed, ("feminine", "singular"))
                     if key not in seen:
                         seen.add(key)
-                        yield lemma_stressed, ["feminine", "singular"], "inferred:base_form"
+                        forms.append(
+                            (
+                                lemma_stressed,
+                                ["feminine", "singular"],
+                                _FEM_SINGULAR_TAGS,
+                                "inferred:base_form",
+                            )
+                        )
             elif not has_masc_singular:
                 # Default: add masculine base form
                 key = (lemma_stressed, ("masculine", "singular"))
                 if key not in seen:
                     seen.add(key)
-                    yield lemma_stressed, ["masculine", "singular"], "inferred:base_form"
+                    forms.append(
+                        (
+                            lemma_stressed,
+                            ["masculine", "singular"],
+                            _MASC_SINGULAR_TAGS,
+                            "inferred:base_form",
+                        )
+                    )
 
             # For 2-form adjectives, add feminine singular too (same form as masculine)
             # But NOT for masculine-only adjectives (f: "-") or feminine-only adjectives
@@ -1981,7 +2147,16 @@ def _iter_forms(
             ):
                 key = (lemma_stressed, ("feminine", "singular"))
                 if key not in seen:
-                    yield lemma_stressed, ["feminine", "singular"], "inferred:base_form"
+                    forms.append(
+                        (
+                            lemma_stressed,
+                            ["feminine", "singular"],
+                            _FEM_SINGULAR_TAGS,
+                            "inferred:base_form",
+                        )
+                    )
+
+    return forms
 
 
 def _iter_definitions(entry: dict[str, Any]) -> Iterator[tuple[str, list[str] | None]]:
@@ -2085,9 +2260,7 @@ def _build_verb_form_row(
     # Normalize apostrophe spacing (e.g., "d' occhio" -> "d'occhio")
     form_stressed = _normalize_apostrophe_spacing(form_stressed)
 
-    if should_filter_form(tags):
-        return None
-
+    # parse_verb_tags() applies should_filter_form() itself
     features = parse_verb_tags(tags)
     if features.should_filter or features.mood is None:
         return None
@@ -2188,9 +2361,7 @@ def _build_noun_form_row(
     if form_stressed in NOUN_FORM_BLOCKLIST:
         return None
 
-    if should_filter_form(tags):
-        return None
-
+    # parse_noun_tags() applies should_filter_form() itself
     features = parse_noun_tags(tags)
     if features.should_filter or features.number is None:
         return None
@@ -2312,9 +2483,7 @@ def _build_adjective_form_row(
             - 'morphit': From Morphit fallback
         is_citation_form: Whether this is the canonical dictionary form (masculine singular)
     """
-    if should_filter_form(tags):
-        return None
-
+    # parse_adjective_tags() applies should_filter_form() itself
     features = parse_adjective_tags(tags)
     if features.should_filter or features.gender is None or features.number is None:
         return None
@@ -2348,25 +2517,12 @@ POS_FORM_BUILDERS: dict[POS, Any] = {
 }
 
 
-def _count_lines(path: Path) -> int:
-    """Count lines in a file efficiently (cached).
-
-    Results are cached by resolved path to avoid re-reading large files
-    multiple times during the import pipeline.
-    """
-    resolved = path.resolve()
-    if resolved not in _line_count_cache:
-        with path.open(encoding="utf-8") as f:
-            _line_count_cache[resolved] = sum(1 for _ in f)
-    return _line_count_cache[resolved]
-
-
 def import_wiktextract(
     conn: Connection,
     jsonl_path: Path,
     *,
     pos_filter: POS = POS.VERB,
-    batch_size: int = 1000,
+    batch_size: int = 10_000,
     progress_callback: Callable[[int, int], None] | None = None,
 ) -> dict[str, int]:
     """Import Wiktextract data into the database.
@@ -2379,7 +2535,8 @@ def import_wiktextract(
         conn: SQLAlchemy connection
         jsonl_path: Path to the Wiktextract JSONL file
         pos_filter: Part of speech to import
-        batch_size: Number of forms to insert per batch
+        batch_size: Number of forms to insert per batch; queued definitions are
+            flushed alongside each form batch with a single executemany
         progress_callback: Optional callback for progress reporting (current, total)
 
     Returns:
@@ -2388,6 +2545,11 @@ def import_wiktextract(
     # Clear existing data first (idempotency)
     cleared = _clear_existing_data(conn, pos_filter)
 
+    # Building lookup indexes once is cheaper than maintaining them per inserted row
+    deferred_indexes = _DEFERRED_FORM_INDEXES[pos_filter]
+    for index in deferred_indexes:
+        conn.execute(DropIndex(index, if_exists=True))
+
     stats: dict[str, int] = {
         "lemmas": 0,
         "forms": 0,
@@ -2420,15 +2582,17 @@ def import_wiktextract(
     if pos_form_table is None or build_form_row is None:
         msg = f"Unsupported POS: {pos_filter}"
         raise ValueError(msg)
+    form_insert_stmt = _FORM_INSERT_STMTS[pos_filter]
 
     form_batch: list[dict[str, Any]] = []
     definition_batch: list[dict[str, Any]] = []
 
     # Track unique verb forms to avoid duplicates (Wiktextract source sometimes has duplicates).
     # Two structures handle cross-batch deduplication:
-    # - seen_verb_keys: All keys ever seen (never cleared) - prevents cross-batch duplicates
+    # - seen_verb_keys: Digests of all keys ever seen (never cleared) - prevents cross-batch
+    #   duplicates. Stored as 16-byte digests since this set grows to every verb form imported.
     # - current_batch_map: Keys in current batch with indices - enables replacement logic
-    seen_verb_keys: set[tuple[Any, ...]] = set()
+    seen_verb_keys: set[bytes] = set()
     current_batch_map: dict[tuple[Any, ...], tuple[dict[str, Any], int]] = {}
 
     # Track unique noun forms to avoid duplicates (some nouns have multiple Wiktextract entries)
@@ -2459,6 +2623,10 @@ def import_wiktextract(
             row.get("is_negative", False),
         )
 
+    def _verb_key_digest(key: tuple[Any, ...]) -> bytes:
+        """Compact a verb dedup key to a 128-bit digest for the long-lived seen set."""
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+
     def _has_acute_accent(stressed: str) -> bool:
         """Check if a stressed form contains acute accents (ó, é)."""
         return "ó" in stressed or "é" in stressed or "Ó" in stressed or "É" in stressed
@@ -2482,10 +2650,11 @@ def import_wiktextract(
         """
         if pos_filter == POS.VERB:
             key = _verb_form_key_normalized(row)
+            key_digest = _verb_key_digest(key)
 
             # Case 1: Already seen in a PREVIOUS batch - skip entirely
             # (Can't do replacement logic since old batch is already committed)
-            if key in seen_verb_keys and key not in current_batch_map:
+            if key_digest in seen_verb_keys and key not in current_batch_map:
                 return False
 
             # Case 2: Already seen in CURRENT batch - use replacement logic
@@ -2526,7 +2695,7 @@ def import_wiktextract(
                 return False
 
             # Case 3: New form - add to both tracking structures
-            seen_verb_keys.add(key)
+            seen_verb_keys.add(key_digest)
             current_batch_map[key] = (row, len(form_batch))
 
         # Noun deduplication: simple key-based check (no replacement logic needed)
@@ -2539,10 +2708,22 @@ def import_wiktextract(
         form_batch.append(row)
         return True
 
+    def _batch_has_citation_form(lemma_id: int) -> bool:
+        """Check if the current batch already holds a citation form for a lemma.
+
+        A lemma's rows are appended together, so only the tail of the batch is scanned.
+        """
+        for row in reversed(form_batch):
+            if row["lemma_id"] != lemma_id:
+                return False
+            if row.get("is_citation_form"):
+                return True
+        return False
+
     def flush_batches() -> None:
         nonlocal form_batch, definition_batch, current_batch_map
         if form_batch:
-            conn.execute(pos_form_table.insert(), form_batch)
+            conn.execute(form_insert_stmt, form_batch)
             stats["forms"] += len(form_batch)
             form_batch = []
             # Clear current_batch_map since indices pointed into the old batch.
@@ -2550,7 +2731,7 @@ def import_wiktextract(
             current_batch_map = {}
 
         if definition_batch:
-            conn.execute(definitions.insert(), definition_batch)
+            conn.execute(_DEFINITION_INSERT, definition_batch)
             stats["definitions"] += len(definition_batch)
             definition_batch = []
 
@@ -2569,236 +2750,246 @@ def import_wiktextract(
     if pos_filter == POS.NOUN:
         counterpart_plurals = _build_counterpart_plurals(jsonl_path)
 
-    # Count lines for progress if callback provided
-    total_lines = _count_lines(jsonl_path) if progress_callback else 0
-    current_line = 0
-
-    with jsonl_path.open(encoding="utf-8") as f:
-        for line in f:
-            current_line += 1
-            if progress_callback and current_line % 10000 == 0:
-                progress_callback(current_line, total_lines)
+    # Raw-line needle: an entry of our POS always contains its quoted POS value,
+    # so lines without it are skipped before JSON decoding
+    pos_needle = f'"{wiktextract_pos}"'.encode()
 
-            entry = _parse_entry(line)
-            if entry is None:
-                continue
+    for line in _iter_jsonl_lines(jsonl_path, progress_callback):
+        if pos_needle not in line:
+            continue
 
-            # Filter by POS (using Wiktextract's naming)
-            if entry.get("pos") != wiktextract_pos:
-                continue
+        entry = _parse_entry(line)
+        if entry is None:
+            continue
 
-            # Filter out misspellings (applies to all POS)
-            if _is_misspelling(entry):
-                stats["misspellings_skipped"] += 1
-                continue
+        # Filter by POS (using Wiktextract's naming)
+        if entry.get("pos") != wiktextract_pos:
+            continue
 
-            # Filter out lemmas with malformed Wiktextract data (applies to all POS)
-            if _is_blocklisted_lemma(entry):
-                stats["blocklisted_lemmas"] += 1
-                continue
+        # Filter out misspellings (applies to all POS)
+        if _is_misspelling(entry):
+            stats["misspellings_skipped"] += 1
+            continue
 
-            # Filter out PURE alt-of entries for adjectives and nouns
-            # These are alternative spellings, apocopic forms, archaic variants, etc.
-            # that shouldn't be separate lemmas. Mixed entries (with regular senses too)
-            # are preserved. Adjective allomorphs are later imported via import_adjective_allomorphs().
-            if pos_filter in (POS.ADJECTIVE, POS.NOUN) and _is_pure_alt_form_entry(entry):
-                stats["alt_forms_skipped"] += 1
-                continue
+        # Filter out lemmas with malformed Wiktextract data (applies to all POS)
+        if _is_blocklisted_lemma(entry):
+            stats["blocklisted_lemmas"] += 1
+            continue
 
-            # Only import lemmas, not form entries
-            if not _is_pos_lemma(entry, wiktextract_pos):
-                stats["skipped"] += 1
-                continue
+        # Filter out PURE alt-of entries for adjectives and nouns
+        # These are alternative spellings, apocopic forms, archaic variants, etc.
+        # that shouldn't be separate lemmas. Mixed entries (with regular senses too)
+        # are preserved. Adjective allomorphs are later imported via import_adjective_allomorphs().
+        if pos_filter in (POS.ADJECTIVE, POS.NOUN) and _is_pure_alt_form_entry(entry):
+            stats["alt_forms_skipped"] += 1
+            continue
 
-            # Extract lemma data
-            word = entry["word"]
-            lemma_stressed = _extract_lemma_stressed(entry)
+        # Only import lemmas, not form entries
+        if not _is_pos_lemma(entry, wiktextract_pos):
+            stats["skipped"] += 1
+            continue
 
-            # For nouns: skip known duplicate plural lemmas
-            if pos_filter == POS.NOUN and lemma_stressed in SKIP_PLURAL_NOUN_LEMMAS:
-                stats["skipped_plural_duplicate"] += 1
-                continue
+        # Extract lemma data
+        word = entry["word"]
+        lemma_stressed = _extract_lemma_stressed(entry)
+        # Bound once per entry; the empty tuple avoids allocating a default list
+        entry_forms: list[dict[str, Any]] | tuple[()] = entry.get("forms") or ()
 
-            # For nouns: pre-check gender info before inserting lemma
-            # Skip entries that would result in zero forms (incomplete Wiktionary entries)
-            noun_class: dict[str, Any] | None = None
-            if pos_filter == POS.NOUN:
-                noun_class = _extract_noun_classification(entry)
-                gender_class = noun_class.get("gender_class")
-                # If no gender from classification, try fallback extraction
-                if gender_class is None and _extract_gender(entry) is None:
-                    stats["nouns_skipped_no_gender"] += 1
-                    continue
+        # For nouns: skip known duplicate plural lemmas
+        if pos_filter == POS.NOUN and lemma_stressed in SKIP_PLURAL_NOUN_LEMMAS:
+            stats["skipped_plural_duplicate"] += 1
+            continue
 
-            # Insert lemma (no unique constraint - homographs create separate entries)
-            result = conn.execute(
-                lemmas.insert().values(
-                    written=None,  # Will be filled by enrich_lemma_written()
-                    written_source=None,
-                    stressed=lemma_stressed,
-                    pos=pos_filter,
-                    ipa=_extract_ipa(entry),
-                )
-            )
-            pk = result.inserted_primary_key
-            if pk is None:
+        # For nouns: pre-check gender info before inserting lemma
+        # Skip entries that would result in zero forms (incomplete Wiktionary entries)
+        noun_class: dict[str, Any] | None = None
+        if pos_filter == POS.NOUN:
+            noun_class = _extract_noun_classification(entry)
+            gender_class = noun_class.get("gender_class")
+            # If no gender from classification, try fallback extraction
+            if gender_class is None and noun_class["fallback_gender"] is None:
+                stats["nouns_skipped_no_gender"] += 1
                 continue
-            lemma_id: int = pk[0]
-            stats["lemmas"] += 1
-
-            # Insert POS-specific metadata
-            lemma_gender: str | None = None
-            if pos_filter == POS.NOUN:
-                # noun_class was already extracted in the pre-check above
-                assert noun_class is not None
-                gender_class = noun_class.get("gender_class")
-                number_class = noun_class.get("number_class", "standard")
-                number_class_source = noun_class.get("number_class_source", "default")
-
-                if gender_class is None:
-                    # No structured classification, but we have gender from fallback extraction
-                    # (otherwise we would have skipped this entry in the pre-check)
-                    lemma_gender = _extract_gender(entry)
-                else:
-                    # Insert noun_metadata
-                    conn.execute(
-                        noun_metadata.insert().values(
-                            lemma_id=lemma_id,
-                            gender_class=gender_class,
-                            number_class=number_class,
-                            number_class_source=number_class_source,
-                        )
-                    )
-                    # Set lemma_gender for form generation (fallback for forms without explicit gender)
-                    if gender_class in (GenderClass.M, GenderClass.F):
-                        lemma_gender = gender_class
-                    elif gender_class == GenderClass.COMMON_GENDER_FIXED:
-                        # For fixed common gender (BY_SENSE), same form for both - no default needed
-                        lemma_gender = None
-                    elif gender_class == GenderClass.COMMON_GENDER_VARIABLE:
-                        # For variable common gender (amico/amica), the lemma has a specific gender
-                        # that tells us which gender untagged forms belong to
-                        lemma_gender = _extract_gender(entry)
-
-            # For nouns: extract plural qualifiers and set up meaning_hint tracking
-            plural_qualifiers: dict[str, tuple[str | None, str | None]] = {}
-            form_meaning_hints: dict[str, str] = {}  # form_text -> meaning_hint
-            synthesize_plurals: list[tuple[str, str, str]] = []  # (form, gender, hint)
 
-            if pos_filter == POS.NOUN:
-                # Extract qualifiers from head_templates (e.g., braccia<g:f><q:anatomical>)
-                plural_qualifiers = _extract_plural_qualifiers(entry)
-
-                # Check if lemma is in DEFINITION_FORM_LINKAGE for meaning-dependent plurals
-                if word in DEFINITION_FORM_LINKAGE:
-                    linkage = DEFINITION_FORM_LINKAGE[word]
-                    # Create meaning_hint lookup from the linkage keys (plural forms)
-                    # Use the form text itself as the hint (simple, stable)
-                    form_meaning_hints = {form_text: form_text for form_text in linkage}
-
-                    # Check if we need to synthesize plurals (forms only in head_templates)
-                    # Only count forms that would actually be imported (not filtered)
-                    forms_in_array = {
-                        f.get("form", "")
-                        for f in entry.get("forms", [])
-                        if "plural" in f.get("tags", [])
-                        and not should_filter_form(f.get("tags", []))
-                    }
-                    for form_text, (gender, _qualifier) in plural_qualifiers.items():
-                        if form_text not in forms_in_array and form_text != "+" and gender:
-                            # This plural is only in head_templates, needs synthesis
-                            synthesize_plurals.append(
-                                (form_text, gender, form_meaning_hints.get(form_text, ""))
-                            )
+        # Insert lemma (no unique constraint - homographs create separate entries)
+        result = conn.execute(
+            lemmas.insert().values(
+                written=None,  # Will be filled by enrich_lemma_written()
+                written_source=None,
+                stressed=lemma_stressed,
+                pos=pos_filter,
+                ipa=_extract_ipa(entry),
+            )
+        )
+        pk = result.inserted_primary_key
+        if pk is None:
+            continue
+        lemma_id: int = pk[0]
+        stats["lemmas"] += 1
 
-            elif pos_filter == POS.VERB:
-                auxiliary = _extract_auxiliary(entry)
-                transitivity = _extract_transitivity(entry)
-                # Always insert verb_metadata so we have a row to update
-                # for pronominal verb linking in post-processing
+        # Insert POS-specific metadata
+        lemma_gender: str | None = None
+        if pos_filter == POS.NOUN:
+            # noun_class was already extracted in the pre-check above
+            assert noun_class is not None
+            gender_class = noun_class.get("gender_class")
+            number_class = noun_class.get("number_class", "standard")
+            number_class_source = noun_class.get("number_class_source", "default")
+
+            if gender_class is None:
+                # No structured classification, but we have gender from fallback extraction
+                # (otherwise we would have skipped this entry in the pre-check)
+                lemma_gender = noun_class["fallback_gender"]
+            else:
+                # Insert noun_metadata
                 conn.execute(
-                    verb_metadata.insert().values(
+                    noun_metadata.insert().values(
                         lemma_id=lemma_id,
-                        auxiliary=auxiliary,
-                        transitivity=transitivity,
-                        # base_verb_lemma_id and pronominal_type are populated
-                        # in post-processing after all verbs are inserted
+                        gender_class=gender_class,
+                        number_class=number_class,
+                        number_class_source=number_class_source,
                     )
                 )
+                # Set lemma_gender for form generation (fallback for forms without explicit gender)
+                if gender_class in (GenderClass.M, GenderClass.F):
+                    lemma_gender = gender_class
+                elif gender_class == GenderClass.COMMON_GENDER_FIXED:
+                    # For fixed common gender (BY_SENSE), same form for both - no default needed
+                    lemma_gender = None
+                elif gender_class == GenderClass.COMMON_GENDER_VARIABLE:
+                    # For variable common gender (amico/amica), the lemma has a specific gender
+                    # that tells us which gender untagged forms belong to
+                    lemma_gender = noun_class["fallback_gender"]
+
+        # For nouns: extract plural qualifiers and set up meaning_hint tracking
+        plural_qualifiers: dict[str, tuple[str | None, str | None]] = {}
+        # Linkage plurals double as their own meaning_hint (simple, stable)
+        meaning_hint_forms: frozenset[str] = frozenset()
+        synthesize_plurals: list[tuple[str, str, str]] = []  # (form, gender, hint)
+        # Explicit gender-tagged plurals from this entry
+        # (used to avoid duplicating untagged plurals when explicit ones exist)
+        explicit_fem_plurals: set[str] = set()
+        explicit_masc_plurals: set[str] = set()
 
-            elif pos_filter == POS.ADJECTIVE:
-                # Insert adjective metadata with inflection class
-                inflection_class = _get_adjective_inflection_class(entry)
-                conn.execute(
-                    adjective_metadata.insert().values(
-                        lemma_id=lemma_id,
-                        inflection_class=inflection_class,
-                        # base_lemma_id, degree_relationship are populated
-                        # in post-processing after all lemmas are inserted
-                    )
+        if pos_filter == POS.NOUN:
+            # Extract qualifiers from head_templates (e.g., braccia<g:f><q:anatomical>)
+            plural_qualifiers = _extract_plural_qualifiers(entry)
+            forms_in_array, explicit_fem_plurals, explicit_masc_plurals = _scan_noun_plurals(
+                entry_forms
+            )
+
+            # Check if lemma is in DEFINITION_FORM_LINKAGE for meaning-dependent plurals
+            if word in DEFINITION_FORM_LINKAGE:
+                meaning_hint_forms = frozenset(DEFINITION_FORM_LINKAGE[word])
+
+                # Check if we need to synthesize plurals (forms only in head_templates)
+                # Only count forms that would actually be imported (not filtered)
+                for form_text, (gender, _qualifier) in plural_qualifiers.items():
+                    if form_text not in forms_in_array and form_text != "+" and gender:
+                        # This plural is only in head_templates, needs synthesis
+                        synthesize_plurals.append(
+                            (
+                                form_text,
+                                gender,
+                                form_text if form_text in meaning_hint_forms else "",
+                            )
+                        )
+
+        elif pos_filter == POS.VERB:
+            auxiliary = _extract_auxiliary(entry)
+            transitivity = _extract_transitivity(entry)
+            # Always insert verb_metadata so we have a row to update
+            # for pronominal verb linking in post-processing
+            conn.execute(
+                verb_metadata.insert().values(
+                    lemma_id=lemma_id,
+                    auxiliary=auxiliary,
+                    transitivity=transitivity,
+                    # base_verb_lemma_id and pronominal_type are populated
+                    # in post-processing after all verbs are inserted
                 )
+            )
 
-                # Collect comparative/superlative relationships for post-processing
-                degree_info = _extract_degree_relationship(entry)
-                if degree_info:
-                    base_word, relationship, source = degree_info
-                    degree_links.append((lemma_id, base_word, relationship, source))
-
-            # Queue forms for batch insert (using POS-specific builder)
-            # Track base form number/gender combinations for nouns (excludes diminutives,
-            # augmentatives, pejoratives to avoid blocking base form inference)
-            seen_base_forms: set[tuple[str, str]] = set()  # (number, gender)
-
-            # Track if we've already marked a citation form for verbs (avoid duplicates
-            # when multiple infinitive variants exist, e.g., chièdere / chiédere)
-            verb_citation_marked = False
-
-            # Track if we've already marked a citation form for adjectives (for feminine-only
-            # adjectives like 'incinta' where f/s should be the citation form)
-            adj_citation_marked = False
-
-            # Pre-scan for adjectives: check if masculine singular will exist
-            # This determines whether m/s or f/s should be the citation form.
-            # Key insight: m/s will ALWAYS exist unless the adjective is feminine-only,
-            # because _iter_forms() adds the lemma word as m/s via base form inference.
-            # For feminine-only adjectives (like "incinta"), only f/s exists.
-            adj_has_masc_singular = pos_filter == POS.ADJECTIVE and not _is_feminine_only_adjective(
-                entry
+        elif pos_filter == POS.ADJECTIVE:
+            # Insert adjective metadata with inflection class
+            inflection_class = _get_adjective_inflection_class(entry)
+            conn.execute(
+                adjective_metadata.insert().values(
+                    lemma_id=lemma_id,
+                    inflection_class=inflection_class,
+                    # base_lemma_id, degree_relationship are populated
+                    # in post-processing after all lemmas are inserted
+                )
             )
 
-            # Pre-scan: collect explicit gender-tagged plurals from this entry
-            # (used to avoid duplicating untagged plurals when explicit ones exist)
-            explicit_fem_plurals: set[str] = set()
-            explicit_masc_plurals: set[str] = set()
+            # Collect comparative/superlative relationships for post-processing
+            degree_info = _extract_degree_relationship(entry)
+            if degree_info:
+                base_word, relationship, source = degree_info
+                degree_links.append((lemma_id, base_word, relationship, source))
+
+        # Queue forms for batch insert (using POS-specific builder)
+        # Track base form number/gender combinations for nouns (excludes diminutives,
+        # augmentatives, pejoratives to avoid blocking base form inference)
+        seen_base_forms: set[tuple[str, str]] = set()  # (number, gender)
+
+        # Track if we've already marked a citation form for verbs (avoid duplicates
+        # when multiple infinitive variants exist, e.g., chièdere / chiédere)
+        verb_citation_marked = False
+
+        # Track if we've already marked a citation form for adjectives (for feminine-only
+        # adjectives like 'incinta' where f/s should be the citation form)
+        adj_citation_marked = False
+
+        # Pre-scan for adjectives: check if masculine singular will exist
+        # This determines whether m/s or f/s should be the citation form.
+        # Key insight: m/s will ALWAYS exist unless the adjective is feminine-only,
+        # because _collect_forms() adds the lemma word as m/s via base form inference.
+        # For feminine-only adjectives (like "incinta"), only f/s exists.
+        adj_has_masc_singular = pos_filter == POS.ADJECTIVE and not _is_feminine_only_adjective(
+            entry
+        )
+
+        # Per-entry noun classification, constant across the form loop below
+        loop_number_class = noun_class.get("number_class", "standard") if noun_class else "standard"
+        loop_gender_class = noun_class.get("gender_class") if noun_class else None
+        is_pluralia_tantum = loop_number_class == "pluralia_tantum"
+        is_common_gender = loop_gender_class in _COMMON_GENDER_CLASSES
+        is_variable_gender = loop_gender_class == GenderClass.COMMON_GENDER_VARIABLE
+        # For variable-gender nouns: lemma_gender is the gender of untagged plurals
+        # ("m" for amico, "f" for nonna), so the other gender is the counterpart's
+        own_gender = lemma_gender
+        other_gender = "f" if lemma_gender == "m" else "m"
+        explicit_other_plurals = (
+            explicit_fem_plurals if other_gender == "f" else explicit_masc_plurals
+        )
+        # Form blocklists are keyed by lemma, so entries without one skip the
+        # per-form check and the written-form derivation it needs
+        has_noun_blocklist = pos_filter == POS.NOUN and word in BLOCKED_NOUN_FORMS_GENDERED
+        adj_lemma_written = (
+            derive_written_from_stressed(lemma_stressed) if pos_filter == POS.ADJECTIVE else None
+        )
+        has_adj_blocklist = adj_lemma_written is not None and (
+            adj_lemma_written in BLOCKED_ADJECTIVE_FORMS
+            or adj_lemma_written in BLOCKED_ADJECTIVE_FORMS_GENDERED
+        )
+
+        for form_stressed, tags, tag_set, form_origin in _collect_forms(
+            entry, pos_filter, stressed_alternatives
+        ):
             if pos_filter == POS.NOUN:
-                for form_data in entry.get("forms", []):
-                    form_text = form_data.get("form", "")
-                    form_tags = form_data.get("tags", [])
-                    if "plural" in form_tags:
-                        if "feminine" in form_tags:
-                            explicit_fem_plurals.add(form_text)
-                        if "masculine" in form_tags:
-                            explicit_masc_plurals.add(form_text)
-
-            for form_stressed, tags, form_origin in _iter_forms(
-                entry, pos_filter, stressed_alternatives
-            ):
-                if pos_filter == POS.NOUN:
-                    # Get number_class for citation form determination
-                    loop_number_class = (
-                        noun_class.get("number_class", "standard") if noun_class else "standard"
-                    )
+                # Skip singular forms for pluralia tantum nouns
+                if is_pluralia_tantum and "singular" in tag_set:
+                    continue
 
-                    # Skip singular forms for pluralia tantum nouns
-                    is_pluralia_tantum = loop_number_class == "pluralia_tantum"
-                    if is_pluralia_tantum and "singular" in tags:
-                        continue
+                meaning_hint = form_stressed if form_stressed in meaning_hint_forms else None
 
-                    # Check blocklist for erroneous noun forms
+                # Check blocklist for erroneous noun forms
+                if has_noun_blocklist:
                     form_gender_for_blocklist = (
-                        "m" if "masculine" in tags else ("f" if "feminine" in tags else None)
+                        "m" if "masculine" in tag_set else ("f" if "feminine" in tag_set else None)
                     )
-                    form_number_for_blocklist = "plural" if "plural" in tags else "singular"
+                    form_number_for_blocklist = "plural" if "plural" in tag_set else "singular"
                     form_written_for_blocklist = (
                         derive_written_from_stressed(form_stressed) or form_stressed
                     )
@@ -2811,133 +3002,99 @@ def import_wiktextract(
                         stats["noun_forms_blocked"] += 1
                         continue
 
-                    # Check if this is a common gender noun without explicit gender in tags
-                    has_gender_tag = "masculine" in tags or "feminine" in tags
-                    is_common_gender = noun_class and noun_class.get("gender_class") in (
-                        GenderClass.COMMON_GENDER_FIXED,
-                        GenderClass.COMMON_GENDER_VARIABLE,
-                        GenderClass.BY_SENSE,
-                    )
-
-                    if is_common_gender and not has_gender_tag:
-                        # For common_gender nouns without explicit gender tags:
-                        # - COMMON_GENDER_FIXED/BY_SENSE: same form works for both genders
-                        # - COMMON_GENDER_VARIABLE: different forms for m/f (need counterpart lookup)
-                        gender_class = noun_class.get("gender_class") if noun_class else None
-                        is_variable_gender = gender_class == GenderClass.COMMON_GENDER_VARIABLE
-
-                        if is_variable_gender and "plural" in tags:
-                            # Smart handling for variable-gender nouns (e.g., amico/amica)
-                            # Guard: need lemma_gender to determine which gender this belongs to
-                            if not lemma_gender:
-                                logger.warning(
-                                    f"Noun '{word}' is GenderClass.COMMON_GENDER_VARIABLE with untagged "
-                                    f"plural '{form_stressed}' but has no lemma gender. Skipping."
-                                )
-                                continue
-
-                            # Determine which gender this untagged plural belongs to
-                            own_gender = lemma_gender  # "m" for amico, "f" for nonna
-                            other_gender = "f" if lemma_gender == "m" else "m"
+                # Check if this is a common gender noun without explicit gender in tags
+                has_gender_tag = "masculine" in tag_set or "feminine" in tag_set
+
+                if is_common_gender and not has_gender_tag:
+                    # For common_gender nouns without explicit gender tags:
+                    # - COMMON_GENDER_FIXED/BY_SENSE: same form works for both genders
+                    # - COMMON_GENDER_VARIABLE: different forms for m/f (need counterpart lookup)
+                    if is_variable_gender and "plural" in tag_set:
+                        # Smart handling for variable-gender nouns (e.g., amico/amica)
+                        # Guard: need lemma_gender to determine which gender this belongs to
+                        if not lemma_gender:
+                            logger.warning(
+                                f"Noun '{word}' is GenderClass.COMMON_GENDER_VARIABLE with untagged "
+                                f"plural '{form_stressed}' but has no lemma gender. Skipping."
+                            )
+                            continue
 
-                            # Check if entry has explicit plural for the other gender
-                            has_explicit_other_plural = (
-                                explicit_fem_plurals
-                                if other_gender == "f"
-                                else explicit_masc_plurals
+                        # Check if entry has explicit plural for the other gender
+                        if explicit_other_plurals:
+                            # Case A: Entry has explicit other-gender plural (e.g., "dio" has "dee")
+                            # Treat untagged plural as own-gender-only
+                            row = _build_noun_form_row(
+                                lemma_id,
+                                form_stressed,
+                                tags,
+                                own_gender,
+                                meaning_hint=meaning_hint,
                             )
+                            if row:
+                                add_form(row)
+                                if _is_trackable_base_form(row, tags):
+                                    seen_base_forms.add(("plural", own_gender))
+                            else:
+                                stats["forms_filtered"] += 1
+                            continue
 
-                            if has_explicit_other_plural:
-                                # Case A: Entry has explicit other-gender plural (e.g., "dio" has "dee")
-                                # Treat untagged plural as own-gender-only
-                                row = _build_noun_form_row(
-                                    lemma_id,
-                                    form_stressed,
-                                    tags,
-                                    own_gender,
-                                    meaning_hint=form_meaning_hints.get(form_stressed),
-                                )
-                                if row:
-                                    add_form(row)
-                                    if _is_trackable_base_form(row, tags):
-                                        seen_base_forms.add(("plural", own_gender))
+                        # Case B: Try counterpart lookup (e.g., "amico" → "amica" → "amiche")
+                        counterpart = _get_counterpart_form(entry, lemma_gender)
+                        if counterpart and counterpart_plurals:
+                            if counterpart in counterpart_plurals:
+                                other_plural, counterpart_gender = counterpart_plurals[counterpart]
+                                # Verify counterpart has expected gender (some Wiktextract
+                                # entries have wrong gender, e.g., "maialina" marked as "m")
+                                if counterpart_gender != other_gender:
+                                    # Wrong gender - can't trust this plural
+                                    # Fall through to Case C handling
+                                    stats["counterpart_wrong_gender"] += 1
                                 else:
-                                    stats["forms_filtered"] += 1
-                                continue
-
-                            # Case B: Try counterpart lookup (e.g., "amico" → "amica" → "amiche")
-                            counterpart = _get_counterpart_form(entry, lemma_gender)
-                            if counterpart and counterpart_plurals:
-                                if counterpart in counterpart_plurals:
-                                    other_plural, counterpart_gender = counterpart_plurals[
-                                        counterpart
-                                    ]
-                                    # Verify counterpart has expected gender (some Wiktextract
-                                    # entries have wrong gender, e.g., "maialina" marked as "m")
-                                    if counterpart_gender != other_gender:
-                                        # Wrong gender - can't trust this plural
-                                        # Fall through to Case C handling
-                                        stats["counterpart_wrong_gender"] += 1
+                                    # Generate own gender with this form
+                                    row = _build_noun_form_row(
+                                        lemma_id,
+                                        form_stressed,
+                                        tags,
+                                        own_gender,
+                                        meaning_hint=meaning_hint,
+                                    )
+                                    if row:
+                                        add_form(row)
+                                        if _is_trackable_base_form(row, tags):
+                                            seen_base_forms.add(("plural", own_gender))
                                     else:
-                                        # Generate own gender with this form
-                                        row = _build_noun_form_row(
-                                            lemma_id,
-                                            form_stressed,
-                                            tags,
-                                            own_gender,
-                                            meaning_hint=form_meaning_hints.get(form_stressed),
-                                        )
-                                        if row:
-                                            add_form(row)
-                                            if _is_trackable_base_form(row, tags):
-                                                seen_base_forms.add(("plural", own_gender))
-                                        else:
-                                            stats["forms_filtered"] += 1
-
-                                        # Generate other gender with looked-up plural
-                                        row = _build_noun_form_row(
-                                            lemma_id,
-                                            other_plural,
-                                            tags,
-                                            other_gender,
-                                            meaning_hint=form_meaning_hints.get(other_plural),
-                                        )
-                                        if row:
-                                            add_form(row)
-                                            if _is_trackable_base_form(row, tags):
-                                                seen_base_forms.add(("plural", other_gender))
-                                        else:
-                                            stats["forms_filtered"] += 1
-                                        continue
-                                # Case C: Counterpart not in lookup, or wrong gender
-                                # (aggregated - logged at end of import)
-                                # Only create own-gender plural; let enrichment handle other
-                                if counterpart not in counterpart_plurals:
-                                    stats["counterpart_no_plural"] += 1
-                                row = _build_noun_form_row(
-                                    lemma_id,
-                                    form_stressed,
-                                    tags,
-                                    own_gender,
-                                    meaning_hint=form_meaning_hints.get(form_stressed),
-                                )
-                                if row:
-                                    add_form(row)
-                                    if _is_trackable_base_form(row, tags):
-                                        seen_base_forms.add(("plural", own_gender))
-                                else:
-                                    stats["forms_filtered"] += 1
-                                continue
-
-                            # Case D: Plural but no counterpart info - use own gender only
+                                        stats["forms_filtered"] += 1
+
+                                    # Generate other gender with looked-up plural
+                                    row = _build_noun_form_row(
+                                        lemma_id,
+                                        other_plural,
+                                        tags,
+                                        other_gender,
+                                        meaning_hint=(
+                                            other_plural
+                                            if other_plural in meaning_hint_forms
+                                            else None
+                                        ),
+                                    )
+                                    if row:
+                                        add_form(row)
+                                        if _is_trackable_base_form(row, tags):
+                                            seen_base_forms.add(("plural", other_gender))
+                                    else:
+                                        stats["forms_filtered"] += 1
+                                    continue
+                            # Case C: Counterpart not in lookup, or wrong gender
                             # (aggregated - logged at end of import)
-                            stats["no_counterpart_no_gender"] += 1
+                            # Only create own-gender plural; let enrichment handle other
+                            if counterpart not in counterpart_plurals:
+                                stats["counterpart_no_plural"] += 1
                             row = _build_noun_form_row(
                                 lemma_id,
                                 form_stressed,
                                 tags,
                                 own_gender,
-                                meaning_hint=form_meaning_hints.get(form_stressed),
+                                meaning_hint=meaning_hint,
                             )
                             if row:
                                 add_form(row)
@@ -2947,276 +3104,231 @@ def import_wiktextract(
                                 stats["forms_filtered"] += 1
                             continue
 
-                        else:
-                            # For fixed-gender nouns (GenderClass.BY_SENSE) or non-plural forms:
-                            # duplicate for both genders with same form
-                            # Only mark first gender (m) as citation form to avoid duplicates
-                            citation_marked = False
-                            for gender in ("m", "f"):
-                                is_citation = not citation_marked and _is_noun_citation_form(
-                                    form_stressed, tags, lemma_stressed, loop_number_class
-                                )
-                                row = _build_noun_form_row(
-                                    lemma_id,
-                                    form_stressed,
-                                    tags,
-                                    gender,
-                                    meaning_hint=form_meaning_hints.get(form_stressed),
-                                    is_citation_form=is_citation,
-                                )
-                                if row is None:
-                                    stats["forms_filtered"] += 1
-                                    continue
-                                if is_citation:
-                                    citation_marked = True
-                                add_form(row)
-                                if _is_trackable_base_form(row, tags):
-                                    number = "plural" if "plural" in tags else "singular"
-                                    seen_base_forms.add((number, gender))
-                    else:
+                        # Case D: Plural but no counterpart info - use own gender only
+                        # (aggregated - logged at end of import)
+                        stats["no_counterpart_no_gender"] += 1
                         row = _build_noun_form_row(
                             lemma_id,
                             form_stressed,
                             tags,
-                            lemma_gender,
-                            meaning_hint=form_meaning_hints.get(form_stressed),
-                            is_citation_form=_is_noun_citation_form(
-                                form_stressed, tags, lemma_stressed, loop_number_class
-                            ),
+                            own_gender,
+                            meaning_hint=meaning_hint,
                         )
-                        if row is None:
+                        if row:
+                            add_form(row)
+                            if _is_trackable_base_form(row, tags):
+                                seen_base_forms.add(("plural", own_gender))
+                        else:
                             stats["forms_filtered"] += 1
-                            continue
-                        add_form(row)
-                        if _is_trackable_base_form(row, tags):
-                            number = "plural" if "plural" in tags else "singular"
-                            gender = (
-                                "m"
-                                if "masculine" in tags
-                                else ("f" if "feminine" in tags else lemma_gender)
+                        continue
+
+                    else:
+                        # For fixed-gender nouns (GenderClass.BY_SENSE) or non-plural forms:
+                        # duplicate for both genders with same form
+                        # Only mark first gender (m) as citation form to avoid duplicates
+                        citation_marked = False
+                        for gender in ("m", "f"):
+                            is_citation = not citation_marked and _is_noun_citation_form(
+                                form_stressed, tags, lemma_stressed, loop_number_class
+                            )
+                            row = _build_noun_form_row(
+                                lemma_id,
+                                form_stressed,
+                                tags,
+                                gender,
+                                meaning_hint=meaning_hint,
+                                is_citation_form=is_citation,
                             )
-                            if gender:
+                            if row is None:
+                                stats["forms_filtered"] += 1
+                                continue
+                            if is_citation:
+                                citation_marked = True
+                            add_form(row)
+                            if _is_trackable_base_form(row, tags):
+                                number = "plural" if "plural" in tag_set else "singular"
                                 seen_base_forms.add((number, gender))
                 else:
-                    # Pass form_origin to all POS form builders
-                    if pos_filter == POS.ADJECTIVE:
-                        # Extract gender/number from tags for blocklist check
-                        form_gender = (
-                            "m" if "masculine" in tags else ("f" if "feminine" in tags else None)
-                        )
-                        form_number = "plural" if "plural" in tags else "singular"
-
-                        # Check blocklist for archaic/erroneous adjective forms
-                        lemma_written = derive_written_from_stressed(lemma_stressed)
-                        form_written = derive_written_from_stressed(form_stressed) or form_stressed
-                        if (
-                            lemma_written
-                            and form_gender
-                            and is_blocked_adjective_form(
-                                lemma_written, form_written, form_gender, form_number
-                            )
-                        ):
-                            stats["adjective_forms_blocked"] += 1
-                            continue
-
-                        # Citation form: m/s for standard adjectives, f/s only for feminine-only
-                        is_masc_singular = form_gender == "m" and form_number == "singular"
-                        is_fem_singular = form_gender == "f" and form_number == "singular"
-
-                        # Only mark m/s as citation, OR f/s if this is a feminine-only adjective
-                        is_adj_citation = (is_masc_singular and not adj_citation_marked) or (
-                            is_fem_singular
-                            and not adj_has_masc_singular
-                            and not adj_citation_marked
-                        )
-
-                        row = _build_adjective_form_row(
-                            lemma_id,
-                            form_stressed,
-                            tags,
-                            form_origin=form_origin,
-                            is_citation_form=is_adj_citation,
-                        )
-                        if row and is_adj_citation:
-                            adj_citation_marked = True
-                    elif pos_filter == POS.VERB:
-                        # Citation form is infinitive (tagged as "infinitive" or "canonical")
-                        # Only mark first infinitive to avoid duplicates for stress variants
-                        is_infinitive = "infinitive" in tags or "canonical" in tags
-                        is_verb_citation = is_infinitive and not verb_citation_marked
-                        row = _build_verb_form_row(
-                            lemma_id,
-                            form_stressed,
-                            tags,
-                            form_origin=form_origin,
-                            is_citation_form=is_verb_citation,
-                        )
-                        if row and is_verb_citation:
-                            verb_citation_marked = True
-                    else:
-                        row = build_form_row(lemma_id, form_stressed, tags)
+                    row = _build_noun_form_row(
+                        lemma_id,
+                        form_stressed,
+                        tags,
+                        lemma_gender,
+                        meaning_hint=meaning_hint,
+                        is_citation_form=_is_noun_citation_form(
+                            form_stressed, tags, lemma_stressed, loop_number_class
+                        ),
+                    )
                     if row is None:
                         stats["forms_filtered"] += 1
                         continue
                     add_form(row)
+                    if _is_trackable_base_form(row, tags):
+                        number = "plural" if "plural" in tag_set else "singular"
+                        gender = (
+                            "m"
+                            if "masculine" in tag_set
+                            else ("f" if "feminine" in tag_set else lemma_gender)
+                        )
+                        if gender:
+                            seen_base_forms.add((number, gender))
+            else:
+                # Pass form_origin to all POS form builders
+                if pos_filter == POS.ADJECTIVE:
+                    # Extract gender/number from tags for blocklist check
+                    form_gender = (
+                        "m" if "masculine" in tag_set else ("f" if "feminine" in tag_set else None)
+                    )
+                    form_number = "plural" if "plural" in tag_set else "singular"
+
+                    # Check blocklist for archaic/erroneous adjective forms
+                    if (
+                        has_adj_blocklist
+                        and adj_lemma_written
+                        and form_gender
+                        and is_blocked_adjective_form(
+                            adj_lemma_written,
+                            derive_written_from_stressed(form_stressed) or form_stressed,
+                            form_gender,
+                            form_number,
+                        )
+                    ):
+                        stats["adjective_forms_blocked"] += 1
+                        continue
 
-                if len(form_batch) >= batch_size:
-                    flush_batches()
+                    # Citation form: m/s for standard adjectives, f/s only for feminine-only
+                    is_masc_singular = form_gender == "m" and form_number == "singular"
+                    is_fem_singular = form_gender == "f" and form_number == "singular"
 
-            # For nouns: synthesize plurals from head_templates (braccio-type cases)
-            # These are forms that only exist in head_templates, not in the forms array
-            if pos_filter == POS.NOUN and synthesize_plurals:
-                for form_text, gender, hint in synthesize_plurals:
-                    if ("plural", gender) not in seen_base_forms:
-                        row = _build_noun_form_row(
-                            lemma_id,
-                            form_text,
-                            ["plural"],
-                            gender,
-                            meaning_hint=hint if hint else None,
-                            written_source="synthesized",
-                            form_origin="inferred:head_template",
-                        )
-                        if row:
-                            add_form(row)
-                            seen_base_forms.add(("plural", gender))
-
-            # For nouns: add base form from lemma word if not already present
-            # The lemma word is always the base form (singular for regular, plural for pluralia tantum)
-            if pos_filter == POS.NOUN and noun_class:
-                number_class = noun_class.get("number_class", "standard")
-                gender_class = noun_class.get("gender_class")
-                is_pluralia_tantum = number_class == "pluralia_tantum"
-                base_number = "plural" if is_pluralia_tantum else "singular"
-
-                is_common_gender = gender_class in (
-                    GenderClass.COMMON_GENDER_FIXED,
-                    GenderClass.COMMON_GENDER_VARIABLE,
-                    GenderClass.BY_SENSE,
-                )
+                    # Only mark m/s as citation, OR f/s if this is a feminine-only adjective
+                    is_adj_citation = (is_masc_singular and not adj_citation_marked) or (
+                        is_fem_singular and not adj_has_masc_singular and not adj_citation_marked
+                    )
 
-                if is_common_gender:
-                    # Add base form for both genders if not already present
-                    # Only mark as citation if no citation form was added in main loop
-                    has_existing_citation = any(
-                        f.get("is_citation_form")
-                        for f in form_batch
-                        if f.get("lemma_id") == lemma_id
+                    row = _build_adjective_form_row(
+                        lemma_id,
+                        form_stressed,
+                        tags,
+                        form_origin=form_origin,
+                        is_citation_form=is_adj_citation,
                     )
-                    citation_marked = has_existing_citation
-                    for gender in ("m", "f"):
-                        if (base_number, gender) not in seen_base_forms:
-                            row = _build_noun_form_row(
-                                lemma_id,
-                                lemma_stressed,
-                                [base_number],
-                                gender,
-                                form_origin="inferred:base_form",
-                                is_citation_form=not citation_marked,
-                            )
-                            if row:
-                                add_form(row)
-                                citation_marked = True
-                elif lemma_gender and (base_number, lemma_gender) not in seen_base_forms:
-                    # Add base form for single gender if not already present
-                    # Only mark as citation if no citation form was added in main loop
-                    has_existing_citation = any(
-                        f.get("is_citation_form")
-                        for f in form_batch
-                        if f.get("lemma_id") == lemma_id
+                    if row and is_adj_citation:
+                        adj_citation_marked = True
+                elif pos_filter == POS.VERB:
+                    # Citation form is infinitive (tagged as "infinitive" or "canonical")
+                    # Only mark first infinitive to avoid duplicates for stress variants
+                    is_infinitive = "infinitive" in tag_set or "canonical" in tag_set
+                    is_verb_citation = is_infinitive and not verb_citation_marked
+                    row = _build_verb_form_row(
+                        lemma_id,
+                        form_stressed,
+                        tags,
+                        form_origin=form_origin,
+                        is_citation_form=is_verb_citation,
                     )
+                    if row and is_verb_citation:
+                        verb_citation_marked = True
+                else:
+                    row = build_form_row(lemma_id, form_stressed, tags)
+                if row is None:
+                    stats["forms_filtered"] += 1
+                    continue
+                add_form(row)
+
+            if len(form_batch) >= batch_size:
+                flush_batches()
+
+        # For nouns: synthesize plurals from head_templates (braccio-type cases)
+        # These are forms that only exist in head_templates, not in the forms array
+        if pos_filter == POS.NOUN and synthesize_plurals:
+            for form_text, gender, hint in synthesize_plurals:
+                if ("plural", gender) not in seen_base_forms:
+                    row = _build_noun_form_row(
+                        lemma_id,
+                        form_text,
+                        ["plural"],
+                        gender,
+                        meaning_hint=hint if hint else None,
+                        written_source="synthesized",
+                        form_origin="inferred:head_template",
+                    )
+                    if row:
+                        add_form(row)
+                        seen_base_forms.add(("plural", gender))
+
+        # For nouns: add base form from lemma word if not already present
+        # The lemma word is always the base form (singular for regular, plural for pluralia
+        # tantum). Invariable nouns also get a plural with the same text (similar to how
+        # invariable adjectives get all 4 gender/number forms).
+        if pos_filter == POS.NOUN and noun_class:
+            base_number = "plural" if is_pluralia_tantum else "singular"
+            wanted_numbers = [(base_number, "inferred:base_form")]
+            if loop_number_class == "invariable":
+                wanted_numbers.append(("plural", "inferred:invariable"))
+            # Common gender nouns get both genders; others only the lemma's own gender
+            if is_common_gender:
+                wanted_genders: tuple[str, ...] = ("m", "f")
+            elif lemma_gender:
+                wanted_genders = (lemma_gender,)
+            else:
+                wanted_genders = ()
+
+            # Only mark a base form as citation if none was added in the main loop
+            citation_marked = _batch_has_citation_form(lemma_id)
+            for number, inferred_origin in wanted_numbers:
+                for gender in wanted_genders:
+                    if (number, gender) in seen_base_forms:
+                        continue
+                    is_citation = inferred_origin == "inferred:base_form" and not citation_marked
                     row = _build_noun_form_row(
                         lemma_id,
                         lemma_stressed,
-                        [base_number],
-                        lemma_gender,
-                        form_origin="inferred:base_form",
-                        is_citation_form=not has_existing_citation,
+                        [number],
+                        gender,
+                        form_origin=inferred_origin,
+                        is_citation_form=is_citation,
                     )
                     if row:
                         add_form(row)
+                        if is_citation:
+                            citation_marked = True
 
-                # For invariable nouns: also add plural form with same text
-                # (Similar to how invariable adjectives get all 4 gender/number forms)
-                is_invariable = number_class == "invariable"
-                if is_invariable:
-                    if is_common_gender:
-                        # Add plural for both genders
-                        for gender in ("m", "f"):
-                            if ("plural", gender) not in seen_base_forms:
-                                row = _build_noun_form_row(
-                                    lemma_id,
-                                    lemma_stressed,
-                                    ["plural"],
-                                    gender,
-                                    form_origin="inferred:invariable",
-                                )
-                                if row:
-                                    add_form(row)
-                    elif lemma_gender and ("plural", lemma_gender) not in seen_base_forms:
-                        # Add plural for single gender
-                        row = _build_noun_form_row(
-                            lemma_id,
-                            lemma_stressed,
-                            ["plural"],
-                            lemma_gender,
-                            form_origin="inferred:invariable",
-                        )
-                        if row:
-                            add_form(row)
+        # Queue definitions with form_meaning_hint for soft key linkage
+        if pos_filter == POS.NOUN and word in DEFINITION_FORM_LINKAGE:
+            # This lemma has meaning-dependent plurals - link definitions to forms
+            for sense in entry.get("senses", []):
+                # Skip form-of entries
+                if "form_of" in sense:
+                    continue
+                glosses = sense.get("glosses", [])
+                if not glosses:
+                    continue
+                gloss = "; ".join(glosses)
 
-            # Queue definitions with form_meaning_hint for soft key linkage
-            if pos_filter == POS.NOUN and word in DEFINITION_FORM_LINKAGE:
-                # This lemma has meaning-dependent plurals - link definitions to forms
-                linkage = DEFINITION_FORM_LINKAGE[word]
-                for sense in entry.get("senses", []):
-                    # Skip form-of entries
-                    if "form_of" in sense:
-                        continue
-                    glosses = sense.get("glosses", [])
-                    if not glosses:
-                        continue
-                    gloss = "; ".join(glosses)
+                # Filter out blocklisted tags
+                raw_tags = sense.get("tags")
+                if raw_tags:
+                    filtered = [t for t in raw_tags if t not in DEFINITION_TAG_BLOCKLIST]
+                    def_tags = filtered if filtered else None
+                else:
+                    def_tags = None
 
-                    # Filter out blocklisted tags
-                    raw_tags = sense.get("tags")
-                    if raw_tags:
-                        filtered = [t for t in raw_tags if t not in DEFINITION_TAG_BLOCKLIST]
-                        def_tags = filtered if filtered else None
-                    else:
-                        def_tags = None
-
-                    # Determine which form(s) this definition matches
-                    matched_forms = [
-                        form_text
-                        for form_text, matchers in linkage.items()
-                        if _sense_matches_form(sense, matchers)
-                    ]
-
-                    if matched_forms:
-                        # Create a definition entry for each matched form
-                        definition_batch.extend(
-                            {
-                                "lemma_id": lemma_id,
-                                "gloss": gloss,
-                                "tags": def_tags or None,
-                                "form_meaning_hint": form_text,
-                            }
-                            for form_text in matched_forms
-                        )
-                    else:
-                        # No match - applies to all forms (NULL form_meaning_hint)
-                        definition_batch.append(
-                            {
-                                "lemma_id": lemma_id,
-                                "gloss": gloss,
-                                "tags": def_tags or None,
-                                "form_meaning_hint": None,  # Consistent keys for batch insert
-                            }
-                        )
-            else:
-                # Standard case - no form_meaning_hint
-                for gloss, def_tags in _iter_definitions(entry):
+                # Determine which form(s) this definition matches
+                matched_forms = _match_linkage_forms(sense, word)
+
+                if matched_forms:
+                    # Create a definition entry for each matched form
+                    definition_batch.extend(
+                        {
+                            "lemma_id": lemma_id,
+                            "gloss": gloss,
+                            "tags": def_tags or None,
+                            "form_meaning_hint": form_text,
+                        }
+                        for form_text in matched_forms
+                    )
+                else:
+                    # No match - applies to all forms (NULL form_meaning_hint)
                     definition_batch.append(
                         {
                             "lemma_id": lemma_id,
@@ -3225,10 +3337,24 @@ def import_wiktextract(
                             "form_meaning_hint": None,  # Consistent keys for batch insert
                         }
                     )
+        else:
+            # Standard case - no form_meaning_hint
+            for gloss, def_tags in _iter_definitions(entry):
+                definition_batch.append(
+                    {
+                        "lemma_id": lemma_id,
+                        "gloss": gloss,
+                        "tags": def_tags or None,
+                        "form_meaning_hint": None,  # Consistent keys for batch insert
+                    }
+                )
 
     # Final flush
     flush_batches()
 
+    for index in deferred_indexes:
+        conn.execute(CreateIndex(index, if_not_exists=True))
+
     # Post-processing: Link relationships
     # (must happen after all lemmas are inserted so we can resolve lemma IDs)
     if pos_filter == POS.ADJECTIVE:
@@ -3268,10 +3394,6 @@ def import_wiktextract(
         stats["derivations_pejorative"] = derivation_stats["pejorative"]
         stats["derivations_base_not_found"] = derivation_stats["base_not_found"]
 
-    # Final progress callback
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
-
     # Log aggregated noun gender/plural warnings (if any)
     if pos_filter == POS.NOUN:
         if stats.get("counterpart_no_plural", 0) > 0:
@@ -3372,8 +3494,6 @@ def enrich_from_form_of_entries(
         - spelling_already_filled: entries where spelling already set
         - spelling_not_found: entries where form not found for spelling
     """
-    from sqlalchemy import update
-
     stats = {
         "scanned": 0,
         "labels_with_tags": 0,
@@ -3415,147 +3535,169 @@ def enrich_from_form_of_entries(
     # - Labels can be applied to any form that doesn't have them yet
     # - Spelling should only be applied to forms not already filled by Morph-it!
 
-    # Labels lookup: all forms where labels IS NULL
-    labels_result = conn.execute(
-        select(pos_form_table.c.id, pos_form_table.c.lemma_id, pos_form_table.c.stressed).where(
-            pos_form_table.c.labels.is_(None)
-        )
+    # Both lookups come from a single scan of the form table, so each form's
+    # stressed text is normalized once and the (lemma_id, normalized) key tuple
+    # is shared between the two dicts.
+    form_result = conn.execute(
+        select(
+            pos_form_table.c.id,
+            pos_form_table.c.lemma_id,
+            pos_form_table.c.stressed,
+            pos_form_table.c.labels.is_(None).label("needs_labels"),
+            pos_form_table.c.written.is_(None).label("needs_spelling"),
+        ).where(or_(pos_form_table.c.labels.is_(None), pos_form_table.c.written.is_(None)))
     )
     labels_lookup: dict[tuple[int, str], list[int]] = {}
-    for row in labels_result:
-        normalized = normalize(row.stressed)
-        key = (row.lemma_id, normalized)
-        if key not in labels_lookup:
-            labels_lookup[key] = []
-        labels_lookup[key].append(row.id)
-
-    # Spelling lookup: only forms where written IS NULL
-    spelling_result = conn.execute(
-        select(pos_form_table.c.id, pos_form_table.c.lemma_id, pos_form_table.c.stressed).where(
-            pos_form_table.c.written.is_(None)
-        )
-    )
     spelling_lookup: dict[tuple[int, str], list[int]] = {}
-    for row in spelling_result:
-        normalized = normalize(row.stressed)
-        key = (row.lemma_id, normalized)
-        if key not in spelling_lookup:
-            spelling_lookup[key] = []
-        spelling_lookup[key].append(row.id)
+    for row in form_result:
+        key = (row.lemma_id, normalize(row.stressed))
+        # Labels lookup: all forms where labels IS NULL
+        if row.needs_labels:
+            labels_lookup.setdefault(key, []).append(row.id)
+        # Spelling lookup: only forms where written IS NULL
+        if row.needs_spelling:
+            spelling_lookup.setdefault(key, []).append(row.id)
+
+    # Form-of entries point at the same lemmas over and over (every conjugated form
+    # of a verb names its infinitive), so resolve each lemma word only once
+    lemma_id_by_word: dict[str, int | None] = {}
+
+    def resolve_lemma_id(lemma_word: str) -> int | None:
+        if lemma_word not in lemma_id_by_word:
+            lemma_written = derive_written_from_stressed(lemma_word)
+            lemma_id_by_word[lemma_word] = (
+                lemma_lookup.get(lemma_written) if lemma_written is not None else None
+            )
+        return lemma_id_by_word[lemma_word]
+
+    # Label updates are collected during the scan and applied afterwards with one
+    # UPDATE per distinct label set. A form is claimed by the first form-of entry
+    # that labels it, matching the "labels IS NULL" first-wins semantics.
+    label_updates: dict[tuple[str, ...], list[int]] = {}
+    labelled_ids: set[int] = set()
+
+    # Spelling updates are queued as (id, written) parameter sets and applied with a
+    # single executemany after the scan
+    spelling_update = (
+        update(pos_form_table)
+        .where(pos_form_table.c.id == bindparam("_id"))
+        .values(written=bindparam("_written"), written_source="wiktionary")
+    )
+    spelling_rows: list[dict[str, Any]] = []
 
     # Map to Wiktextract's POS naming
     wiktextract_pos = WIKTEXTRACT_POS.get(pos_filter, pos_filter)
+    # Raw-line needles: both must appear in any form-of entry for our POS, so lines
+    # missing either can be skipped without decoding. _is_form_of_entry() still
+    # makes the real decision for lines that pass.
+    pos_needle = f'"{wiktextract_pos}"'.encode()
 
-    # Count lines for progress if callback provided
-    total_lines = _count_lines(jsonl_path) if progress_callback else 0
-    current_line = 0
+    for line in _iter_jsonl_lines(jsonl_path, progress_callback):
+        if b'"form_of"' not in line or pos_needle not in line:
+            continue
 
-    with jsonl_path.open(encoding="utf-8") as f:
-        for line in f:
-            current_line += 1
-            if progress_callback and current_line % 10000 == 0:
-                progress_callback(current_line, total_lines)
+        entry = _parse_entry(line)
+        if entry is None:
+            continue
 
-            entry = _parse_entry(line)
-            if entry is None:
+        # Only process form-of entries for our POS
+        if not _is_form_of_entry(entry, wiktextract_pos):
+            continue
+
+        stats["scanned"] += 1
+
+        # The entry's 'word' field is the actual written form (e.g., "parlo")
+        form_word = entry.get("word", "")
+        if not form_word:
+            continue
+        # Same text as every form yielded by _extract_form_of_info() for this entry
+        form_normalized = normalize(form_word)
+
+        # =========================================================
+        # PART 1: Extract and apply labels using _extract_form_of_info()
+        # =========================================================
+        for _extracted_form, lemma_word, labels in _extract_form_of_info(entry):
+            if labels is None:
                 continue
 
-            # Only process form-of entries for our POS
-            if not _is_form_of_entry(entry, wiktextract_pos):
+            stats["labels_with_tags"] += 1
+
+            # Look up lemma by its written form
+            lemma_id = resolve_lemma_id(lemma_word)
+            if lemma_id is None:
+                stats["labels_not_found"] += 1
                 continue
 
-            stats["scanned"] += 1
+            # Look up form
+            key = (lemma_id, form_normalized)
+            form_ids = labels_lookup.get(key)
+            if not form_ids:
+                stats["labels_not_found"] += 1
+                continue
 
-            # The entry's 'word' field is the actual written form (e.g., "parlo")
-            form_word = entry.get("word", "")
-            if not form_word:
+            # Queue labels for all matching forms not already claimed
+            for form_id in form_ids:
+                if form_id not in labelled_ids:
+                    labelled_ids.add(form_id)
+                    label_updates.setdefault(tuple(labels), []).append(form_id)
+
+        # =========================================================
+        # PART 2: Extract and apply spelling from form_of references
+        # =========================================================
+        for sense in entry.get("senses", []):
+            form_of_list = sense.get("form_of", [])
+            if not form_of_list:
                 continue
 
-            # =========================================================
-            # PART 1: Extract and apply labels using _extract_form_of_info()
-            # =========================================================
-            for extracted_form, lemma_word, labels in _extract_form_of_info(entry):
-                if labels is None:
+            for form_of in form_of_list:
+                lemma_word = form_of.get("word", "")
+                if not lemma_word:
                     continue
 
-                stats["labels_with_tags"] += 1
-
                 # Look up lemma by its written form
-                lemma_written = derive_written_from_stressed(lemma_word)
-                if lemma_written is None:
-                    stats["labels_not_found"] += 1
-                    continue
-                lemma_id = lemma_lookup.get(lemma_written)
+                lemma_id = resolve_lemma_id(lemma_word)
                 if lemma_id is None:
-                    stats["labels_not_found"] += 1
+                    stats["spelling_not_found"] += 1
                     continue
 
-                # Look up form
-                form_normalized = normalize(extracted_form)
+                # Look up form (only forms with NULL written are in the lookup)
                 key = (lemma_id, form_normalized)
-                form_ids = labels_lookup.get(key)
+                form_ids = spelling_lookup.get(key)
                 if not form_ids:
-                    stats["labels_not_found"] += 1
+                    # Either already filled by Morph-it! or not found
+                    stats["spelling_already_filled"] += 1
                     continue
 
-                # Update labels for all matching forms (where labels is NULL)
-                for form_id in form_ids:
-                    result = conn.execute(
-                        update(pos_form_table)
-                        .where(pos_form_table.c.id == form_id)
-                        .where(pos_form_table.c.labels.is_(None))
-                        .values(labels=labels)
-                    )
-                    if result.rowcount > 0:
-                        stats["labels_updated"] += 1
-
-            # =========================================================
-            # PART 2: Extract and apply spelling from form_of references
-            # =========================================================
-            for sense in entry.get("senses", []):
-                form_of_list = sense.get("form_of", [])
-                if not form_of_list:
-                    continue
-
-                for form_of in form_of_list:
-                    lemma_word = form_of.get("word", "")
-                    if not lemma_word:
-                        continue
-
-                    # Look up lemma by its written form
-                    lemma_written = derive_written_from_stressed(lemma_word)
-                    if lemma_written is None:
-                        stats["spelling_not_found"] += 1
-                        continue
-                    lemma_id = lemma_lookup.get(lemma_written)
-                    if lemma_id is None:
-                        stats["spelling_not_found"] += 1
-                        continue
-
-                    # Look up form (only forms with NULL written are in the lookup)
-                    form_normalized = normalize(form_word)
-                    key = (lemma_id, form_normalized)
-                    form_ids = spelling_lookup.get(key)
-                    if not form_ids:
-                        # Either already filled by Morph-it! or not found
-                        stats["spelling_already_filled"] += 1
-                        continue
+                # Queue written and written_source for all matching forms
+                spelling_rows.extend(
+                    {"_id": form_id, "_written": form_word} for form_id in form_ids
+                )
 
-                    # Update written and written_source for all matching forms
-                    for form_id in form_ids:
-                        conn.execute(
-                            update(pos_form_table)
-                            .where(pos_form_table.c.id == form_id)
-                            .values(written=form_word, written_source="wiktionary")
-                        )
-                        stats["spelling_updated"] += 1
+                # Remove from lookup to avoid duplicate updates
+                del spelling_lookup[key]
 
-                    # Remove from lookup to avoid duplicate updates
-                    del spelling_lookup[key]
+    # Apply queued spellings; each form id is queued at most once
+    if spelling_rows:
+        result = conn.execute(spelling_update, spelling_rows)
+        stats["spelling_updated"] += result.rowcount
 
-    # Final progress callback
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
+    # Apply queued labels, chunking ids to stay under SQLite's bound-parameter limit
+    labels_update = (
+        update(pos_form_table)
+        .where(pos_form_table.c.id.in_(bindparam("_ids", expanding=True)))
+        .where(pos_form_table.c.labels.is_(None))
+        .values(labels=bindparam("_labels", type_=pos_form_table.c.labels.type))
+    )
+    for label_key, form_ids in label_updates.items():
+        for start in range(0, len(form_ids), _UPDATE_ID_CHUNK_SIZE):
+            result = conn.execute(
+                labels_update,
+                {
+                    "_ids": form_ids[start : start + _UPDATE_ID_CHUNK_SIZE],
+                    "_labels": list(label_key),
+                },
+            )
+            stats["labels_updated"] += result.rowcount
 
     return stats
 
@@ -3573,7 +3715,8 @@ def link_comparative_superlative(
             'wiktextract:canonical', 'hardcoded'.
 
     Returns:
-        Statistics dict with 'linked' and 'base_not_found' counts
+        Statistics dict with 'linked' (distinct adjectives linked) and
+        'base_not_found' counts
     """
     stats = {"linked": 0, "base_not_found": 0}
 
@@ -3594,6 +3737,10 @@ def link_comparative_superlative(
         if written is not None:
             lemma_lookup[written] = row.id
 
+    # Resolved links keyed by lemma: a lemma listed more than once keeps its last
+    # resolvable link, as when each link was applied with its own UPDATE
+    resolved: dict[int, dict[str, Any]] = {}
+
     for lemma_id, base_word, relationship, source in degree_links:
         # Derive written form from base_word (which may have pedagogical stress)
         base_written = derive_written_from_stressed(base_word)
@@ -3616,16 +3763,25 @@ def link_comparative_superlative(
             stats["base_not_found"] += 1
             continue
 
+        resolved[lemma_id] = {
+            "_lemma_id": lemma_id,
+            "_base_lemma_id": base_lemma_id,
+            "_relationship": relationship,
+            "_source": source,
+        }
+
+    if resolved:
         conn.execute(
             update(adjective_metadata)
-            .where(adjective_metadata.c.lemma_id == lemma_id)
+            .where(adjective_metadata.c.lemma_id == bindparam("_lemma_id"))
             .values(
-                base_lemma_id=base_lemma_id,
-                degree_relationship=relationship,
-                degree_relationship_source=source,
-            )
+                base_lemma_id=bindparam("_base_lemma_id"),
+                degree_relationship=bindparam("_relationship"),
+                degree_relationship_source=bindparam("_source"),
+            ),
+            list(resolved.values()),
         )
-        stats["linked"] += 1
+    stats["linked"] = len(resolved)
 
     return stats
 
@@ -3809,78 +3965,66 @@ def link_noun_counterparts(
     # We'll process these at the end to handle bidirectionality
     counterpart_pairs: list[tuple[int, int]] = []
 
-    # Count lines for progress
-    total_lines = _count_lines(jsonl_path) if progress_callback else 0
-    current_line = 0
+    for line in _iter_jsonl_lines(jsonl_path, progress_callback):
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
 
-    with jsonl_path.open(encoding="utf-8") as f:
-        for line in f:
-            current_line += 1
-            if progress_callback and current_line % 10000 == 0:
-                progress_callback(current_line, total_lines)
+        # Only process noun entries
+        if entry.get("pos") != "noun":
+            continue
 
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+        stats["scanned"] += 1
+        word = entry.get("word", "")
 
-            # Only process noun entries
-            if entry.get("pos") != "noun":
+        # Look for "female equivalent of" or "male equivalent of" glosses
+        for sense in entry.get("senses", []):
+            glosses = sense.get("glosses", [])
+            if not glosses:
                 continue
 
-            stats["scanned"] += 1
-            word = entry.get("word", "")
-
-            # Look for "female equivalent of" or "male equivalent of" glosses
-            for sense in entry.get("senses", []):
-                glosses = sense.get("glosses", [])
-                if not glosses:
-                    continue
+            gloss = glosses[0] if glosses else ""
+            counterpart_word = None
 
-                gloss = glosses[0] if glosses else ""
-                counterpart_word = None
+            # Check for "female equivalent of X" or "male equivalent of X"
+            if "female equivalent of " in gloss or "male equivalent of " in gloss:
+                # Extract from form_of if available
+                form_of_list = sense.get("form_of", [])
+                if form_of_list:
+                    counterpart_word = form_of_list[0].get("word")
+                else:
+                    # Try to extract from gloss text
+                    if "female equivalent of " in gloss:
+                        counterpart_word = gloss.split("female equivalent of ")[-1].strip()
+                    elif "male equivalent of " in gloss:
+                        counterpart_word = gloss.split("male equivalent of ")[-1].strip()
+                    # Clean up any trailing punctuation or extra text
+                    if counterpart_word:
+                        counterpart_word = counterpart_word.split(",")[0].strip()
+                        counterpart_word = counterpart_word.split(";")[0].strip()
+
+            if counterpart_word:
+                stats["counterparts_found"] += 1
 
-                # Check for "female equivalent of X" or "male equivalent of X"
-                if "female equivalent of " in gloss or "male equivalent of " in gloss:
-                    # Extract from form_of if available
-                    form_of_list = sense.get("form_of", [])
-                    if form_of_list:
-                        counterpart_word = form_of_list[0].get("word")
-                    else:
-                        # Try to extract from gloss text
-                        if "female equivalent of " in gloss:
-                            counterpart_word = gloss.split("female equivalent of ")[-1].strip()
-                        elif "male equivalent of " in gloss:
-                            counterpart_word = gloss.split("male equivalent of ")[-1].strip()
-                        # Clean up any trailing punctuation or extra text
-                        if counterpart_word:
-                            counterpart_word = counterpart_word.split(",")[0].strip()
-                            counterpart_word = counterpart_word.split(";")[0].strip()
-
-                if counterpart_word:
-                    stats["counterparts_found"] += 1
-
-                    # Look up both lemmas
-                    word_written = derive_written_from_stressed(word)
-                    counterpart_written = derive_written_from_stressed(counterpart_word)
-
-                    if word_written is None or counterpart_written is None:
-                        stats["base_not_found"] += 1
-                        continue
+                # Look up both lemmas
+                word_written = derive_written_from_stressed(word)
+                counterpart_written = derive_written_from_stressed(counterpart_word)
 
-                    word_id = noun_lookup.get(word_written)
-                    counterpart_id = noun_lookup.get(counterpart_written)
+                if word_written is None or counterpart_written is None:
+                    stats["base_not_found"] += 1
+                    continue
 
-                    if word_id is None or counterpart_id is None:
-                        stats["base_not_found"] += 1
-                        continue
+                word_id = noun_lookup.get(word_written)
+                counterpart_id = noun_lookup.get(counterpart_written)
 
-                    # Record the pair (in both directions for bidirectional linking)
-                    counterpart_pairs.append((word_id, counterpart_id))
-                    break  # Only process first counterpart relationship per entry
+                if word_id is None or counterpart_id is None:
+                    stats["base_not_found"] += 1
+                    continue
 
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
+                # Record the pair (in both directions for bidirectional linking)
+                counterpart_pairs.append((word_id, counterpart_id))
+                break  # Only process first counterpart relationship per entry
 
     # Process counterpart pairs and update database
     # Build a set of all pairs for bidirectional checking
@@ -3964,112 +4108,100 @@ def link_noun_derivations(
         if written is not None:
             noun_lookup[written] = row.id
 
-    # Count lines for progress
-    total_lines = _count_lines(jsonl_path) if progress_callback else 0
-    current_line = 0
-
-    with jsonl_path.open(encoding="utf-8") as f:
-        for line in f:
-            current_line += 1
-            if progress_callback and current_line % 10000 == 0:
-                progress_callback(current_line, total_lines)
-
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            # Only process noun entries
-            if entry.get("pos") != "noun":
-                continue
-
-            stats["scanned"] += 1
-            word = entry.get("word", "")
+    for line in _iter_jsonl_lines(jsonl_path, progress_callback):
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
 
-            # Look for derivation relationships in senses
-            for sense in entry.get("senses", []):
-                tags = sense.get("tags", [])
-                glosses = sense.get("glosses", [])
-                gloss = glosses[0] if glosses else ""
+        # Only process noun entries
+        if entry.get("pos") != "noun":
+            continue
 
-                # Determine derivation type from tags
-                derivation_type: DerivationType | None = None
-                if "diminutive" in tags:
+        stats["scanned"] += 1
+        word = entry.get("word", "")
+
+        # Look for derivation relationships in senses
+        for sense in entry.get("senses", []):
+            tags = sense.get("tags", [])
+            glosses = sense.get("glosses", [])
+            gloss = glosses[0] if glosses else ""
+
+            # Determine derivation type from tags
+            derivation_type: DerivationType | None = None
+            if "diminutive" in tags:
+                derivation_type = DerivationType.DIMINUTIVE
+            elif "augmentative" in tags:
+                derivation_type = DerivationType.AUGMENTATIVE
+            elif "pejorative" in tags:
+                derivation_type = DerivationType.PEJORATIVE
+
+            # Also check gloss patterns if no tag
+            if derivation_type is None:
+                if "diminutive of " in gloss.lower():
                     derivation_type = DerivationType.DIMINUTIVE
-                elif "augmentative" in tags:
+                elif "augmentative of " in gloss.lower():
                     derivation_type = DerivationType.AUGMENTATIVE
-                elif "pejorative" in tags:
+                elif "pejorative of " in gloss.lower():
                     derivation_type = DerivationType.PEJORATIVE
 
-                # Also check gloss patterns if no tag
-                if derivation_type is None:
-                    if "diminutive of " in gloss.lower():
-                        derivation_type = DerivationType.DIMINUTIVE
-                    elif "augmentative of " in gloss.lower():
-                        derivation_type = DerivationType.AUGMENTATIVE
-                    elif "pejorative of " in gloss.lower():
-                        derivation_type = DerivationType.PEJORATIVE
+            if derivation_type is None:
+                continue
 
-                if derivation_type is None:
-                    continue
+            # Extract base word from form_of or gloss
+            base_word = None
+            form_of_list = sense.get("form_of", [])
+            if form_of_list:
+                base_word = form_of_list[0].get("word")
+
+            if base_word is None:
+                # Try to extract from gloss
+                for pattern in [
+                    "diminutive of ",
+                    "augmentative of ",
+                    "pejorative of ",
+                ]:
+                    if pattern in gloss.lower():
+                        idx = gloss.lower().find(pattern)
+                        base_word = gloss[idx + len(pattern) :].strip()
+                        # Clean up
+                        base_word = base_word.split(",")[0].strip()
+                        base_word = base_word.split(";")[0].strip()
+                        base_word = base_word.split(" ")[0].strip()
+                        break
 
-                # Extract base word from form_of or gloss
-                base_word = None
-                form_of_list = sense.get("form_of", [])
-                if form_of_list:
-                    base_word = form_of_list[0].get("word")
-
-                if base_word is None:
-                    # Try to extract from gloss
-                    for pattern in [
-                        "diminutive of ",
-                        "augmentative of ",
-                        "pejorative of ",
-                    ]:
-                        if pattern in gloss.lower():
-                            idx = gloss.lower().find(pattern)
-                            base_word = gloss[idx + len(pattern) :].strip()
-                            # Clean up
-                            base_word = base_word.split(",")[0].strip()
-                            base_word = base_word.split(";")[0].strip()
-                            base_word = base_word.split(" ")[0].strip()
-                            break
-
-                if base_word is None:
-                    continue
+            if base_word is None:
+                continue
 
-                stats["derivations_found"] += 1
+            stats["derivations_found"] += 1
 
-                # Look up both lemmas
-                word_written = derive_written_from_stressed(word)
-                base_written = derive_written_from_stressed(base_word)
+            # Look up both lemmas
+            word_written = derive_written_from_stressed(word)
+            base_written = derive_written_from_stressed(base_word)
 
-                if word_written is None or base_written is None:
-                    stats["base_not_found"] += 1
-                    continue
+            if word_written is None or base_written is None:
+                stats["base_not_found"] += 1
+                continue
 
-                word_id = noun_lookup.get(word_written)
-                base_id = noun_lookup.get(base_written)
+            word_id = noun_lookup.get(word_written)
+            base_id = noun_lookup.get(base_written)
 
-                if word_id is None or base_id is None:
-                    stats["base_not_found"] += 1
-                    continue
+            if word_id is None or base_id is None:
+                stats["base_not_found"] += 1
+                continue
 
-                # Update noun_metadata
-                conn.execute(
-                    update(noun_metadata)
-                    .where(noun_metadata.c.lemma_id == word_id)
-                    .values(
-                        base_lemma_id=base_id,
-                        derivation_type=derivation_type,
-                    )
+            # Update noun_metadata
+            conn.execute(
+                update(noun_metadata)
+                .where(noun_metadata.c.lemma_id == word_id)
+                .values(
+                    base_lemma_id=base_id,
+                    derivation_type=derivation_type,
                 )
-                stats["linked"] += 1
-                stats[derivation_type] += 1
-                break  # Only process first derivation relationship per entry
-
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
+            )
+            stats["linked"] += 1
+            stats[derivation_type] += 1
+            break  # Only process first derivation relationship per entry
 
     return stats
 
@@ -4098,7 +4230,7 @@ def import_adjective_allomorphs(
         Statistics dict with counts of processed entries
     """
     stats = {
-        "scanned": 0,
+        "scanned": 0,  # Adjective entries with alt_of or "adjective form" markers
         "allomorphs_added": 0,
         "forms_added": 0,
         "forms_blocked": 0,  # Forms filtered by BLOCKED_ADJECTIVE_FORMS
@@ -4123,181 +4255,205 @@ def import_adjective_allomorphs(
         if written is not None:
             adj_lookup[written] = row.id
 
-    # Count lines for progress
-    total_lines = _count_lines(jsonl_path) if progress_callback else 0
-    current_line = 0
-
-    with jsonl_path.open(encoding="utf-8") as f:
-        for line in f:
-            current_line += 1
-            if progress_callback and current_line % 10000 == 0:
-                progress_callback(current_line, total_lines)
+    # Preload existing adjective forms per lemma: (written, gender, number) combos,
+    # plus just the written texts. Both are kept current as forms are inserted below.
+    existing_combos: dict[int, set[tuple[str, str, str]]] = {}
+    existing_written: dict[int, set[str]] = {}
+    # Unique keys of positive-degree forms (uq_adjective_forms_entry minus degree), so
+    # duplicates are skipped up front instead of failing the INSERT
+    existing_keys: set[tuple[int, str, str, str]] = set()
+    result = conn.execute(
+        select(
+            adjective_forms.c.lemma_id,
+            adjective_forms.c.written,
+            adjective_forms.c.stressed,
+            adjective_forms.c.gender,
+            adjective_forms.c.number,
+            adjective_forms.c.degree,
+        )
+    )
+    for row in result:
+        if row.written is not None:
+            existing_combos.setdefault(row.lemma_id, set()).add(
+                (row.written, row.gender, row.number)
+            )
+            existing_written.setdefault(row.lemma_id, set()).add(row.written)
+        if row.degree == "positive":
+            existing_keys.add((row.lemma_id, row.stressed, row.gender, row.number))
+
+    for line in _iter_jsonl_lines(jsonl_path, progress_callback):
+        # Raw-line prefilter: an allomorph candidate is an adjective entry with either
+        # alt_of (Method 1) or an "adjective form" head template (Method 2) below
+        if b'"adj"' not in line or (b'"alt_of"' not in line and b'"adjective form"' not in line):
+            continue
 
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
 
-            # Only process adjective entries
-            if entry.get("pos") != "adj":
-                continue
+        # Only process adjective entries
+        if entry.get("pos") != "adj":
+            continue
 
-            stats["scanned"] += 1
+        stats["scanned"] += 1
 
-            # Find parent word and determine label
-            # Method 1: alt_of in senses (e.g., gran -> grande)
-            # Method 2: "adjective form" with links (e.g., bel -> bello)
-            parent_word = None
-            label = None
-            allomorph_word = entry["word"]
+        # Find parent word and determine label
+        # Method 1: alt_of in senses (e.g., gran -> grande)
+        # Method 2: "adjective form" with links (e.g., bel -> bello)
+        parent_word = None
+        label = None
+        allomorph_word = entry["word"]
 
-            # Try Method 1: alt_of
-            for sense in entry.get("senses", []):
-                alt_of_list = sense.get("alt_of", [])
-                for alt_of in alt_of_list:
-                    parent_word = alt_of.get("word")
-                    if parent_word:
-                        # Determine label from tags
-                        tags = sense.get("tags", [])
-                        # Skip senses with archaic/dialectal/etc. tags
-                        if should_filter_form(tags):
-                            stats["alt_of_filtered"] += 1
-                            parent_word = None  # Reset to continue looking
-                            break
-                        if "apocopic" in tags:
-                            label = "apocopic"
-                        break
+        # Try Method 1: alt_of
+        for sense in entry.get("senses", []):
+            alt_of_list = sense.get("alt_of", [])
+            for alt_of in alt_of_list:
+                parent_word = alt_of.get("word")
                 if parent_word:
+                    # Determine label from tags
+                    tags = sense.get("tags", [])
+                    # Skip senses with archaic/dialectal/etc. tags
+                    if should_filter_form(tags):
+                        stats["alt_of_filtered"] += 1
+                        parent_word = None  # Reset to continue looking
+                        break
+                    if "apocopic" in tags:
+                        label = "apocopic"
                     break
+            if parent_word:
+                break
+
+        # Try Method 2: "adjective form" WITHOUT form_of, using links
+        # This catches special forms like "bel" which:
+        # - Are marked as "adjective form" in head_templates
+        # - Do NOT have form_of (unlike regular inflections like "bella")
+        # - Have links pointing to the parent lemma
+        if not parent_word:
+            is_adj_form = any(
+                t.get("args", {}).get("2") == "adjective form"
+                for t in entry.get("head_templates", [])
+            )
+            # Check that NO sense has form_of (regular inflected forms have form_of)
+            has_form_of = any(sense.get("form_of") for sense in entry.get("senses", []))
+            if is_adj_form and not has_form_of:
+                for sense in entry.get("senses", []):
+                    links = sense.get("links", [])
+                    if links and len(links) > 0:
+                        # links format: [['bello', 'bello#Italian'], ...]
+                        parent_word = links[0][0] if isinstance(links[0], list) else links[0]
+                        # For "adjective form" entries, label as apocopic (pre-nominal form)
+                        label = "apocopic"
+                        break
 
-            # Try Method 2: "adjective form" WITHOUT form_of, using links
-            # This catches special forms like "bel" which:
-            # - Are marked as "adjective form" in head_templates
-            # - Do NOT have form_of (unlike regular inflections like "bella")
-            # - Have links pointing to the parent lemma
-            if not parent_word:
-                is_adj_form = any(
-                    t.get("args", {}).get("2") == "adjective form"
-                    for t in entry.get("head_templates", [])
-                )
-                # Check that NO sense has form_of (regular inflected forms have form_of)
-                has_form_of = any(sense.get("form_of") for sense in entry.get("senses", []))
-                if is_adj_form and not has_form_of:
-                    for sense in entry.get("senses", []):
-                        links = sense.get("links", [])
-                        if links and len(links) > 0:
-                            # links format: [['bello', 'bello#Italian'], ...]
-                            parent_word = links[0][0] if isinstance(links[0], list) else links[0]
-                            # For "adjective form" entries, label as apocopic (pre-nominal form)
-                            label = "apocopic"
-                            break
-
-            if not parent_word:
-                continue
+        if not parent_word:
+            continue
 
-            # Look up parent by written form
-            parent_written = derive_written_from_stressed(parent_word)
-            if parent_written is None:
-                stats["parent_not_found"] += 1
-                continue
-            parent_id = adj_lookup.get(parent_written)
-            if parent_id is None:
-                stats["parent_not_found"] += 1
-                continue
+        # Look up parent by written form
+        parent_written = derive_written_from_stressed(parent_word)
+        if parent_written is None:
+            stats["parent_not_found"] += 1
+            continue
+        parent_id = adj_lookup.get(parent_written)
+        if parent_id is None:
+            stats["parent_not_found"] += 1
+            continue
 
-            # Check if parent already has this form (with correct gender/number from forms array)
-            # If so, skip — the parent's Wiktextract forms already have proper tagging
-            existing_forms = conn.execute(
-                select(adjective_forms.c.written).where(adjective_forms.c.lemma_id == parent_id)
-            ).fetchall()
-            existing_form_texts = {row.written for row in existing_forms if row.written}
+        # Check if parent already has this form (with correct gender/number from forms array)
+        # If so, skip — the parent's Wiktextract forms already have proper tagging
+        if allomorph_word in existing_written.get(parent_id, ()):
+            stats["already_in_parent"] += 1
+            continue
 
-            if allomorph_word in existing_form_texts:
-                stats["already_in_parent"] += 1
-                continue
+        # Check gender restrictions from the alt-of entry
+        # e.g., moltipara (fonly:1) should only add feminine forms to multipara
+        is_feminine_only = _is_feminine_only_adjective(entry)
+        is_masculine_only = _is_masculine_only_adjective(entry)
 
-            # Check gender restrictions from the alt-of entry
-            # e.g., moltipara (fonly:1) should only add feminine forms to multipara
-            is_feminine_only = _is_feminine_only_adjective(entry)
-            is_masculine_only = _is_masculine_only_adjective(entry)
+        if is_feminine_only:
+            genders: tuple[str, ...] = ("f",)
+        elif is_masculine_only:
+            genders = ("m",)
+        else:
+            genders = ("m", "f")
+
+        # Build form lookup from entry's forms array
+        # e.g., secreto has forms=[secreta (f), secreti (m/p), secrete (f/p)]
+        # The entry word (secreto) is used for m/s; other forms from the array
+        # Note: In Wiktextract, singular forms often lack 'singular' tag - just have gender
+        form_lookup: dict[tuple[str, str], str] = {}
+        for form_entry in entry.get("forms", []):
+            form_text = form_entry.get("form")
+            form_tags = form_entry.get("tags", [])
+            if not form_text:
+                continue
+            # Determine gender and number from tags
+            form_gender = (
+                "m" if "masculine" in form_tags else "f" if "feminine" in form_tags else None
+            )
+            # Default to singular if 'plural' not present (common Wiktextract pattern)
+            form_number = "plural" if "plural" in form_tags else "singular"
 
-            if is_feminine_only:
-                genders: tuple[str, ...] = ("f",)
-            elif is_masculine_only:
-                genders = ("m",)
+            # Gender-neutral forms (e.g., 2-form adjective plurals like 'suavi')
+            # apply to both masculine and feminine
+            if form_gender:
+                form_lookup[(form_gender, form_number)] = form_text
             else:
-                genders = ("m", "f")
-
-            # Build form lookup from entry's forms array
-            # e.g., secreto has forms=[secreta (f), secreti (m/p), secrete (f/p)]
-            # The entry word (secreto) is used for m/s; other forms from the array
-            # Note: In Wiktextract, singular forms often lack 'singular' tag - just have gender
-            form_lookup: dict[tuple[str, str], str] = {}
-            for form_entry in entry.get("forms", []):
-                form_text = form_entry.get("form")
-                form_tags = form_entry.get("tags", [])
+                # No gender specified - form applies to both genders
+                form_lookup[("m", form_number)] = form_text
+                form_lookup[("f", form_number)] = form_text
+
+        # Add forms for appropriate gender(s); the (up to 4) rows are sent
+        # in a single executemany
+        form_rows: list[dict[str, Any]] = []
+        for gender in genders:
+            for number in ("singular", "plural"):
+                # Use form from lookup if available, otherwise use entry word
+                # (entry word is typically the m/s citation form)
+                form_text = form_lookup.get((gender, number), allomorph_word)
+
+                # Skip if no form text
                 if not form_text:
                     continue
-                # Determine gender and number from tags
-                form_gender = (
-                    "m" if "masculine" in form_tags else "f" if "feminine" in form_tags else None
-                )
-                # Default to singular if 'plural' not present (common Wiktextract pattern)
-                form_number = "plural" if "plural" in form_tags else "singular"
-
-                # Gender-neutral forms (e.g., 2-form adjective plurals like 'suavi')
-                # apply to both masculine and feminine
-                if form_gender:
-                    form_lookup[(form_gender, form_number)] = form_text
-                else:
-                    # No gender specified - form applies to both genders
-                    form_lookup[("m", form_number)] = form_text
-                    form_lookup[("f", form_number)] = form_text
 
-            # Add forms for appropriate gender(s)
-            for gender in genders:
-                for number in ("singular", "plural"):
-                    # Use form from lookup if available, otherwise use entry word
-                    # (entry word is typically the m/s citation form)
-                    form_text = form_lookup.get((gender, number), allomorph_word)
-
-                    # Skip if no form text
-                    if not form_text:
-                        continue
+                # Check blocklist for archaic/erroneous forms
+                form_written = derive_written_from_stressed(form_text) or form_text
+                if is_blocked_adjective_form(parent_written, form_written, gender, number):
+                    stats["forms_blocked"] += 1
+                    continue
 
-                    # Check blocklist for archaic/erroneous forms
-                    form_written = derive_written_from_stressed(form_text) or form_text
-                    if is_blocked_adjective_form(parent_written, form_written, gender, number):
-                        stats["forms_blocked"] += 1
-                        continue
+                key = (parent_id, form_text, gender, number)
+                if key in existing_keys:
+                    # Duplicate form (would violate the unique constraint)
+                    stats["duplicates_skipped"] += 1
+                    continue
 
-                    definite_article, article_source = get_definite(form_text, gender, number)
-
-                    try:
-                        conn.execute(
-                            adjective_forms.insert().values(
-                                lemma_id=parent_id,
-                                written=form_text,
-                                written_source="wiktionary",
-                                stressed=form_text,
-                                gender=gender,
-                                number=number,
-                                degree="positive",
-                                labels=[label] if label else None,
-                                definite_article=definite_article,
-                                article_source=article_source,
-                                form_origin="alt_of",
-                            )
-                        )
-                        stats["forms_added"] += 1
-                    except Exception:
-                        # Duplicate form (unique constraint violation)
-                        stats["duplicates_skipped"] += 1
+                definite_article, article_source = get_definite(form_text, gender, number)
+
+                form_rows.append(
+                    {
+                        "lemma_id": parent_id,
+                        "written": form_text,
+                        "written_source": "wiktionary",
+                        "stressed": form_text,
+                        "gender": gender,
+                        "number": number,
+                        "degree": "positive",
+                        "labels": [label] if label else None,
+                        "definite_article": definite_article,
+                        "article_source": article_source,
+                        "form_origin": "alt_of",
+                    }
+                )
+                existing_keys.add(key)
+                existing_combos.setdefault(parent_id, set()).add((form_text, gender, number))
+                existing_written.setdefault(parent_id, set()).add(form_text)
 
-            stats["allomorphs_added"] += 1
+        if form_rows:
+            conn.execute(_FORM_INSERT_STMTS[POS.ADJECTIVE], form_rows)
+            stats["forms_added"] += len(form_rows)
 
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
+        stats["allomorphs_added"] += 1
 
     # Import hardcoded allomorph forms (not in Wiktextract or Morphit adjective data)
     for form, parent_lemma, gender, number, label in HARDCODED_ALLOMORPH_FORMS:
@@ -4308,41 +4464,37 @@ def import_adjective_allomorphs(
             continue
 
         # Check if this specific form+gender+number combo already exists
-        existing = conn.execute(
-            select(
-                adjective_forms.c.written,
-                adjective_forms.c.gender,
-                adjective_forms.c.number,
-            ).where(adjective_forms.c.lemma_id == parent_id)
-        ).fetchall()
-        existing_combos = {(row.written, row.gender, row.number) for row in existing if row.written}
-
-        if (form, gender, number) in existing_combos:
+        if (form, gender, number) in existing_combos.get(parent_id, ()):
+            continue
+
+        key = (parent_id, form, gender, number)
+        if key in existing_keys:
+            # Duplicate (same stressed form already stored) - skip silently
+            logger.debug("Hardcoded form '%s' already exists for '%s'", form, parent_lemma)
             continue
 
         # Compute definite article (gender is already 'm'/'f')
         definite_article, article_source = get_definite(form, gender, number)
 
-        try:
-            conn.execute(
-                adjective_forms.insert().values(
-                    lemma_id=parent_id,
-                    written=form,
-                    written_source="hardcoded",
-                    stressed=form,
-                    gender=gender,
-                    number=number,
-                    degree="positive",
-                    labels=[label] if label else None,
-                    definite_article=definite_article,
-                    article_source=article_source,
-                    form_origin="hardcoded",
-                )
-            )
-            stats["hardcoded_added"] += 1
-        except Exception:
-            # Duplicate (unique constraint violation) - already exists, skip silently
-            logger.debug("Hardcoded form '%s' already exists for '%s'", form, parent_lemma)
+        conn.execute(
+            _FORM_INSERT_STMTS[POS.ADJECTIVE],
+            {
+                "lemma_id": parent_id,
+                "written": form,
+                "written_source": "hardcoded",
+                "stressed": form,
+                "gender": gender,
+                "number": number,
+                "degree": "positive",
+                "labels": [label] if label else None,
+                "definite_article": definite_article,
+                "article_source": article_source,
+                "form_origin": "hardcoded",
+            },
+        )
+        stats["hardcoded_added"] += 1
+        existing_keys.add(key)
+        existing_combos.setdefault(parent_id, set()).add((form, gender, number))
 
     return stats
 
@@ -4391,104 +4543,95 @@ def import_noun_allomorphs(
         if written is not None:
             noun_lookup[written] = row.id
 
-    # Count lines for progress
-    total_lines = _count_lines(jsonl_path) if progress_callback else 0
-    current_line = 0
-
-    with jsonl_path.open(encoding="utf-8") as f:
-        for line in f:
-            current_line += 1
-            if progress_callback and current_line % 10000 == 0:
-                progress_callback(current_line, total_lines)
+    # Preload the stressed forms of every noun lemma in one scan, shared by the JSONL
+    # and hardcoded phases and kept current as forms are inserted
+    existing_stressed: dict[int, set[str]] = {}
+    for row in conn.execute(select(noun_forms.c.lemma_id, noun_forms.c.stressed)):
+        existing_stressed.setdefault(row.lemma_id, set()).add(row.stressed)
 
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    for line in _iter_jsonl_lines(jsonl_path, progress_callback):
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
 
-            # Only process noun entries
-            if entry.get("pos") != "noun":
-                continue
+        # Only process noun entries
+        if entry.get("pos") != "noun":
+            continue
 
-            stats["scanned"] += 1
+        stats["scanned"] += 1
 
-            # Find parent word from alt_of with apocopic tag
-            parent_word = None
-            gender = None
-            allomorph_word = entry["word"]
+        # Find parent word from alt_of with apocopic tag
+        parent_word = None
+        gender = None
+        allomorph_word = entry["word"]
 
-            for sense in entry.get("senses", []):
-                tags = sense.get("tags", [])
-                if "apocopic" not in tags:
-                    continue
+        for sense in entry.get("senses", []):
+            tags = sense.get("tags", [])
+            if "apocopic" not in tags:
+                continue
 
-                alt_of_list = sense.get("alt_of", [])
-                for alt_of in alt_of_list:
-                    parent_word = alt_of.get("word")
-                    if parent_word:
-                        # Extract gender from tags
-                        if "masculine" in tags:
-                            gender = "m"
-                        elif "feminine" in tags:
-                            gender = "f"
-                        break
+            alt_of_list = sense.get("alt_of", [])
+            for alt_of in alt_of_list:
+                parent_word = alt_of.get("word")
                 if parent_word:
+                    # Extract gender from tags
+                    if "masculine" in tags:
+                        gender = "m"
+                    elif "feminine" in tags:
+                        gender = "f"
                     break
+            if parent_word:
+                break
 
-            if not parent_word or not gender:
-                continue
-
-            # Skip blocklisted apocopic forms (incorrect gender tags in source data)
-            if allomorph_word in SKIP_APOCOPIC_ALLOMORPHS:
-                stats["skipped_apocopic_blocklist"] += 1
-                continue
-
-            # Look up parent by written form
-            parent_written = derive_written_from_stressed(parent_word)
-            if parent_written is None:
-                stats["parent_not_found"] += 1
-                continue
-            parent_id = noun_lookup.get(parent_written)
-            if parent_id is None:
-                stats["parent_not_found"] += 1
-                continue
+        if not parent_word or not gender:
+            continue
 
-            # Check if parent already has this form
-            existing_forms = conn.execute(
-                select(noun_forms.c.stressed).where(noun_forms.c.lemma_id == parent_id)
-            ).fetchall()
-            existing_form_texts = {row.stressed for row in existing_forms if row.stressed}
+        # Skip blocklisted apocopic forms (incorrect gender tags in source data)
+        if allomorph_word in SKIP_APOCOPIC_ALLOMORPHS:
+            stats["skipped_apocopic_blocklist"] += 1
+            continue
 
-            if allomorph_word in existing_form_texts:
-                stats["already_in_parent"] += 1
-                continue
+        # Look up parent by written form
+        parent_written = derive_written_from_stressed(parent_word)
+        if parent_written is None:
+            stats["parent_not_found"] += 1
+            continue
+        parent_id = noun_lookup.get(parent_written)
+        if parent_id is None:
+            stats["parent_not_found"] += 1
+            continue
 
-            # Add the apocopic form (singular only - apocopic forms are singular)
-            definite_article, article_source = get_definite(allomorph_word, gender, "singular")
+        # Check if parent already has this form
+        if allomorph_word in existing_stressed.get(parent_id, ()):
+            stats["already_in_parent"] += 1
+            continue
 
-            try:
-                conn.execute(
-                    noun_forms.insert().values(
-                        lemma_id=parent_id,
-                        written=allomorph_word,
-                        written_source="wiktionary",
-                        stressed=allomorph_word,
-                        gender=gender,
-                        number="singular",
-                        labels=["apocopic"],
-                        definite_article=definite_article,
-                        article_source=article_source,
-                        form_origin="alt_of",
-                    )
-                )
-                stats["forms_added"] += 1
-                stats["allomorphs_added"] += 1
-            except Exception:
-                # Form already exists - skip silently
-                logger.debug("Apocopic form '%s' already exists for parent", allomorph_word)
+        # Add the apocopic form (singular only - apocopic forms are singular)
+        definite_article, article_source = get_definite(allomorph_word, gender, "singular")
 
-    if progress_callback:
-        progress_callback(total_lines, total_lines)
+        try:
+            conn.execute(
+                _FORM_INSERT_STMTS[POS.NOUN],
+                {
+                    "lemma_id": parent_id,
+                    "written": allomorph_word,
+                    "written_source": "wiktionary",
+                    "stressed": allomorph_word,
+                    "gender": gender,
+                    "number": "singular",
+                    "labels": ["apocopic"],
+                    "definite_article": definite_article,
+                    "article_source": article_source,
+                    "form_origin": "alt_of",
+                },
+            )
+            stats["forms_added"] += 1
+            stats["allomorphs_added"] += 1
+            existing_stressed.setdefault(parent_id, set()).add(allomorph_word)
+        except Exception:
+            # Form already exists - skip silently
+            logger.debug("Apocopic form '%s' already exists for parent", allomorph_word)
 
     # Import hardcoded noun allomorphs
     for form, parent_lemma, gender, number in HARDCODED_NOUN_ALLOMORPHS:
@@ -4499,32 +4642,29 @@ def import_noun_allomorphs(
             continue
 
         # Check if this form already exists
-        existing = conn.execute(
-            select(noun_forms.c.stressed).where(noun_forms.c.lemma_id == parent_id)
-        ).fetchall()
-        existing_texts = {row.stressed for row in existing if row.stressed}
-
-        if form in existing_texts:
+        if form in existing_stressed.get(parent_id, ()):
             continue
 
         definite_article, article_source = get_definite(form, gender, number)
 
         try:
             conn.execute(
-                noun_forms.insert().values(
-                    lemma_id=parent_id,
-                    written=form,
-                    written_source="hardcoded",
-                    stressed=form,
-                    gender=gender,
-                    number=number,
-                    labels=["apocopic"],
-                    definite_article=definite_article,
-                    article_source=article_source,
-                    form_origin="hardcoded",
-                )
+                _FORM_INSERT_STMTS[POS.NOUN],
+                {
+                    "lemma_id": parent_id,
+                    "written": form,
+                    "written_source": "hardcoded",
+                    "stressed": form,
+                    "gender": gender,
+                    "number": number,
+                    "labels": ["apocopic"],
+                    "definite_article": definite_article,
+                    "article_source": article_source,
+                    "form_origin": "hardcoded",
+                },
             )
             stats["hardcoded_added"] += 1
+            existing_stressed.setdefault(parent_id, set()).add(form)
         except Exception:
             logger.debug("Hardcoded form '%s' already exists for '%s'", form, parent_lemma)
 
@@ -4580,6 +4720,18 @@ def generate_gendered_participles(
     total = len(participles)
     stats["participles_found"] = total
 
+    # Derived forms are queued and inserted with one executemany per batch;
+    # OR IGNORE skips rows that hit the unique index (forms already present)
+    participle_insert = verb_forms.insert().prefix_with("OR IGNORE")
+    batch: list[dict[str, Any]] = []
+
+    def flush_batch() -> None:
+        if batch:
+            result = conn.execute(participle_insert, batch)
+            stats["forms_generated"] += result.rowcount
+            stats["duplicates_skipped"] += len(batch) - result.rowcount
+            batch.clear()
+
     for idx, row in enumerate(participles):
         if progress_callback and idx % 1000 == 0:
             progress_callback(idx, total)
@@ -4600,29 +4752,28 @@ def generate_gendered_participles(
             new_written = derive_written_from_stressed(new_stressed) if written else None
             new_written_source = "derived:orthography_rule" if new_written is not None else None
 
-            try:
-                conn.execute(
-                    verb_forms.insert().values(
-                        lemma_id=lemma_id,
-                        written=new_written,
-                        written_source=new_written_source,
-                        stressed=new_stressed,
-                        mood="participle",
-                        tense=None,  # Participles have aspect, not tense
-                        aspect="perfective",  # Past participles are perfective
-                        person=None,
-                        number=new_number,
-                        gender=new_gender,
-                        is_formal=False,
-                        is_negative=False,
-                        labels=labels,
-                        form_origin="derived:gender_rule",
-                    )
-                )
-                stats["forms_generated"] += 1
-            except IntegrityError:
-                # Duplicate form (unique constraint violation)
-                stats["duplicates_skipped"] += 1
+            batch.append(
+                {
+                    "lemma_id": lemma_id,
+                    "written": new_written,
+                    "written_source": new_written_source,
+                    "stressed": new_stressed,
+                    "mood": "participle",
+                    "tense": None,  # Participles have aspect, not tense
+                    "aspect": "perfective",  # Past participles are perfective
+                    "person": None,
+                    "number": new_number,
+                    "gender": new_gender,
+                    "is_formal": False,
+                    "is_negative": False,
+                    "labels": labels,
+                    "form_origin": "derived:gender_rule",
+                }
+            )
+            if len(batch) >= _PARTICIPLE_BATCH_SIZE:
+                flush_batch()
+
+    flush_batch()
 
     if progress_callback:
         progress_callback(total, total)
@@ -4736,21 +4887,22 @@ def _insert_noun_form(
 
     try:
         conn.execute(
-            noun_forms.insert().values(
-                lemma_id=lemma_id,
-                written=written,
-                written_source=written_source,
-                stressed=stressed,
-                gender=gender,
-                number=number,
-                labels=None,
-                derivation_type=None,
-                meaning_hint=None,
-                definite_article=definite_article,
-                article_source=article_source,
-                form_origin=form_origin,
-                is_citation_form=False,
-            )
+            _FORM_INSERT_STMTS[POS.NOUN],
+            {
+                "lemma_id": lemma_id,
+                "written": written,
+                "written_source": written_source,
+                "stressed": stressed,
+                "gender": gender,
+                "number": number,
+                "labels": None,
+                "derivation_type": None,
+                "meaning_hint": None,
+                "definite_article": definite_article,
+                "article_source": article_source,
+                "form_origin": form_origin,
+                "is_citation_form": False,
+            },
         )
         return True
     except IntegrityError:
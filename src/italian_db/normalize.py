@@ -1,11 +1,22 @@
 """Text normalization utilities for matching Italian words across sources."""
 
 import logging
+import re
 import unicodedata
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+# Italian accented vowels mapped straight to their base letters, so the common case
+# is a single C-level str.translate() instead of NFD decomposition per character
+_ACCENT_TRANSLATION = str.maketrans(
+    {c: unicodedata.normalize("NFD", c)[0] for c in "àáèéìíòóùúÀÁÈÉÌÍÒÓÙÚ"}
+)
+
+
+# Importers normalize the same common words over and over, so results are cached
+@lru_cache(maxsize=200_000)
 def normalize(text: str) -> str:
     """Normalize Italian text for matching/lookup.
 
@@ -22,13 +33,41 @@ def normalize(text: str) -> str:
         >>> normalize("Mangiare")
         'mangiare'
     """
-    # NFD decomposition separates base characters from combining diacriticals
-    decomposed = unicodedata.normalize("NFD", text)
-    # Filter out combining diacritical marks (category "Mn")
-    stripped = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+    # Plain ASCII (most infinitives and common words) has nothing to strip
+    if text.isascii():
+        return text.lower()
+    stripped = text.translate(_ACCENT_TRANSLATION)
+    # Anything still non-ASCII (e.g., "ç", "ö", combining marks) takes the general path
+    if not stripped.isascii():
+        # NFD decomposition separates base characters from combining diacriticals
+        decomposed = unicodedata.normalize("NFD", stripped)
+        # Filter out combining diacritical marks (category "Mn")
+        stripped = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
     return stripped.lower()
 
 
+# Candidate tokens: runs of \w minus digits and underscore, plus apostrophes.
+# This is wider than str.isalpha() (it also admits superscripts, fractions,
+# Roman numerals and combining marks), so tokenize() re-splits any run that
+# holds such characters.
+_TOKEN_RE = re.compile(r"(?:[^\W\d_]|')+")
+
+
+def _split_non_alpha(run: str) -> list[str]:
+    """Split a candidate run on characters that are not isalpha() or apostrophes."""
+    pieces: list[str] = []
+    current: list[str] = []
+    for char in run:
+        if char.isalpha() or char == "'":
+            current.append(char)
+        elif current:
+            pieces.append("".join(current))
+            current = []
+    if current:
+        pieces.append("".join(current))
+    return pieces
+
+
 def tokenize(text: str) -> list[str]:
     """Split Italian text into word tokens.
 
@@ -41,29 +80,15 @@ def tokenize(text: str) -> list[str]:
         >>> tokenize("Dov'è il libro?")
         ["dov'è", 'il', 'libro']
     """
-    # Replace common punctuation with spaces, preserving apostrophes within words
+    # Runs of letters and apostrophes; leading/trailing apostrophes are stripped
     result: list[str] = []
-    current_word: list[str] = []
-
-    for char in text:
-        if char.isalpha() or char == "'":
-            current_word.append(char)
-        else:
-            if current_word:
-                word = "".join(current_word).lower()
-                # Strip leading/trailing apostrophes
-                word = word.strip("'")
-                if word:
-                    result.append(word)
-                current_word = []
-
-    # Don't forget the last word
-    if current_word:
-        word = "".join(current_word).lower()
-        word = word.strip("'")
-        if word:
-            result.append(word)
-
+    for match in _TOKEN_RE.findall(text):
+        # Common case: every character is a letter or an apostrophe
+        runs = [match] if match.replace("'", "").isalpha() else _split_non_alpha(match)
+        for run in runs:
+            word = run.strip("'")
+            if word:
+                result.append(word.lower())
     return result
 
 
@@ -137,69 +162,76 @@ ACCENT_BLACKLIST = frozenset({"qua", "qui"})
 # requiring special handling.
 # ============================================================================
 
-# French loanwords with accents that must be preserved in written Italian.
+# French loanwords with accents that must be preserved in written Italian;
+# a whitelisted word is its own written form.
 # These bypass the normal accent-stripping logic and multi-accent warning.
 # The whitelist is checked FIRST in _derive_single_word(), so multi-accent
 # French words work correctly when whitelisted.
-FRENCH_LOANWORD_WHITELIST: dict[str, str] = {
-    # =========================================================================
-    # Multi-accent words
-    # =========================================================================
-    "arrière-pensée": "arrière-pensée",
-    "décolleté": "décolleté",
-    "défilé": "défilé",
-    "démodé": "démodé",
-    "négligé": "négligé",
-    "séparé": "séparé",
-    # =========================================================================
-    # Single-accent French loanwords
-    # These have Italian-detectable accents (é, è) in non-final position
-    # =========================================================================
-    "ampère": "ampère",
-    "arrière-goût": "arrière-goût",
-    "bohémien": "bohémien",
-    "brisée": "brisée",  # From phrases like "pasta brisée"
-    "brûlé": "brûlé",
-    "café-chantant": "café-chantant",
-    "crépon": "crépon",
-    "d'emblée": "d'emblée",
-    "débauche": "débauche",
-    "débrayage": "débrayage",
-    "défaillance": "défaillance",
-    "démaquillage": "démaquillage",
-    "dépendance": "dépendance",
-    "dépliant": "dépliant",
-    "doléances": "doléances",  # From "cahier de doléances"
-    "eurochèque": "eurochèque",
-    "garçonnière": "garçonnière",
-    "guêpière": "guêpière",
-    "matinée": "matinée",
-    "mèche": "mèche",
-    "mélo": "mélo",
-    "mêlée": "mêlée",  # From "au-dessus de la mêlée"
-    "nécessaire": "nécessaire",
-    "pré-maman": "pré-maman",
-    "randonnée": "randonnée",
-    "rétro": "rétro",
-    "sommelière": "sommelière",
-    "tournée": "tournée",
-    "éclair": "éclair",
-    "écru": "écru",
-    "élite": "élite",
-    "épagneul": "épagneul",
-    "étoile": "étoile",
-    # =========================================================================
-    # Single-letter word
-    # Italian has no pedagogical "à" - the only uses are:
-    #   1. French preposition (à la page) - orthographic, should preserve
-    #   2. Obsolete Italian "ha" - also orthographic, would also preserve
-    # =========================================================================
-    "à": "à",  # From "à la page"
-}
+FRENCH_LOANWORD_WHITELIST = frozenset(
+    {
+        # =========================================================================
+        # Multi-accent words
+        # =========================================================================
+        "arrière-pensée",
+        "décolleté",
+        "défilé",
+        "démodé",
+        "négligé",
+        "séparé",
+        # =========================================================================
+        # Single-accent French loanwords
+        # These have Italian-detectable accents (é, è) in non-final position
+        # =========================================================================
+        "ampère",
+        "arrière-goût",
+        "bohémien",
+        "brisée",  # From phrases like "pasta brisée"
+        "brûlé",
+        "café-chantant",
+        "crépon",
+        "d'emblée",
+        "débauche",
+        "débrayage",
+        "défaillance",
+        "démaquillage",
+        "dépendance",
+        "dépliant",
+        "doléances",  # From "cahier de doléances"
+        "eurochèque",
+        "garçonnière",
+        "guêpière",
+        "matinée",
+        "mèche",
+        "mélo",
+        "mêlée",  # From "au-dessus de la mêlée"
+        "nécessaire",
+        "pré-maman",
+        "randonnée",
+        "rétro",
+        "sommelière",
+        "tournée",
+        "éclair",
+        "écru",
+        "élite",
+        "épagneul",
+        "étoile",
+        # =========================================================================
+        # Single-letter word
+        # Italian has no pedagogical "à" - the only uses are:
+        #   1. French preposition (à la page) - orthographic, should preserve
+        #   2. Obsolete Italian "ha" - also orthographic, would also preserve
+        # =========================================================================
+        "à",  # From "à la page"
+    }
+)
 
 # All accented characters (both uppercase and lowercase)
 ACCENTED_CHARS = frozenset("àèéìòóùÀÈÉÌÒÓÙ")
 
+# Deletes every accented character, so an accent count is a length difference
+# computed by a single C-level str.translate() pass
+_ACCENT_DELETE = str.maketrans("", "", "".join(sorted(ACCENTED_CHARS)))
+
 # Accented characters that can appear at end of word (lowercase only)
 ACCENTED_FINAL = frozenset("àèéìòóù")
 
@@ -207,6 +239,9 @@ ACCENTED_FINAL = frozenset("àèéìòóù")
 VOWELS = frozenset("aeiouAEIOU")
 
 
+# Cached separately from derive_written_from_stressed: words inside distinct
+# multi-word phrases recur far more often than the phrases themselves
+@lru_cache(maxsize=200_000)
 def _derive_single_word(word: str, *, warn: bool = True) -> str | None:
     """Derive written form for a single word (no spaces).
 
@@ -222,10 +257,10 @@ def _derive_single_word(word: str, *, warn: bool = True) -> str | None:
 
     # Check French loanword whitelist first (bypasses multi-accent warning)
     if word in FRENCH_LOANWORD_WHITELIST:
-        return FRENCH_LOANWORD_WHITELIST[word]
+        return word
 
     # Count accent marks in this single word
-    accent_count = sum(1 for c in word if c in ACCENTED_CHARS)
+    accent_count = len(word) - len(word.translate(_ACCENT_DELETE))
 
     if accent_count > 1:
         # Multiple accents in a single word is unusual
@@ -257,7 +292,7 @@ def _derive_single_word(word: str, *, warn: bool = True) -> str | None:
 
     # Stem vowel test: does the stem (word minus final letter) contain vowels?
     stem = word[:-1]
-    if any(c in VOWELS for c in stem):
+    if not VOWELS.isdisjoint(stem):
         # Polysyllable with final accent: keep the accent
         return word
     else:
@@ -266,6 +301,10 @@ def _derive_single_word(word: str, *, warn: bool = True) -> str | None:
         return normalized
 
 
+# Pure function of its arguments, called for every form by several importers
+# (the same stressed forms recur across sources). A cached multi-accent result
+# logs its warning only on the first call.
+@lru_cache(maxsize=100_000)
 def derive_written_from_stressed(stressed: str, *, warn: bool = True) -> str | None:
     """Derive written form from stressed form using Italian orthography rules.
 
@@ -306,13 +345,16 @@ def derive_written_from_stressed(stressed: str, *, warn: bool = True) -> str | N
         return None
 
     # Handle multi-word phrases by applying rule to each word
+    # (the " " check is a single C scan, so single words skip the split entirely)
     if " " in stressed:
-        words = stressed.split()
-        derived_words = [_derive_single_word(w, warn=warn) for w in words]
-        # If any word fails, the whole phrase fails
-        if any(w is None for w in derived_words):
-            return None
-        return " ".join(derived_words)  # type: ignore[arg-type]
+        derived_words: list[str] = []
+        for w in stressed.split():
+            derived = _derive_single_word(w, warn=warn)
+            # If any word fails, the whole phrase fails
+            if derived is None:
+                return None
+            derived_words.append(derived)
+        return " ".join(derived_words)
 
     # Single word
     return _derive_single_word(stressed, warn=warn)
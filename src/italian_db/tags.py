@@ -1,6 +1,8 @@
 """Parse wiktextract tags into structured grammatical features."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 
 from italian_db.enums import DerivationType
 
@@ -116,8 +118,15 @@ DEGREE_TAGS = frozenset({"superlative", "comparative"})
 # Noun derivation tags (these modify the base form semantically)
 NOUN_DERIVATION_TAGS = frozenset(d.value for d in DerivationType)
 
+# Precomputed tag sets used by the parse_* functions, so each call doesn't
+# rebuild them. Verbs treat "canonical" as the infinitive, so it isn't skipped.
+_PERSON_TAGS = frozenset(PERSON_MAP)
+_VERB_SKIP_TAGS = SKIP_TAGS - {"canonical"}
+_NOUN_MEANINGFUL_TAGS = NUMBER_TAGS | NOUN_DERIVATION_TAGS
+_ADJECTIVE_MEANINGFUL_TAGS = NUMBER_TAGS | GENDER_TAGS | DEGREE_TAGS
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class VerbFormFeatures:
     """Parsed grammatical features for a verb form."""
 
@@ -133,7 +142,7 @@ class VerbFormFeatures:
     should_filter: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NounFormFeatures:
     """Parsed grammatical features for a noun form."""
 
@@ -143,7 +152,7 @@ class NounFormFeatures:
     should_filter: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdjectiveFormFeatures:
     """Parsed grammatical features for an adjective form."""
 
@@ -154,19 +163,16 @@ class AdjectiveFormFeatures:
     should_filter: bool = False
 
 
-def should_filter_form(tags: list[str]) -> bool:
-    """Check if a form should be filtered out entirely."""
-    tag_set = set(tags)
-
-    # Filter if has any filter tags
-    if tag_set & FILTER_TAGS:
-        return True
+def should_filter_form(tags: Iterable[str]) -> bool:
+    """Check if a form should be filtered out entirely.
 
-    # Filter if alternative + misspelling
-    return "alternative" in tag_set and "misspelling" in tag_set
+    Accepts any iterable of tags; callers holding a tag set can pass it directly.
+    Alternative misspellings are covered by "misspelling" in FILTER_TAGS.
+    """
+    return not FILTER_TAGS.isdisjoint(tags)
 
 
-def _extract_labels(tags: set[str]) -> list[str] | None:
+def _extract_labels(tags: frozenset[str]) -> list[str] | None:
     """Extract labels from tags, mapping to canonical forms.
 
     Uses LABEL_CANONICAL to map raw wiktextract tags (e.g., "Tuscany", "slang")
@@ -178,7 +184,7 @@ def _extract_labels(tags: set[str]) -> list[str] | None:
     return sorted(canonical) if canonical else None
 
 
-def _extract_tense(tags: set[str], mood: str | None) -> str | None:
+def _extract_tense(tags: frozenset[str], mood: str | None) -> str | None:
     """Extract tense from tags, handling passato remoto specially.
 
     For participles, tense is NULL - the "past"/"present" distinction is
@@ -207,7 +213,7 @@ def _extract_tense(tags: set[str], mood: str | None) -> str | None:
     return None
 
 
-def _extract_aspect(tags: set[str], mood: str | None) -> str | None:
+def _extract_aspect(tags: frozenset[str], mood: str | None) -> str | None:
     """Extract aspect from tags for participles.
 
     Participles have aspect rather than tense:
@@ -234,70 +240,60 @@ def parse_verb_tags(tags: list[str]) -> VerbFormFeatures:
         tags: List of wiktextract tags
 
     Returns:
-        VerbFormFeatures with parsed data
+        VerbFormFeatures with parsed data. Results are cached per tag set and
+        shared between calls, which is why the dataclass is frozen.
     """
-    result = VerbFormFeatures()
-    tag_set = set(tags)
+    return _parse_verb_tag_set(frozenset(tags))
+
 
+# Wiktextract repeats the same few hundred tag combinations across every
+# inflection table, so each distinct tag set is parsed once
+@lru_cache(maxsize=4096)
+def _parse_verb_tag_set(tag_set: frozenset[str]) -> VerbFormFeatures:
+    """Cached body of parse_verb_tags(), keyed by the (order-independent) tag set."""
     # Check if should filter
-    if should_filter_form(tags):
-        result.should_filter = True
-        return result
+    if should_filter_form(tag_set):
+        return VerbFormFeatures(should_filter=True)
 
     # Skip metadata tags (but not "canonical" - we treat it as infinitive below)
-    if tag_set & (SKIP_TAGS - {"canonical"}):
-        result.should_filter = True
-        return result
+    if not tag_set.isdisjoint(_VERB_SKIP_TAGS):
+        return VerbFormFeatures(should_filter=True)
 
     # Extract mood
-    for tag in tag_set:
-        if tag in MOOD_TAGS:
-            result.mood = tag
-            break
+    mood = next(iter(tag_set & MOOD_TAGS), None)
 
     # For verbs, "canonical" tag means infinitive (the citation form)
     # This handles sparse Wiktionary entries that lack conjugation tables
-    if result.mood is None and "canonical" in tag_set:
-        result.mood = "infinitive"
+    if mood is None and "canonical" in tag_set:
+        mood = "infinitive"
 
     # Filter participles with person tags - these are Wiktextract data bugs.
     # Participles don't have person (they're non-finite). The 2 known cases are
     # empiùto and riempiùto from empiere/riempiere's malformed head section entries
     # with tags like ['first-person', 'participle', 'past', 'present', 'singular'].
-    if result.mood == "participle" and tag_set & set(PERSON_MAP.keys()):
-        result.should_filter = True
-        return result
-
-    # Extract tense and aspect
-    result.tense = _extract_tense(tag_set, result.mood)
-    result.aspect = _extract_aspect(tag_set, result.mood)
-
-    # Extract person
-    for tag, person in PERSON_MAP.items():
-        if tag in tag_set:
-            result.person = person
-            break
-
-    # Extract number
-    for tag in NUMBER_TAGS:
-        if tag in tag_set:
-            result.number = tag
-            break
+    if mood == "participle" and not tag_set.isdisjoint(_PERSON_TAGS):
+        return VerbFormFeatures(mood=mood, should_filter=True)
 
-    # Extract gender (for participles) - convert to short form
-    for tag in GENDER_TAGS:
-        if tag in tag_set:
-            result.gender = "m" if tag == "masculine" else "f"
-            break
-
-    # Extract booleans
-    result.is_formal = "formal" in tag_set
-    result.is_negative = "negative" in tag_set
+    # Extract person (lowest person wins, matching PERSON_MAP order)
+    person_tags = tag_set & _PERSON_TAGS
+    person = min(PERSON_MAP[tag] for tag in person_tags) if person_tags else None
 
-    # Extract labels
-    result.labels = _extract_labels(tag_set)
-
-    return result
+    # Extract gender (for participles) - convert to short form
+    gender_tag = next(iter(tag_set & GENDER_TAGS), None)
+    gender = ("m" if gender_tag == "masculine" else "f") if gender_tag else None
+
+    return VerbFormFeatures(
+        mood=mood,
+        # Extract tense and aspect
+        tense=_extract_tense(tag_set, mood),
+        aspect=_extract_aspect(tag_set, mood),
+        person=person,
+        number=next(iter(tag_set & NUMBER_TAGS), None),
+        gender=gender,
+        is_formal="formal" in tag_set,
+        is_negative="negative" in tag_set,
+        labels=_extract_labels(tag_set),
+    )
 
 
 def parse_noun_tags(tags: list[str]) -> NounFormFeatures:
@@ -307,40 +303,37 @@ def parse_noun_tags(tags: list[str]) -> NounFormFeatures:
         tags: List of wiktextract tags
 
     Returns:
-        NounFormFeatures with parsed data
+        NounFormFeatures with parsed data. Results are cached per tag set and
+        shared between calls, which is why the dataclass is frozen.
     """
-    result = NounFormFeatures()
-    tag_set = set(tags)
+    return _parse_noun_tag_set(frozenset(tags))
 
+
+@lru_cache(maxsize=4096)
+def _parse_noun_tag_set(tag_set: frozenset[str]) -> NounFormFeatures:
+    """Cached body of parse_noun_tags(), keyed by the (order-independent) tag set."""
     # Check if should filter
-    if should_filter_form(tags):
-        result.should_filter = True
-        return result
+    if should_filter_form(tag_set):
+        return NounFormFeatures(should_filter=True)
 
     # Skip metadata-only tags for nouns, but keep forms that have number info
     # (canonical is allowed for nouns/adjectives when combined with number)
     metadata_tags = tag_set & SKIP_TAGS
     meaningful_tags = tag_set - SKIP_TAGS
-    if metadata_tags and not (meaningful_tags & (NUMBER_TAGS | NOUN_DERIVATION_TAGS)):
-        result.should_filter = True
-        return result
-
-    # Extract number
-    for tag in NUMBER_TAGS:
-        if tag in tag_set:
-            result.number = tag
-            break
+    if metadata_tags and meaningful_tags.isdisjoint(_NOUN_MEANINGFUL_TAGS):
+        return NounFormFeatures(should_filter=True)
 
     # Extract derivation type (mutually exclusive)
-    for dtype in DerivationType:
-        if dtype.value in tag_set:
-            result.derivation_type = dtype
-            break
+    derivation_type = next(
+        (dtype for dtype in DerivationType if dtype.value in tag_set),
+        None,
+    )
 
-    # Extract labels
-    result.labels = _extract_labels(tag_set)
-
-    return result
+    return NounFormFeatures(
+        number=next(iter(tag_set & NUMBER_TAGS), None),
+        labels=_extract_labels(tag_set),
+        derivation_type=derivation_type,
+    )
 
 
 def parse_adjective_tags(tags: list[str]) -> AdjectiveFormFeatures:
@@ -350,45 +343,41 @@ def parse_adjective_tags(tags: list[str]) -> AdjectiveFormFeatures:
         tags: List of wiktextract tags
 
     Returns:
-        AdjectiveFormFeatures with parsed data
+        AdjectiveFormFeatures with parsed data. Results are cached per tag set and
+        shared between calls, which is why the dataclass is frozen.
     """
-    result = AdjectiveFormFeatures()
-    tag_set = set(tags)
+    return _parse_adjective_tag_set(frozenset(tags))
+
 
+@lru_cache(maxsize=4096)
+def _parse_adjective_tag_set(tag_set: frozenset[str]) -> AdjectiveFormFeatures:
+    """Cached body of parse_adjective_tags(), keyed by the (order-independent) tag set."""
     # Check if should filter
-    if should_filter_form(tags):
-        result.should_filter = True
-        return result
+    if should_filter_form(tag_set):
+        return AdjectiveFormFeatures(should_filter=True)
 
     # Skip metadata-only tags for adjectives, but keep forms that have gender/number info
     # (canonical is allowed for adjectives when combined with gender/number)
     metadata_tags = tag_set & SKIP_TAGS
     meaningful_tags = tag_set - SKIP_TAGS
-    if metadata_tags and not (meaningful_tags & (NUMBER_TAGS | GENDER_TAGS | DEGREE_TAGS)):
-        result.should_filter = True
-        return result
+    if metadata_tags and meaningful_tags.isdisjoint(_ADJECTIVE_MEANINGFUL_TAGS):
+        return AdjectiveFormFeatures(should_filter=True)
 
     # Extract gender - convert to short form
-    for tag in GENDER_TAGS:
-        if tag in tag_set:
-            result.gender = "m" if tag == "masculine" else "f"
-            break
-
-    # Extract number
-    for tag in NUMBER_TAGS:
-        if tag in tag_set:
-            result.number = tag
-            break
+    gender_tag = next(iter(tag_set & GENDER_TAGS), None)
+    gender = ("m" if gender_tag == "masculine" else "f") if gender_tag else None
 
     # Extract degree
     if "superlative" in tag_set:
-        result.degree = "superlative"
+        degree = "superlative"
     elif "comparative" in tag_set:
-        result.degree = "comparative"
+        degree = "comparative"
     else:
-        result.degree = "positive"
-
-    # Extract labels
-    result.labels = _extract_labels(tag_set)
-
-    return result
+        degree = "positive"
+
+    return AdjectiveFormFeatures(
+        gender=gender,
+        number=next(iter(tag_set & NUMBER_TAGS), None),
+        degree=degree,
+        labels=_extract_labels(tag_set),
+    )
@@ -13,13 +13,15 @@ Usage:
             sys.exit(1)
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 
-from sqlalchemy import Connection, text
+from sqlalchemy import Connection, Row, TextClause, bindparam, text
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single verification check."""
 
@@ -29,7 +31,7 @@ class CheckResult:
     details: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationReport:
     """Complete verification report with all check results and metrics."""
 
@@ -39,27 +41,24 @@ class VerificationReport:
     spot_checks: list[CheckResult] = field(default_factory=lambda: list[CheckResult]())
     metrics: dict[str, Any] = field(default_factory=lambda: dict[str, Any]())
 
+    def _all_checks(self) -> Iterator[CheckResult]:
+        """Iterate over every check result without building a combined list."""
+        return chain(
+            self.integrity_checks,
+            self.consistency_checks,
+            self.coverage_checks,
+            self.spot_checks,
+        )
+
     @property
     def all_passed(self) -> bool:
         """Return True if all checks passed."""
-        all_checks = (
-            self.integrity_checks
-            + self.consistency_checks
-            + self.coverage_checks
-            + self.spot_checks
-        )
-        return all(check.passed for check in all_checks)
+        return all(check.passed for check in self._all_checks())
 
     @property
     def failed_count(self) -> int:
         """Return the number of failed checks."""
-        all_checks = (
-            self.integrity_checks
-            + self.consistency_checks
-            + self.coverage_checks
-            + self.spot_checks
-        )
-        return sum(1 for check in all_checks if not check.passed)
+        return sum(1 for check in self._all_checks() if not check.passed)
 
     @property
     def total_count(self) -> int:
@@ -114,16 +113,33 @@ class VerificationReport:
 # =============================================================================
 
 
+# Number of offending rows kept as details by checks that only sample
+_DETAIL_SAMPLE_SIZE = 10
+
+
+def _sample_and_count(conn: Connection, query: TextClause) -> tuple[list[Row[Any]], int]:
+    """Return the first _DETAIL_SAMPLE_SIZE result rows and the total row count.
+
+    Rows are counted while iterating the cursor, so a badly broken database
+    doesn't have its whole result set materialized just to report ten examples.
+    """
+    sample: list[Row[Any]] = []
+    count = 0
+    for row in conn.execute(query):
+        if count < _DETAIL_SAMPLE_SIZE:
+            sample.append(row)
+        count += 1
+    return sample, count
+
+
 def check_orphaned_frequencies(conn: Connection) -> CheckResult:
     """Check that all frequency records reference existing lemmas."""
     query = text("""
         SELECT f.lemma_id
         FROM frequencies f
-        LEFT JOIN lemmas l ON f.lemma_id = l.id
-        WHERE l.id IS NULL
+        WHERE NOT EXISTS (SELECT 1 FROM lemmas l WHERE l.id = f.lemma_id)
     """)
-    result = conn.execute(query).fetchall()
-    count = len(result)
+    sample, count = _sample_and_count(conn, query)
 
     if count == 0:
         return CheckResult(
@@ -132,7 +148,7 @@ def check_orphaned_frequencies(conn: Connection) -> CheckResult:
             message="No orphaned frequencies",
         )
     else:
-        details = [f"lemma_id={row[0]}" for row in result[:10]]
+        details = [f"lemma_id={row[0]}" for row in sample]
         return CheckResult(
             name="orphaned_frequencies",
             passed=False,
@@ -143,29 +159,20 @@ def check_orphaned_frequencies(conn: Connection) -> CheckResult:
 
 def check_orphaned_translations(conn: Connection) -> CheckResult:
     """Check that all translations reference existing sentences."""
-    issues: list[str] = []
-
-    # Check Italian sentence references
+    # Both sentence references in one round trip; the first column names the
+    # dangling reference
     query = text("""
-        SELECT t.ita_sentence_id
+        SELECT 'ita_sentence_id', t.ita_sentence_id
         FROM translations t
-        LEFT JOIN sentences s ON t.ita_sentence_id = s.sentence_id
-        WHERE s.sentence_id IS NULL
-    """)
-    result = conn.execute(query).fetchall()
-    issues.extend(f"ita_sentence_id={row[0]}" for row in result)
-
-    # Check English sentence references
-    query = text("""
-        SELECT t.eng_sentence_id
+        WHERE NOT EXISTS (SELECT 1 FROM sentences s WHERE s.sentence_id = t.ita_sentence_id)
+        UNION ALL
+        SELECT 'eng_sentence_id', t.eng_sentence_id
         FROM translations t
-        LEFT JOIN sentences s ON t.eng_sentence_id = s.sentence_id
-        WHERE s.sentence_id IS NULL
+        WHERE NOT EXISTS (SELECT 1 FROM sentences s WHERE s.sentence_id = t.eng_sentence_id)
     """)
-    result = conn.execute(query).fetchall()
-    issues.extend(f"eng_sentence_id={row[0]}" for row in result)
+    sample, count = _sample_and_count(conn, query)
 
-    if not issues:
+    if count == 0:
         return CheckResult(
             name="orphaned_translations",
             passed=True,
@@ -175,8 +182,8 @@ def check_orphaned_translations(conn: Connection) -> CheckResult:
         return CheckResult(
             name="orphaned_translations",
             passed=False,
-            message=f"Orphaned translations: {len(issues)} records without sentences",
-            details=issues[:10],
+            message=f"Orphaned translations: {count} records without sentences",
+            details=[f"{row[0]}={row[1]}" for row in sample],
         )
 
 
@@ -185,37 +192,31 @@ def check_orphaned_translations(conn: Connection) -> CheckResult:
 # =============================================================================
 
 
+# Form number that a noun of the given number_class must not have
+_FORBIDDEN_NUMBER = {"pluralia_tantum": "singular", "singularia_tantum": "plural"}
+
+
 def check_number_class_consistency(conn: Connection) -> CheckResult:
     """Check that number_class aligns with actual form data.
 
     - pluralia_tantum: should have no singular forms
     - singularia_tantum: should have no plural forms
     """
-    issues: list[str] = []
-
-    # Pluralia tantum with singular forms
-    query = text("""
-        SELECT l.stressed, COUNT(*) as sg_count
-        FROM noun_metadata nm
-        JOIN lemmas l ON nm.lemma_id = l.id
-        JOIN noun_forms nf ON nm.lemma_id = nf.lemma_id
-        WHERE nm.number_class = 'pluralia_tantum' AND nf.number = 'singular'
-        GROUP BY nm.lemma_id
-    """)
-    result = conn.execute(query).fetchall()
-    issues.extend(f"pluralia_tantum with {row[1]} singular forms: {row[0]}" for row in result)
-
-    # Singularia tantum with plural forms
+    # Both violation kinds in one join, pluralia_tantum rows first
     query = text("""
-        SELECT l.stressed, COUNT(*) as pl_count
+        SELECT l.stressed, nm.number_class, COUNT(*) as form_count
         FROM noun_metadata nm
         JOIN lemmas l ON nm.lemma_id = l.id
         JOIN noun_forms nf ON nm.lemma_id = nf.lemma_id
-        WHERE nm.number_class = 'singularia_tantum' AND nf.number = 'plural'
-        GROUP BY nm.lemma_id
+        WHERE (nm.number_class = 'pluralia_tantum' AND nf.number = 'singular')
+           OR (nm.number_class = 'singularia_tantum' AND nf.number = 'plural')
+        GROUP BY nm.lemma_id, nm.number_class
+        ORDER BY nm.number_class, nm.lemma_id
     """)
     result = conn.execute(query).fetchall()
-    issues.extend(f"singularia_tantum with {row[1]} plural forms: {row[0]}" for row in result)
+    issues = [
+        f"{row[1]} with {row[2]} {_FORBIDDEN_NUMBER[row[1]]} forms: {row[0]}" for row in result
+    ]
 
     if not issues:
         return CheckResult(
@@ -294,37 +295,25 @@ def check_citation_form_existence(conn: Connection) -> CheckResult:
 
 def check_metadata_row_existence(conn: Connection) -> CheckResult:
     """Check that every verb/noun/adjective lemma has a metadata row."""
-    issues: list[str] = []
-
-    # Verbs without metadata
-    query = text("""
-        SELECT l.id, l.stressed
-        FROM lemmas l
-        LEFT JOIN verb_metadata vm ON l.id = vm.lemma_id
-        WHERE l.pos = 'verb' AND vm.lemma_id IS NULL
-    """)
-    result = conn.execute(query).fetchall()
-    issues.extend(f"verb without metadata: {row[1]} (id={row[0]})" for row in result)
-
-    # Nouns without metadata
-    query = text("""
-        SELECT l.id, l.stressed
-        FROM lemmas l
-        LEFT JOIN noun_metadata nm ON l.id = nm.lemma_id
-        WHERE l.pos = 'noun' AND nm.lemma_id IS NULL
-    """)
-    result = conn.execute(query).fetchall()
-    issues.extend(f"noun without metadata: {row[1]} (id={row[0]})" for row in result)
-
-    # Adjectives without metadata
+    # Single pass over lemmas, probing the metadata table for each lemma's POS
     query = text("""
-        SELECT l.id, l.stressed
+        SELECT l.pos, l.id, l.stressed
         FROM lemmas l
-        LEFT JOIN adjective_metadata am ON l.id = am.lemma_id
-        WHERE l.pos = 'adjective' AND am.lemma_id IS NULL
+        WHERE (l.pos = 'verb'
+               AND NOT EXISTS (SELECT 1 FROM verb_metadata vm WHERE vm.lemma_id = l.id))
+           OR (l.pos = 'noun'
+               AND NOT EXISTS (SELECT 1 FROM noun_metadata nm WHERE nm.lemma_id = l.id))
+           OR (l.pos = 'adjective'
+               AND NOT EXISTS (SELECT 1 FROM adjective_metadata am WHERE am.lemma_id = l.id))
     """)
-    result = conn.execute(query).fetchall()
-    issues.extend(f"adjective without metadata: {row[1]} (id={row[0]})" for row in result)
+    missing_by_pos: dict[str, list[str]] = {}
+    for pos, lemma_id, stressed in conn.execute(query):
+        missing_by_pos.setdefault(pos, []).append(
+            f"{pos} without metadata: {stressed} (id={lemma_id})"
+        )
+    issues = [
+        issue for pos in ("verb", "noun", "adjective") for issue in missing_by_pos.get(pos, [])
+    ]
 
     if not issues:
         return CheckResult(
@@ -346,6 +335,17 @@ def check_metadata_row_existence(conn: Connection) -> CheckResult:
 # =============================================================================
 
 
+# Per-form-table aggregates for the coverage checks: total rows and non-NULL
+# written / written_source counts (COUNT(column) skips NULLs)
+_FORM_COVERAGE_QUERIES = tuple(
+    text(sql)
+    for sql in (
+        "SELECT COUNT(*), COUNT(written), COUNT(written_source) FROM verb_forms",
+        "SELECT COUNT(*), COUNT(written), COUNT(written_source) FROM noun_forms",
+        "SELECT COUNT(*), COUNT(written), COUNT(written_source) FROM adjective_forms",
+    )
+)
+
 # Minimum thresholds based on current database stats
 COVERAGE_THRESHOLDS = {
     "total_lemmas": 100_000,
@@ -364,62 +364,44 @@ def check_coverage_thresholds(conn: Connection) -> list[CheckResult]:
     """Check that database meets minimum coverage thresholds."""
     results: list[CheckResult] = []
 
-    # Total lemmas
-    query = text("SELECT COUNT(*) FROM lemmas")
-    count = conn.execute(query).scalar() or 0
-    threshold = COVERAGE_THRESHOLDS["total_lemmas"]
-    results.append(
-        CheckResult(
-            name="total_lemmas",
-            passed=count >= threshold,
-            message=f"Lemmas: {count:,} (min: {threshold:,})",
-        )
-    )
-
-    # Verb lemmas
-    query = text("SELECT COUNT(*) FROM lemmas WHERE pos = 'verb'")
-    count = conn.execute(query).scalar() or 0
-    threshold = COVERAGE_THRESHOLDS["verb_lemmas"]
-    results.append(
-        CheckResult(
-            name="verb_lemmas",
-            passed=count >= threshold,
-            message=f"Verb lemmas: {count:,} (min: {threshold:,})",
-        )
-    )
-
-    # Noun lemmas
-    query = text("SELECT COUNT(*) FROM lemmas WHERE pos = 'noun'")
-    count = conn.execute(query).scalar() or 0
-    threshold = COVERAGE_THRESHOLDS["noun_lemmas"]
-    results.append(
-        CheckResult(
-            name="noun_lemmas",
-            passed=count >= threshold,
-            message=f"Noun lemmas: {count:,} (min: {threshold:,})",
+    # Lemma totals (overall and per POS) in a single pass over lemmas, along
+    # with the written_source count used for source coverage below
+    query = text("""
+        SELECT
+            COUNT(*),
+            SUM(CASE WHEN pos = 'verb' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN pos = 'noun' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN pos = 'adjective' THEN 1 ELSE 0 END),
+            COUNT(written_source)
+        FROM lemmas
+    """)
+    lemma_counts = conn.execute(query).one()
+    for name, label, count in (
+        ("total_lemmas", "Lemmas", lemma_counts[0]),
+        ("verb_lemmas", "Verb lemmas", lemma_counts[1]),
+        ("noun_lemmas", "Noun lemmas", lemma_counts[2]),
+        ("adjective_lemmas", "Adjective lemmas", lemma_counts[3]),
+    ):
+        count = count or 0
+        threshold = COVERAGE_THRESHOLDS[name]
+        results.append(
+            CheckResult(
+                name=name,
+                passed=count >= threshold,
+                message=f"{label}: {count:,} (min: {threshold:,})",
+            )
         )
-    )
 
-    # Adjective lemmas
-    query = text("SELECT COUNT(*) FROM lemmas WHERE pos = 'adjective'")
-    count = conn.execute(query).scalar() or 0
-    threshold = COVERAGE_THRESHOLDS["adjective_lemmas"]
-    results.append(
-        CheckResult(
-            name="adjective_lemmas",
-            passed=count >= threshold,
-            message=f"Adjective lemmas: {count:,} (min: {threshold:,})",
-        )
-    )
+    # Per-table form aggregates, summed here rather than streamed through a UNION ALL
+    total_forms = forms_with_written = forms_with_source = 0
+    for query in _FORM_COVERAGE_QUERIES:
+        table_total, table_written, table_source = conn.execute(query).one()
+        total_forms += table_total
+        forms_with_written += table_written
+        forms_with_source += table_source
 
     # Total forms (verb + noun + adjective)
-    query = text("""
-        SELECT
-            (SELECT COUNT(*) FROM verb_forms) +
-            (SELECT COUNT(*) FROM noun_forms) +
-            (SELECT COUNT(*) FROM adjective_forms)
-    """)
-    count = conn.execute(query).scalar() or 0
+    count = total_forms
     threshold = COVERAGE_THRESHOLDS["total_forms"]
     results.append(
         CheckResult(
@@ -430,19 +412,7 @@ def check_coverage_thresholds(conn: Connection) -> list[CheckResult]:
     )
 
     # Written spelling coverage
-    query = text("""
-        SELECT
-            CAST(SUM(CASE WHEN written IS NOT NULL THEN 1 ELSE 0 END) AS FLOAT) * 100 /
-            COUNT(*)
-        FROM (
-            SELECT written FROM verb_forms
-            UNION ALL
-            SELECT written FROM noun_forms
-            UNION ALL
-            SELECT written FROM adjective_forms
-        )
-    """)
-    pct = conn.execute(query).scalar() or 0.0
+    pct = forms_with_written * 100 / total_forms if total_forms else 0.0
     threshold = COVERAGE_THRESHOLDS["written_spelling_pct"]
     results.append(
         CheckResult(
@@ -453,21 +423,9 @@ def check_coverage_thresholds(conn: Connection) -> list[CheckResult]:
     )
 
     # Written source coverage (forms + lemmas)
-    query = text("""
-        SELECT
-            CAST(SUM(CASE WHEN written_source IS NOT NULL THEN 1 ELSE 0 END) AS FLOAT) * 100 /
-            COUNT(*)
-        FROM (
-            SELECT written_source FROM verb_forms
-            UNION ALL
-            SELECT written_source FROM noun_forms
-            UNION ALL
-            SELECT written_source FROM adjective_forms
-            UNION ALL
-            SELECT written_source FROM lemmas
-        )
-    """)
-    pct = conn.execute(query).scalar() or 0.0
+    source_total = total_forms + lemma_counts[0]
+    source_count = forms_with_source + lemma_counts[4]
+    pct = source_count * 100 / source_total if source_total else 0.0
     threshold = COVERAGE_THRESHOLDS["written_source_pct"]
     results.append(
         CheckResult(
@@ -477,12 +435,14 @@ def check_coverage_thresholds(conn: Connection) -> list[CheckResult]:
         )
     )
 
-    # Frequency coverage
+    # Frequency coverage (semi-join probing idx_frequencies_lemma per lemma,
+    # rather than a DISTINCT over all frequency rows)
     query = text("""
         SELECT
-            CAST(COUNT(DISTINCT f.lemma_id) AS FLOAT) * 100 /
+            CAST(COUNT(*) AS FLOAT) * 100 /
             (SELECT COUNT(*) FROM lemmas)
-        FROM frequencies f
+        FROM lemmas l
+        WHERE EXISTS (SELECT 1 FROM frequencies f WHERE f.lemma_id = l.id)
     """)
     pct = conn.execute(query).scalar() or 0.0
     threshold = COVERAGE_THRESHOLDS["frequency_coverage_pct"]
@@ -532,16 +492,64 @@ SPOT_CHECKS: list[tuple[str, str, dict[str, Any]]] = [
 ]
 
 
+def _lookup_by_lemma_id(conn: Connection, query: TextClause, ids: list[int]) -> dict[int, Any]:
+    """Run a (lemma_id, value) query over the given ids and return it as a dict."""
+    query = query.bindparams(bindparam("ids", expanding=True))
+    return {row[0]: row[1] for row in conn.execute(query, {"ids": ids})}
+
+
 def run_spot_checks(conn: Connection) -> list[CheckResult]:
-    """Run spot checks against known facts."""
+    """Run spot checks against known facts.
+
+    Lemma ids and every checked attribute are fetched with one query each
+    for all spot-check lemmas, then compared in Python.
+    """
     results: list[CheckResult] = []
 
+    query = text("SELECT stressed, pos, id FROM lemmas WHERE stressed IN :stressed").bindparams(
+        bindparam("stressed", expanding=True)
+    )
+    lemma_ids: dict[tuple[str, str], int] = {}
+    for row in conn.execute(query, {"stressed": sorted({s for s, _, _ in SPOT_CHECKS})}):
+        lemma_ids.setdefault((row[0], row[1]), row[2])
+    ids = list(lemma_ids.values())
+
+    verb_form_counts = _lookup_by_lemma_id(
+        conn,
+        text("""
+            SELECT lemma_id, COUNT(*) FROM verb_forms
+            WHERE lemma_id IN :ids GROUP BY lemma_id
+        """),
+        ids,
+    )
+    auxiliaries = _lookup_by_lemma_id(
+        conn, text("SELECT lemma_id, auxiliary FROM verb_metadata WHERE lemma_id IN :ids"), ids
+    )
+    gender_classes = _lookup_by_lemma_id(
+        conn, text("SELECT lemma_id, gender_class FROM noun_metadata WHERE lemma_id IN :ids"), ids
+    )
+    # EXISTS stops at the first plural form instead of counting them all
+    has_plurals = _lookup_by_lemma_id(
+        conn,
+        text("""
+            SELECT l.id, EXISTS (
+                SELECT 1 FROM noun_forms nf WHERE nf.lemma_id = l.id AND nf.number = 'plural'
+            )
+            FROM lemmas l
+            WHERE l.id IN :ids
+        """),
+        ids,
+    )
+    inflection_classes = _lookup_by_lemma_id(
+        conn,
+        text("SELECT lemma_id, inflection_class FROM adjective_metadata WHERE lemma_id IN :ids"),
+        ids,
+    )
+
     for stressed, pos, checks in SPOT_CHECKS:
-        # Find the lemma
-        query = text("SELECT id FROM lemmas WHERE stressed = :stressed AND pos = :pos")
-        row = conn.execute(query, {"stressed": stressed, "pos": pos}).fetchone()
+        lemma_id = lemma_ids.get((stressed, pos))
 
-        if not row:
+        if lemma_id is None:
             results.append(
                 CheckResult(
                     name=f"spot_{stressed}",
@@ -551,45 +559,35 @@ def run_spot_checks(conn: Connection) -> list[CheckResult]:
             )
             continue
 
-        lemma_id = row[0]
         issues: list[str] = []
 
         # Check min_forms for verbs
         if "min_forms" in checks:
-            query = text("SELECT COUNT(*) FROM verb_forms WHERE lemma_id = :id")
-            count = conn.execute(query, {"id": lemma_id}).scalar() or 0
+            count = verb_form_counts.get(lemma_id, 0)
             if count < checks["min_forms"]:
                 issues.append(f"forms: {count} < {checks['min_forms']}")
 
         # Check auxiliary for verbs
         if "auxiliary" in checks:
-            query = text("SELECT auxiliary FROM verb_metadata WHERE lemma_id = :id")
-            aux = conn.execute(query, {"id": lemma_id}).scalar()
+            aux = auxiliaries.get(lemma_id)
             if aux != checks["auxiliary"]:
                 issues.append(f"auxiliary: {aux} != {checks['auxiliary']}")
 
         # Check gender_class for nouns
         if "gender_class" in checks:
-            query = text("SELECT gender_class FROM noun_metadata WHERE lemma_id = :id")
-            gc = conn.execute(query, {"id": lemma_id}).scalar()
+            gc = gender_classes.get(lemma_id)
             if gc != checks["gender_class"]:
                 issues.append(f"gender_class: {gc} != {checks['gender_class']}")
 
         # Check has_plural for nouns
         if "has_plural" in checks:
-            query = text("""
-                SELECT COUNT(*) FROM noun_forms
-                WHERE lemma_id = :id AND number = 'plural'
-            """)
-            count = conn.execute(query, {"id": lemma_id}).scalar() or 0
-            has_plural = count > 0
+            has_plural = bool(has_plurals.get(lemma_id))
             if has_plural != checks["has_plural"]:
                 issues.append(f"has_plural: {has_plural} != {checks['has_plural']}")
 
         # Check inflection_class for adjectives
         if "inflection_class" in checks:
-            query = text("SELECT inflection_class FROM adjective_metadata WHERE lemma_id = :id")
-            ic = conn.execute(query, {"id": lemma_id}).scalar()
+            ic = inflection_classes.get(lemma_id)
             if ic != checks["inflection_class"]:
                 issues.append(f"inflection_class: {ic} != {checks['inflection_class']}")
 
@@ -623,25 +621,20 @@ def collect_metrics(conn: Connection) -> dict[str, Any]:
     """Collect informational metrics about the database."""
     metrics: dict[str, Any] = {}
 
-    # Average forms per lemma by POS - use separate static queries
+    # Average forms per lemma by POS (total forms / lemmas with forms, the same
+    # value as averaging per-lemma counts without a GROUP BY subquery)
     avg_verb_query = text("""
-        SELECT AVG(cnt) FROM (
-            SELECT COUNT(*) as cnt FROM verb_forms GROUP BY lemma_id
-        )
+        SELECT CAST(COUNT(*) AS FLOAT) / COUNT(DISTINCT lemma_id) FROM verb_forms
     """)
     metrics["avg_verb_forms"] = round(conn.execute(avg_verb_query).scalar() or 0, 1)
 
     avg_noun_query = text("""
-        SELECT AVG(cnt) FROM (
-            SELECT COUNT(*) as cnt FROM noun_forms GROUP BY lemma_id
-        )
+        SELECT CAST(COUNT(*) AS FLOAT) / COUNT(DISTINCT lemma_id) FROM noun_forms
     """)
     metrics["avg_noun_forms"] = round(conn.execute(avg_noun_query).scalar() or 0, 1)
 
     avg_adj_query = text("""
-        SELECT AVG(cnt) FROM (
-            SELECT COUNT(*) as cnt FROM adjective_forms GROUP BY lemma_id
-        )
+        SELECT CAST(COUNT(*) AS FLOAT) / COUNT(DISTINCT lemma_id) FROM adjective_forms
     """)
     metrics["avg_adjective_forms"] = round(conn.execute(avg_adj_query).scalar() or 0, 1)
 
@@ -653,26 +646,29 @@ def collect_metrics(conn: Connection) -> dict[str, Any]:
     """)
     metrics["lemmas_with_ipa_pct"] = round(conn.execute(query).scalar() or 0, 1)
 
-    # % of lemmas with definitions
+    # % of lemmas with definitions (semi-join on idx_definitions_lemma)
     query = text("""
-        SELECT CAST(COUNT(DISTINCT d.lemma_id) AS FLOAT) * 100 /
+        SELECT CAST(COUNT(*) AS FLOAT) * 100 /
                (SELECT COUNT(*) FROM lemmas)
-        FROM definitions d
+        FROM lemmas l
+        WHERE EXISTS (SELECT 1 FROM definitions d WHERE d.lemma_id = l.id)
     """)
     metrics["lemmas_with_definitions_pct"] = round(conn.execute(query).scalar() or 0, 1)
 
-    # % of nouns with both singular and plural
+    # % of nouns with both singular and plural (two EXISTS probes per lemma via
+    # uq_noun_forms_entry, which leads with lemma_id, instead of aggregating all forms)
     query = text("""
         SELECT CAST(COUNT(*) AS FLOAT) * 100 / (SELECT COUNT(*) FROM noun_metadata)
-        FROM (
-            SELECT nm.lemma_id
-            FROM noun_metadata nm
-            JOIN noun_forms nf ON nm.lemma_id = nf.lemma_id
-            WHERE nm.number_class = 'variable'
-            GROUP BY nm.lemma_id
-            HAVING SUM(CASE WHEN nf.number = 'singular' THEN 1 ELSE 0 END) > 0
-               AND SUM(CASE WHEN nf.number = 'plural' THEN 1 ELSE 0 END) > 0
-        )
+        FROM noun_metadata nm
+        WHERE nm.number_class = 'variable'
+          AND EXISTS (
+              SELECT 1 FROM noun_forms nf
+              WHERE nf.lemma_id = nm.lemma_id AND nf.number = 'singular'
+          )
+          AND EXISTS (
+              SELECT 1 FROM noun_forms nf
+              WHERE nf.lemma_id = nm.lemma_id AND nf.number = 'plural'
+          )
     """)
     metrics["nouns_with_sg_and_pl_pct"] = round(conn.execute(query).scalar() or 0, 1)
 
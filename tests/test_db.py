@@ -52,6 +52,23 @@ class TestConnection:
         finally:
             db_path.unlink()
 
+    def test_bulk_import_pragmas_scoped_to_block(self) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            db_path = Path(f.name)
+
+        try:
+            # synchronous: 2 = FULL (SQLite default), 1 = NORMAL
+            with get_connection(db_path, bulk_import=True) as conn:
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+                assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+            # The pooled connection is handed out again with the defaults restored
+            with get_connection(db_path) as conn:
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 2
+                assert conn.execute(text("PRAGMA cache_size")).scalar() == -2000
+        finally:
+            db_path.unlink()
+
 
 class TestSchema:
     """Tests for database schema initialization."""
@@ -35,6 +35,14 @@ class TestNormalize:
         assert normalize("così") == "cosi"
         assert normalize("perciò") == "percio"
 
+    def test_strips_non_italian_diacritics(self) -> None:
+        # Loanword diacritics outside the Italian vowel set still normalize
+        assert normalize("garçonnière") == "garconniere"
+        assert normalize("föhn") == "fohn"
+        assert normalize("Città") == "citta"
+        # Decomposed input (base letter + combining accent)
+        assert normalize("citta\u0300") == "citta"
+
 
 class TestTokenize:
     """Tests for the tokenize function."""
@@ -67,6 +75,15 @@ class TestTokenize:
         assert tokenize("'ciao'") == ["ciao"]
         assert tokenize("'test") == ["test"]
 
+    def test_numeric_symbols_are_separators(self) -> None:
+        # Superscripts, fractions and Roman numerals are not letters (isalpha)
+        assert tokenize("10 m² di ½ kg") == ["m", "di", "kg"]
+        assert tokenize("capitoloⅣbis") == ["capitolo", "bis"]
+
+    def test_combining_marks_are_separators(self) -> None:
+        # Decomposed accents are not letters either, matching str.isalpha()
+        assert tokenize("perche\u0301") == ["perche"]
+
 
 class TestDeriveWrittenFromStressed:
     """Tests for derive_written_from_stressed function."""
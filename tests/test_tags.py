@@ -1,5 +1,9 @@
 """Tests for tag parsing functions."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from italian_db.tags import parse_verb_tags, should_filter_form
 
 
@@ -180,3 +184,11 @@ class TestParseVerbTagsBasic:
         result = parse_verb_tags(tags)
         assert result.mood == "subjunctive"
         assert result.tense == "imperfect"
+
+    def test_cached_result_is_immutable(self) -> None:
+        """Test that cached results can't be mutated by one caller for all others."""
+        tags = ["indicative", "present", "first-person", "singular"]
+        result = parse_verb_tags(tags)
+        assert parse_verb_tags(list(reversed(tags))) is result
+        with pytest.raises(FrozenInstanceError):
+            result.should_filter = True  # type: ignore[misc]
@@ -15,6 +15,7 @@ from italian_db.verify import (
     check_metadata_row_existence,
     check_number_class_consistency,
     check_orphaned_frequencies,
+    check_orphaned_translations,
     verify_database,
 )
 
@@ -123,6 +124,39 @@ class TestIntegrityChecks:
             result = check_orphaned_frequencies(conn)
             assert result.passed
 
+    def test_orphaned_translations(self, temp_db: Path) -> None:
+        """Test orphaned translations check."""
+        with get_connection(temp_db) as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO sentences (sentence_id, lang, text)
+                    VALUES (1, 'ita', 'Ciao.'), (2, 'eng', 'Hello.')
+                """)
+            )
+            conn.execute(
+                text("INSERT INTO translations (ita_sentence_id, eng_sentence_id) VALUES (1, 2)")
+            )
+
+            result = check_orphaned_translations(conn)
+            assert result.passed
+
+    def test_orphaned_translations_dangling_reference(self, temp_db: Path) -> None:
+        """Test orphaned translations check reports the dangling column and id."""
+        with get_connection(temp_db) as conn:
+            # Must run before the transaction starts; lets the dangling row in
+            conn.execute(text("PRAGMA foreign_keys=OFF"))
+            conn.execute(
+                text("INSERT INTO sentences (sentence_id, lang, text) VALUES (1, 'ita', 'Ciao.')")
+            )
+            conn.execute(
+                text("INSERT INTO translations (ita_sentence_id, eng_sentence_id) VALUES (1, 99)")
+            )
+
+            result = check_orphaned_translations(conn)
+            assert not result.passed
+            assert result.message == "Orphaned translations: 1 records without sentences"
+            assert result.details == ["eng_sentence_id=99"]
+
 
 class TestConsistencyChecks:
     """Tests for consistency check functions."""
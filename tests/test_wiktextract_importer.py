@@ -2071,6 +2071,56 @@ class TestNounClassification:
             db_path.unlink()
             jsonl_path.unlink()
 
+    def test_definitions_linked_to_meaning_dependent_plurals(self) -> None:
+        """Test that senses are linked to plurals via topic markers and gloss phrases."""
+        sample_braccio: dict[str, Any] = {
+            "pos": "noun",
+            "word": "braccio",
+            "head_templates": [
+                {"args": {"1": "m", "2": "braccia<g:f><q:anatomical>,bracci<g:m><q:figurative>"}}
+            ],
+            "categories": ["Italian masculine nouns", "Italian lemmas"],
+            "forms": [
+                {"form": "braccia", "tags": ["feminine", "plural"]},
+                {"form": "bracci", "tags": ["masculine", "plural"]},
+            ],
+            "senses": [
+                {"glosses": ["arm"], "raw_glosses": ["(anatomy) arm"]},
+                {"glosses": ["arm (of a chair)"], "raw_glosses": ["(mechanics) arm (of a chair)"]},
+                {"glosses": ["fathom"], "raw_glosses": ["fathom"]},
+                {"glosses": ["embrace"], "raw_glosses": ["embrace"]},
+            ],
+        }
+
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as db_file:
+            db_path = Path(db_file.name)
+
+        jsonl_path = _create_test_jsonl([sample_braccio])
+
+        try:
+            engine = get_engine(db_path)
+            init_db(engine)
+
+            with get_connection(db_path) as conn:
+                import_wiktextract(conn, jsonl_path, pos_filter=POS.NOUN)
+
+            with get_connection(db_path) as conn:
+                rows = conn.execute(
+                    select(definitions.c.gloss, definitions.c.form_meaning_hint)
+                ).fetchall()
+                hints = {(row.gloss, row.form_meaning_hint) for row in rows}
+
+            assert hints == {
+                ("arm", "braccia"),
+                ("arm (of a chair)", "bracci"),
+                ("fathom", "braccia"),
+                ("embrace", None),
+            }
+
+        finally:
+            db_path.unlink()
+            jsonl_path.unlink()
+
 
 class TestImportAdjAllomorphs:
     """Tests for import_adjective_allomorphs function."""